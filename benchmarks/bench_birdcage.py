@@ -0,0 +1,88 @@
+"""
+Benchmark birdcage coil generation.
+
+Compare the fused coil engine used by ``mrtwin.sensmap`` and ``mrtwin.b1field``
+with the dense NumPy implementation it replaces, in terms of run time
+and peak traced memory.
+
+Usage::
+
+    python benchmarks/bench_birdcage.py --shape 16 128 128 128
+
+"""
+
+import argparse
+import math
+import time
+import tracemalloc
+
+import numpy as np
+
+from mrtwin._fieldmap._birdcage import _birdcage
+
+
+def _birdcage_dense(shape, coil_width, nrings, shift, dphi):
+    # reference implementation (full-size mgrid and float64/complex128 temporaries)
+    c_width = coil_width * min(shape[-2:])
+    c_rad = 0.5 * c_width
+
+    nc, nz, ny, nx = shape
+    phi = np.arange(nc) * (2 * math.pi / (nc + nrings)) + dphi
+    z, y, x = np.mgrid[:nz, :ny, :nx]
+
+    x0 = c_rad * np.cos(phi) + shape[-1] / 2.0 + shift[-1]
+    y0 = c_rad * np.sin(phi) + shape[-2] / 2.0 + shift[-2]
+    z0 = (
+        np.floor(np.arange(nc) / nrings)
+        - 0.5 * (np.ceil(np.arange(nc) / nrings) - 1)
+        + shape[-3] / 2.0
+        + shift[-3]
+    )
+
+    x_co = x[None, ...] - x0[:, None, None, None]
+    y_co = y[None, ...] - y0[:, None, None, None]
+    z_co = z[None, ...] - z0[:, None, None, None]
+
+    rr = np.sqrt(x_co**2 + y_co**2 + z_co**2) / (2 * c_width)
+    phi = np.arctan2(x_co, -y_co) - phi[:, None, None, None]
+
+    rr[rr == 0.0] = 1.0
+    smap = (1.0 / rr) * np.exp(1j * phi)
+
+    return smap.astype(np.complex64)
+
+
+def _profile(func, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    out = func(*args)
+    elapsed = time.perf_counter() - t0
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, elapsed, peak / 2**20
+
+
+def main():  # noqa
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shape", type=int, nargs=4, default=[16, 128, 128, 128])
+    args = parser.parse_args()
+
+    shape = tuple(args.shape)
+    params = (shape, 2.0, max(shape[0] // 4, 1), [0.0, 0.0, 0.0], 0.0)
+    output_size = np.prod(shape) * np.dtype(np.complex64).itemsize / 2**20
+
+    # warm-up (JIT compilation)
+    _birdcage((2, 2, 4, 4), *params[1:])
+
+    ref, ref_time, ref_peak = _profile(_birdcage_dense, *params)
+    out, new_time, new_peak = _profile(_birdcage, *params)
+    error = np.abs(out - ref).max() / np.abs(ref).max()
+
+    print(f"shape: {shape} (output: {output_size:.1f} MB)")
+    print(f"dense : {ref_time:8.3f} s, peak {ref_peak:10.1f} MB")
+    print(f"fused : {new_time:8.3f} s, peak {new_peak:10.1f} MB")
+    print(f"speed-up: {ref_time / new_time:.1f}x, max relative error: {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
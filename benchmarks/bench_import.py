@@ -0,0 +1,78 @@
+"""
+Benchmark mrtwin cold-start (import) latency.
+
+Each statement is timed in a fresh interpreter, as in a short-lived worker
+process, and the heavy third-party modules loaded by it are reported.
+
+Usage::
+
+    python benchmarks/bench_import.py --repeats 5
+
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+STATEMENTS = [
+    "import mrtwin",
+    "from mrtwin import b0field",
+    "from mrtwin import b1field",
+    "from mrtwin import rigid_motion",
+    "from mrtwin import continuous_motion",
+    "from mrtwin import shepplogan_phantom",
+    "from mrtwin import brainweb_phantom",
+    "from mrtwin import osf_phantom",
+]
+
+HEAVY_MODULES = [
+    "numpy",
+    "numba",
+    "scipy.ndimage",
+    "scipy.signal",
+    "brainweb_dl",
+    "requests",
+    "tqdm",
+    "nibabel",
+    "osfclient",
+]
+
+SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+print(json.dumps([elapsed, [m for m in {modules!r} if m in sys.modules]]))
+"""
+
+
+def _cold_start(statement):
+    script = SCRIPT.format(statement=statement, modules=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def main():  # noqa
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    # populate OS file cache
+    _cold_start("import mrtwin")
+
+    for statement in STATEMENTS:
+        elapsed = []
+        for _ in range(args.repeats):
+            value, modules = _cold_start(statement)
+            elapsed.append(value)
+        print(f"{statement:40s}: {1e3 * np.median(elapsed):8.1f} ms (median)")
+        print(f"{'':40s}  loads: {', '.join(modules) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,27 +2,80 @@
 
 __all__ = []
 
-from ._brainweb import brainweb_phantom  # noqa
-from ._osf import osf_phantom  # noqa
-from ._shepplogan import shepplogan_phantom  # noqa
+from typing import TYPE_CHECKING
 
-from ._fieldmap import b0field  # noqa
-from ._fieldmap import b1field  # noqa
-from ._fieldmap import sensmap  # noqa
+from ._lazy import lazy_attributes
 
-from ._misc import rigid_motion  # noqa
-from ._misc import generate_girf  # noqa
+if TYPE_CHECKING:
+    from ._brainweb import brainweb_phantom  # noqa
+    from ._osf import osf_phantom  # noqa
+    from ._shepplogan import shepplogan_phantom  # noqa
+    from ._shepplogan import shepplogan_kspace  # noqa
+
+    from ._fieldmap import b0field  # noqa
+    from ._fieldmap import b1field  # noqa
+    from ._fieldmap import sensmap  # noqa
+    from ._fieldmap import field_ensemble  # noqa
+
+    from ._misc import rigid_motion  # noqa
+    from ._misc import continuous_motion  # noqa
+    from ._misc import apply_motion  # noqa
+    from ._misc import kspace_motion  # noqa
+    from ._misc import generate_girf  # noqa
+    from ._misc import apply_girf  # noqa
+    from ._misc import stream_girf  # noqa
+    from ._misc import predict_trajectory  # noqa
+
+    from ._utils import set_fft_backend  # noqa
+    from ._warmup import warmup  # noqa
+
+# routines are imported on first access (see _lazy.py)
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "brainweb_phantom": "._brainweb",
+        "osf_phantom": "._osf",
+        "shepplogan_phantom": "._shepplogan",
+        "shepplogan_kspace": "._shepplogan",
+        "b0field": "._fieldmap",
+        "b1field": "._fieldmap",
+        "sensmap": "._fieldmap",
+        "field_ensemble": "._fieldmap",
+        "rigid_motion": "._misc",
+        "continuous_motion": "._misc",
+        "apply_motion": "._misc",
+        "kspace_motion": "._misc",
+        "generate_girf": "._misc",
+        "apply_girf": "._misc",
+        "stream_girf": "._misc",
+        "predict_trajectory": "._misc",
+        "set_fft_backend": "._utils",
+        "warmup": "._warmup",
+    },
+)
 
 # Phantoms
 __all__.append("brainweb_phantom")
 __all__.append("osf_phantom")
 __all__.append("shepplogan_phantom")
+__all__.append("shepplogan_kspace")
 
 # Fields
 __all__.append("b0field")
 __all__.append("b1field")
 __all__.append("sensmap")
+__all__.append("field_ensemble")
 
 # Miscellaneous
 __all__.append("rigid_motion")
+__all__.append("continuous_motion")
+__all__.append("apply_motion")
+__all__.append("kspace_motion")
 __all__.append("generate_girf")
+__all__.append("apply_girf")
+__all__.append("stream_girf")
+__all__.append("predict_trajectory")
+
+# Utilities
+__all__.append("set_fft_backend")
+__all__.append("warmup")
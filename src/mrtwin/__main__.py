@@ -0,0 +1,6 @@
+"""Allow running MR-Twin command line interface as ``python -m mrtwin``."""
+
+from ._cli import main
+
+if __name__ == "__main__":
+    main()
@@ -43,6 +43,7 @@ def brainweb_phantom(
     brainweb_dir: CacheDirType = None,
     force: bool = False,
     verify: bool = True,
+    mmap: bool = False,
 ) -> PhantomType:
     """
     Get BrainWeb phantom.
@@ -94,6 +95,13 @@ def brainweb_phantom(
         Enable SSL verification.
         DO NOT DISABLE (i.e., ``verify=False``) IN PRODUCTION.
         The default is ``True``.
+    mmap : bool, optional
+        If ``True``, memory-map the cached segmentation instead of
+        loading it in memory. Numeric phantoms (``segtype=False``) keep
+        the segmentation and evaluate tissue property maps on access.
+        Requires ``cache=True`` (or an existing cache file), otherwise
+        a warning is raised and the segmentation is loaded in memory.
+        The default is ``False``.
 
     Returns
     -------
@@ -124,6 +132,14 @@ def brainweb_phantom(
     >>> ax[1].axis("off"), ax[1].set_title("T2 [ms]")
     >>> fig.colorbar(im, ax=ax[1], fraction=0.046, pad=0.04)
 
+    Large 3D phantoms can be streamed slice-by-slice without materializing
+    the dense numeric phantom, by memory-mapping the cached segmentation
+    and converting one slice at a time (optionally prefetching on a background thread):
+
+    >>> phantom = brainweb_phantom(ndim=3, subject=4, mmap=True)
+    >>> for slice in phantom.iter_slices(axis=0, prefetch=2):
+    ...     T1, T2 = slice["T1"], slice["T2"]
+
     """
     # check validity
     assert model in VALID_MODELS, ValueError(f"model must be one of {VALID_MODELS}")
@@ -143,6 +159,7 @@ def brainweb_phantom(
         "brainweb_dir": brainweb_dir,
         "force": force,
         "verify": verify,
+        "mmap": mmap,
     }
     if model == "single-pool":
         if segtype == "fuzzy":
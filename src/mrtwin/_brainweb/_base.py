@@ -3,6 +3,7 @@
 __all__ = ["BrainwebPhantom"]
 
 import os
+import warnings
 import numpy as np
 
 from typing import Sequence
@@ -29,6 +30,7 @@ class BrainwebPhantom(PhantomMixin):
         brainweb_dir: CacheDirType = None,
         force: bool = False,
         verify: bool = True,
+        mmap: bool = False,
     ):
         # keep dim
         self._ndim = ndim
@@ -51,12 +53,22 @@ class BrainwebPhantom(PhantomMixin):
             brainweb_dir,
             force,
             verify,
+            mmap,
         )
 
         # cache the result
         if cache:
             self.cache(file_path, self.segmentation)
 
+        # replace in-memory segmentation with its memory-mapped cached copy
+        if cache and mmap and not isinstance(self.segmentation, np.memmap):
+            self.segmentation = np.load(file_path, mmap_mode="r")
+        if mmap and not isinstance(self.segmentation, np.memmap):
+            warnings.warn(
+                "mmap=True requires cache=True (or an existing cache file) -"
+                " segmentation loaded in memory."
+            )
+
     def _default_prescription(
         self,
         ndim: int,
@@ -161,6 +173,7 @@ class BrainwebPhantom(PhantomMixin):
         brainweb_dir: CacheDirType,
         force: bool,
         verify: bool,
+        mmap: bool = False,
     ):
         """
         Get fuzzy BrainWeb tissue segmentation.
@@ -191,6 +204,9 @@ class BrainwebPhantom(PhantomMixin):
         verify : bool
             Enable SSL verification.
             DO NOT DISABLE (i.e., verify=False)IN PRODUCTION.
+        mmap : bool, optional
+            If True, memory-map the cached segmentation instead of loading it.
+            The default is False.
 
         Returns
         -------
@@ -208,7 +224,7 @@ class BrainwebPhantom(PhantomMixin):
 
         # try to load
         if os.path.exists(file_path) and not (force):
-            return np.load(file_path), file_path
+            return np.load(file_path, mmap_mode="r" if mmap else None), file_path
         else:
             segmentation = get_brainweb_segmentation(
                 ndim, subject, shape, output_res, brainweb_dir, force, verify
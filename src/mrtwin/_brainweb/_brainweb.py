@@ -30,6 +30,7 @@ class FuzzyBrainwebPhantom(BrainwebPhantom, FuzzyPhantomMixin):
         brainweb_dir: CacheDirType = None,
         force: bool = False,
         verify: bool = True,
+        mmap: bool = False,
     ):
 
         # initialize segmentation
@@ -43,6 +44,7 @@ class FuzzyBrainwebPhantom(BrainwebPhantom, FuzzyPhantomMixin):
             brainweb_dir,
             force,
             verify,
+            mmap,
         )
 
         # initialize model
@@ -137,6 +139,7 @@ class NumericBrainwebPhantom(CrispBrainwebPhantom):
         brainweb_dir: CacheDirType = None,
         force: bool = False,
         verify: bool = True,
+        mmap: bool = False,
     ):
 
         super().__init__(
@@ -150,6 +153,7 @@ class NumericBrainwebPhantom(CrispBrainwebPhantom):
             brainweb_dir,
             force,
             verify,
+            mmap,
         )
 
         self.as_numeric(copy=False)
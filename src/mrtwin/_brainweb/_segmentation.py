@@ -18,10 +18,6 @@ from typing import Sequence
 
 import numpy as np
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    import brainweb_dl
-
 from pathlib import Path
 
 from numpy.typing import DTypeLike
@@ -30,12 +26,20 @@ with warnings.catch_warnings():
     warnings.simplefilter("ignore")
     from tqdm.auto import tqdm
 
-from brainweb_dl._brainweb import (
-    BASE_URL,
-    SUB_ID,
-    STD_RES_SHAPE,
-    load_array,
-)
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore")
+    from brainweb_dl._brainweb import (
+        BASE_URL,
+        BIG_RES_SHAPE,
+        SUB_ID,
+        STD_RES_SHAPE,
+        BrainWebTissueMap,
+        _load_tissue_map,
+        _request_get_brainweb_affine,
+        get_brainweb_dir,
+        load_array,
+        save_array,
+    )
 
 from .. import _prescription
 
@@ -80,7 +84,7 @@ def _request_get_brainweb(
     path = Path(path)
     # don't download if it cached.
     if path.exists() and not force:
-        return load_array(path)
+        return load_array(path)[0]
     d = requests.get(
         _get_url(BASE_URL, download_command),
         stream=True,
@@ -133,9 +137,6 @@ def _get_url(BASE_URL, download_command):
     return URL
 
 
-# Monkey patch
-brainweb_dl._brainweb._request_get_brainweb = _request_get_brainweb
-
 # Actual functions
 logger = logging.getLogger("brainweb_dl")
 
@@ -208,21 +209,8 @@ def get_brainweb_segmentation(
     orig_res = 0.5 * np.ones(ndim)
 
     # get data
-    if verify is False:
-        with ssl_verification(verify=verify):
-            data = brainweb_dl.get_mri(
-                subject,
-                "fuzzy",
-                brainweb_dir=brainweb_dir,
-                force=force,
-            )
-    else:
-        data = brainweb_dl.get_mri(
-            subject,
-            "fuzzy",
-            brainweb_dir=brainweb_dir,
-            force=force,
-        )
+    with ssl_verification(verify=verify):
+        data = _get_brainweb20_fuzzy(subject, brainweb_dir, force)
 
     # put tissue classes as leading axis
     data = data.transpose(-1, 0, 1, 2)
@@ -256,3 +244,28 @@ def get_brainweb_segmentation(
     data = np.nan_to_num(data, posinf=0.0, neginf=0.0)
 
     return data.astype(np.float32)
+
+
+# %% local utils
+def _get_brainweb20_fuzzy(subject, brainweb_dir, force):
+    # fuzzy segmentation of a BrainWeb-20 subject, of shape (*BIG_RES_SHAPE, nclasses);
+    # mirrors brainweb_dl.get_mri(subject, "fuzzy") and shares its on-disk cache,
+    # but downloads through the local _request_get_brainweb
+    brainweb_dir = get_brainweb_dir(brainweb_dir)
+    path = brainweb_dir / f"brainweb_s{subject:02d}_fuzzy.nii.gz"
+    if path.exists() and not force:
+        data = load_array(path)[0]
+    else:
+        tissue_map = _load_tissue_map(BrainWebTissueMap.v2)
+        data = np.zeros((*BIG_RES_SHAPE, len(tissue_map)), dtype=np.uint16)
+        for n, tissue in enumerate(
+            tqdm(tissue_map, desc="Downloading tissues", position=1, leave=False)
+        ):
+            name = f"subject{subject:02d}_{tissue['ID']}"
+            data[..., n] = _request_get_brainweb(
+                name, brainweb_dir / name, force, dtype=np.uint16, shape=BIG_RES_SHAPE
+            )
+        affine = _request_get_brainweb_affine(f"subject{subject:02d}_fuzzy")
+        save_array(data, affine, path)
+
+    return data.astype(np.float32) / 4095
@@ -4,10 +4,13 @@ __all__ = ["PhantomMixin", "CrispPhantomMixin", "FuzzyPhantomMixin"]
 
 import os
 
+from collections.abc import Mapping
 from copy import deepcopy
 
 import numpy as np
 
+from . import _utils
+
 
 class PhantomMixin:
     """Base phantom mixin."""
@@ -27,6 +30,80 @@ class PhantomMixin:
         if os.path.exists(file_path) is False:
             np.save(file_path, array)
 
+    def iter_slices(self, axis: int = 0, prefetch: int = 0):
+        """
+        Iterate over the phantom slices.
+
+        Each slice is returned as a dense numeric phantom, i.e., a dictionary
+        of tissue property maps. Only the current slice of the underlying
+        segmentation is read and converted, so that memory usage does not depend
+        on the number of slices when the phantom is memory-mapped (``mmap=True``).
+
+        Parameters
+        ----------
+        axis : int, optional
+            Spatial axis along which slices are extracted.
+            The default is ``0`` (i.e., ``z`` for 3D phantoms).
+        prefetch : int, optional
+            Number of slices prepared in advance on a background thread.
+            The default is ``0`` (no prefetching).
+
+        Returns
+        -------
+        Iterator[dict]
+            Iterator over the slices. Each slice is a dictionary
+            of tissue property maps of shape ``(*shape[:axis], *shape[axis+1:])``.
+
+        """
+        axis = axis % self._ndim
+        nslices = self._spatial_shape[axis]
+        slices = (self.get_slice(idx, axis) for idx in range(nslices))
+        return _utils.prefetch(slices, prefetch)
+
+    def get_slice(self, idx: int, axis: int = 0):
+        """
+        Get a single phantom slice as dense tissue property maps.
+
+        Parameters
+        ----------
+        idx : int
+            Slice index.
+        axis : int, optional
+            Spatial axis along which slice is extracted.
+            The default is ``0``.
+
+        Returns
+        -------
+        dict
+            Tissue property maps for the selected slice.
+
+        """
+        segmentation = getattr(self, "segmentation", None)
+
+        # per-class properties of numeric phantoms built on access
+        properties = getattr(self._properties, "tissue_properties", self._properties)
+        is_dense = np.ndim(list(properties.values())[0]) >= self._ndim
+
+        # dense phantom
+        if segmentation is None or is_dense:
+            return {
+                param: _take(value, idx, axis, self._ndim)
+                for param, value in properties.items()
+            }
+
+        # crisp or fuzzy phantom
+        segmentation = _take(segmentation, idx, axis, self._ndim)
+        if segmentation.ndim != self._ndim - 1:
+            segmentation = _fuzzy_to_crisp(segmentation)
+
+        return _crisp_to_numeric(segmentation, self._label, properties)
+
+    @property
+    def _spatial_shape(self):
+        if getattr(self, "segmentation", None) is not None:
+            return self.segmentation.shape[-self._ndim :]
+        return np.shape(list(self._properties.values())[0])[-self._ndim :]
+
 
 class CrispPhantomMixin(PhantomMixin):
     """Crisp phantom mixin."""
@@ -50,13 +127,17 @@ class CrispPhantomMixin(PhantomMixin):
             out = deepcopy(self)
         else:
             out = self
-        for param in out._properties.keys():
-            param_map = np.zeros(out.segmentation.shape, dtype=np.float32)
-            for idx in range(len(out._properties[param])):
-                param_map += out._properties[param][idx] * (
-                    out.segmentation == out._label[idx]
-                )
-            out._properties[param] = param_map
+
+        # memory-mapped segmentation: build tissue maps on access
+        if isinstance(out.segmentation, np.memmap):
+            out._properties = _NumericProperties(
+                out.segmentation, out._label, out._properties, out._ndim
+            )
+            return out
+
+        out._properties = _crisp_to_numeric(
+            out.segmentation, out._label, out._properties
+        )
 
         return out
 
@@ -88,6 +169,14 @@ class FuzzyPhantomMixin(PhantomMixin):
 
     def as_numeric(self, copy: bool = True):
         """Convert fuzzy phantom into numeric phantom."""
+        # memory-mapped segmentation: keep it and build tissue maps on access
+        if isinstance(self.segmentation, np.memmap):
+            out = deepcopy(self) if copy else self
+            out._properties = _NumericProperties(
+                out.segmentation, out._label, out._properties, out._ndim
+            )
+            return out
+
         if self.segmentation.ndim != self._ndim:
             out = self.as_crisp(copy)
         else:
@@ -97,13 +186,9 @@ class FuzzyPhantomMixin(PhantomMixin):
                 out = self
 
         # build tissue maps
-        for param in out._properties.keys():
-            param_map = np.zeros(out.segmentation.shape, dtype=np.float32)
-            for idx in range(len(out._properties[param])):
-                param_map += out._properties[param][idx] * (
-                    out.segmentation == out._label[idx]
-                )
-            out._properties[param] = param_map
+        out._properties = _crisp_to_numeric(
+            out.segmentation, out._label, out._properties
+        )
 
         # erase segmentation
         out.segmentation = None
@@ -131,3 +216,65 @@ def _fuzzy_to_crisp(fuzzy_segmentation: np.ndarray) -> np.ndarray:
     """
     crisp_segmentation = np.argmax(fuzzy_segmentation, axis=0)
     return crisp_segmentation.astype(int)
+
+
+def _crisp_to_numeric(
+    segmentation: np.ndarray, labels: np.ndarray, properties: dict
+) -> dict:
+    """
+    Convert crisp segmentation into dense tissue property maps.
+
+    Parameters
+    ----------
+    segmentation : np.ndarray
+        Input crisp segmentation of shape (*shape).
+    labels : np.ndarray
+        Label of each tissue class of shape (nclasses,).
+    properties : dict
+        Tissue properties, each of shape (nclasses,).
+
+    Returns
+    -------
+    dict
+        Tissue property maps, each of shape (*shape).
+
+    """
+    out = {}
+    for param in properties.keys():
+        param_map = np.zeros(segmentation.shape, dtype=np.float32)
+        for idx in range(len(properties[param])):
+            param_map += properties[param][idx] * (segmentation == labels[idx])
+        out[param] = param_map
+
+    return out
+
+
+class _NumericProperties(Mapping):
+    # tissue property maps of a (memory-mapped) crisp or fuzzy segmentation,
+    # built on access from per-class tissue properties
+
+    def __init__(self, segmentation, labels, tissue_properties, ndim):
+        self.segmentation = segmentation
+        self.labels = labels
+        self.tissue_properties = tissue_properties
+        self.ndim = ndim
+
+    def __getitem__(self, key):
+        properties = {key: self.tissue_properties[key]}
+        segmentation = self.segmentation
+        if segmentation.ndim != self.ndim:
+            segmentation = _fuzzy_to_crisp(segmentation)
+        return _crisp_to_numeric(segmentation, self.labels, properties)[key]
+
+    def __iter__(self):
+        return iter(self.tissue_properties)
+
+    def __len__(self):
+        return len(self.tissue_properties)
+
+
+def _take(array: np.ndarray, idx: int, axis: int, ndim: int) -> np.ndarray:
+    # select a slice along a spatial axis, leaving leading (e.g., class) axes untouched
+    index = [slice(None)] * array.ndim
+    index[array.ndim - ndim + axis] = idx
+    return np.asarray(array[tuple(index)])
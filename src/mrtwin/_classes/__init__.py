@@ -2,6 +2,7 @@
 
 __all__ = ["tissue_map", "get_t1", "get_t2star"]
 
+import csv
 import os
 import sys
 
@@ -14,8 +15,6 @@ else:
 
 from pathlib import Path
 
-from brainweb_dl._brainweb import _load_tissue_map
-
 BUILT_IN_MAPS = ["single-pool", "mt-model", "mw-model", "mwmt-model"]
 
 
@@ -247,3 +246,9 @@ def extrapolate_t2star(
     R2s_end = R2 + R2p_end
     T2s_end = 1 / (R2s_end + 1e-9)
     return T2s_end
+
+
+# %% local utils
+def _load_tissue_map(path: str | os.PathLike) -> list[dict]:
+    with open(path) as csvfile:
+        return list(csv.DictReader(csvfile))
@@ -0,0 +1,60 @@
+"""MR-Twin command line interface."""
+
+__all__ = ["main"]
+
+import argparse
+
+from typing import Sequence
+
+
+def main(argv: Sequence[str] | None = None):
+    """
+    Run MR-Twin command line interface.
+
+    Parameters
+    ----------
+    argv : Sequence[str] | None, optional
+        Command line arguments. The default is ``None`` (use ``sys.argv``).
+
+    Example
+    -------
+    Precompile all the numba kernels into a shared cache directory:
+
+    .. code-block:: bash
+
+        mrtwin warmup --cache-dir /shared/numba-cache
+
+    """
+    parser = argparse.ArgumentParser(prog="mrtwin")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # warmup
+    from ._warmup import WARMUP
+
+    warmup_parser = commands.add_parser(
+        "warmup", help="Precompile numba kernels and populate their on-disk cache."
+    )
+    warmup_parser.add_argument(
+        "routines",
+        nargs="*",
+        help=f"Routines to be warmed up, among {list(WARMUP)} (default: all).",
+    )
+    warmup_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Kernels cache directory (default: NUMBA_CACHE_DIR or package cache).",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "warmup":
+        from ._warmup import warmup
+
+        invalid = set(args.routines) - set(WARMUP)
+        if invalid:
+            parser.error(
+                f"invalid routines {sorted(invalid)} - must be in {list(WARMUP)}"
+            )
+
+        elapsed = warmup(args.routines or None, args.cache_dir)
+        for routine, value in elapsed.items():
+            print(f"{routine:20s}: {value:8.3f} s")
@@ -2,10 +2,30 @@
 
 __all__ = []
 
-from ._b0_map import b0field  # noqa
-from ._b1_map import b1field  # noqa
-from ._sens_map import sensmap  # noqa
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from ._b0_map import b0field  # noqa
+    from ._b1_map import b1field  # noqa
+    from ._sens_map import sensmap  # noqa
+    from ._basis import FieldBasis  # noqa
+    from ._ensemble import field_ensemble  # noqa
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "b0field": "._b0_map",
+        "b1field": "._b1_map",
+        "sensmap": "._sens_map",
+        "FieldBasis": "._basis",
+        "field_ensemble": "._ensemble",
+    },
+)
 
 __all__.append("b0field")
 __all__.append("b1field")
 __all__.append("sensmap")
+__all__.append("FieldBasis")
+__all__.append("field_ensemble")
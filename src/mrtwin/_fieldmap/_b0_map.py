@@ -3,13 +3,18 @@
 __all__ = ["b0field"]
 
 
+import tempfile
+
+
+from functools import lru_cache
 from typing import Sequence
 
 
 import numpy as np
 
 
-from .._utils import fftc, ifftc
+from .._utils import fftn, ifftn, rfftn, irfftn, next_fast_len
+from .._utils import kspace_grid
 
 
 def b0field(
@@ -17,6 +22,11 @@ def b0field(
     b0range: Sequence[float] | None = None,
     mask: np.ndarray | None = None,
     B0: float = 1.5,
+    ndim: int | None = None,
+    B0dir: Sequence[float] | None = None,
+    pad: float = 0.0,
+    block_size: int | None = None,
+    out: np.ndarray | None = None,
 ):
     """
     Simulate inhomogeneous B0 fields.
@@ -30,9 +40,12 @@ def b0field(
     chi : np.ndarray
         Object magnetic susceptibility map in ``[ppb]`` of
         shape ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D).
+        A batch of maps of shape ``(N, ny, nx)`` (2D) or
+        ``(N, nz, ny, nx)`` (3D) can be provided together with ``ndim``.
     b0range : Sequence[float] | None, optional
         Range of B0 field in ``[Hz]``. The default is ``None``
-        (do not force a range).
+        (do not force a range). For batched inputs, each map is
+        rescaled independently.
     mask : np.ndarray, optional
         Region of support of the object of
         shape ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D).
@@ -42,12 +55,43 @@ def b0field(
         B0 scaling (assuming 1H imaging)
         if `b0range` is not provided.
         The default is `1.5`.
+    ndim : int | None, optional
+        Number of spatial dimensions. Leading axes of ``chi``
+        are treated as batch axes. The default is ``None``
+        (all axes of ``chi`` are spatial).
+    B0dir : Sequence[float] | None, optional
+        Direction of the main magnetic field, expressed in array axes order,
+        i.e., ``(by, bx)`` (2D) or ``(bz, by, bx)`` (3D). It does not need
+        to be normalized. The default is ``None`` (field along the first axis).
+    pad : float, optional
+        Zero-padding factor used to reduce circular wrap-around of the
+        dipole convolution. Each spatial axis of size ``n`` is padded to the
+        smallest FFT-friendly (5-smooth) size not smaller than ``(1 + pad) * n``.
+        ``pad=1.0`` corresponds to (approximately) linear convolution.
+        The default is ``0.0`` (circular convolution).
+    block_size : int | None, optional
+        If provided, compute the field out-of-core, processing ``block_size``
+        slices (along the first spatial axis) at a time. Intermediate spectra
+        are stored in a temporary file, so that ``chi`` (and ``out``) can be
+        memory-mapped arrays larger than the available memory.
+        The default is ``None`` (whole volume in memory).
+    out : np.ndarray | None, optional
+        Output array (e.g., a memory-mapped array) of the same shape as ``chi``.
+        Only used if ``block_size`` is provided.
+        The default is ``None`` (allocate a new array).
 
     Returns
     -------
     B0map : np.ndarray
         Spatially varying B0 maps of shape ``(ny, nx)`` (2D)
         or ``(nz, ny, nx)`` (3D) in ``[Hz]``, arising from the object susceptibility.
+        Batch axes of ``chi`` are preserved.
+
+    Notes
+    -----
+    Dipole kernels are cached for each (padded) matrix shape and field orientation,
+    so that repeated calls on the same grid only pay for the forward and inverse
+    real-to-complex FFTs, which are computed in single precision.
 
     Example
     -------
@@ -63,44 +107,178 @@ def b0field(
 
     >>> b0map = b0field(chi, b0range=(-500, 500))
 
+    Multiple susceptibility maps can be processed in a single call:
+
+    >>> import numpy as np
+    >>> chi = np.stack([chi, 0.5 * chi, 2.0 * chi], axis=0)
+    >>> b0maps = b0field(chi, ndim=2) # (3, 128, 128)
+
+    Oblique main field orientations can be specified via ``B0dir`` argument,
+    while ``pad`` argument removes wrap-around artifacts near the FOV edges:
+
+    >>> b0map = b0field(chi[0], B0dir=(1.0, 0.5), pad=1.0)
+
+    Susceptibility maps larger than memory can be processed out-of-core,
+    e.g., reading from and writing to memory-mapped ``.npy`` files:
+
+    >>> chi = np.load("chi.npy", mmap_mode="r") # doctest: +SKIP
+    >>> out = np.lib.format.open_memmap("b0.npy", "w+", np.float32, chi.shape) # doctest: +SKIP
+    >>> b0map = b0field(chi, block_size=16, out=out) # doctest: +SKIP
+
     """
-    # get input shape
-    ishape = chi.shape
+    chi = np.asanyarray(chi)
 
-    # get number of spatial dims
-    ndim = len(ishape)
+    # get spatial shape
+    if ndim is None:
+        ndim = chi.ndim
+    ishape = tuple(chi.shape[-ndim:])
+    axes = tuple(range(-ndim, 0))
+
+    # get padded shape
+    if pad > 0:
+        pshape = tuple(next_fast_len(np.ceil((1 + pad) * n)) for n in ishape)
+    else:
+        pshape = ishape
+
+    # get field direction
+    if B0dir is None:
+        B0dir = [1.0] + [0.0] * (ndim - 1)
+    B0dir = np.asarray(B0dir, dtype=np.float64)
+    assert B0dir.size == ndim, ValueError(
+        f"B0dir must be a {ndim}-length sequence - found {B0dir.size} elements."
+    )
+    B0dir = tuple((B0dir / np.linalg.norm(B0dir)).tolist())
+
+    # out-of-core computation
+    if block_size is not None:
+        assert ndim >= 2, ValueError("Out-of-core computation requires ndim >= 2.")
+        if out is None:
+            out = np.empty(chi.shape, dtype=np.float32)
+        assert out.shape == chi.shape, ValueError(
+            f"out must have the same shape as chi (={chi.shape}) - found {out.shape}."
+        )
+        for chi_n, out_n in zip(chi.reshape(-1, *ishape), out.reshape(-1, *ishape)):
+            _b0field_blockwise(
+                chi_n, out_n, pshape, B0dir, block_size, b0range, mask, B0
+            )
+        return out
 
-    # get k space coordinates
-    kgrid = [
-        np.arange(-ishape[n] // 2, ishape[n] // 2, dtype=np.float32)
-        for n in range(len(ishape))
-    ]
-    kgrid = np.meshgrid(*kgrid, indexing="ij")
-    kgrid = np.stack(kgrid, axis=-1)
+    chi = np.asarray(chi, dtype=np.float32)
 
-    knorm = (kgrid**2).sum(axis=-1) + np.finfo(np.float32).eps
-    dipole_kernel = 1 / 3 - (kgrid[..., 0] ** 2 / knorm)
+    # get dipole kernel
+    dipole_kernel = _dipole_kernel(ishape, pshape, B0dir)
 
     # apply convolution
-    B0map = ifftc(
-        dipole_kernel * fftc(chi, ax=range(-ndim, 0)), ax=range(-ndim, 0)
-    ).real
+    B0map = rfftn(chi, axes=axes, s=pshape)
+    B0map *= dipole_kernel
+    B0map = irfftn(B0map, s=pshape, axes=axes).astype(np.float32, copy=False)
+
+    # crop
+    if pshape != ishape:
+        B0map = B0map[(...,) + tuple(slice(n) for n in ishape)].copy()
 
     # rescale
     if b0range is not None:
-        B0map = B0map - B0map.min()  # (min, max) -> (0, max - min)
-        B0map = B0map / B0map.max()  # (0, max - min) -> (0, 1)
-        B0map = (
-            B0map * (b0range[1] - b0range[0]) + b0range[0]
-        )  # (0, 1) -> (b0range[0], b0range[1])
+        B0map -= B0map.min(axis=axes, keepdims=True)  # (min, max) -> (0, max - min)
+        B0map /= B0map.max(axis=axes, keepdims=True)  # (0, max - min) -> (0, 1)
+        B0map *= b0range[1] - b0range[0]
+        B0map += b0range[0]  # (0, 1) -> (b0range[0], b0range[1])
     else:
         gamma = 42.58 * 1e6  # Hz / T
         scale = gamma * B0
-        B0map = scale * B0map
+        B0map *= scale
 
     # mask
     if mask is not None:
         mask = mask != 0
-        B0map = mask * B0map
+        B0map *= mask
+
+    return B0map
+
+
+# %% local utils
+def _b0field_blockwise(chi, out, pshape, B0dir, block_size, b0range, mask, B0):
+    # the N-D FFT is split into a transform over the trailing axes (slabs along
+    # the first axis) and a transform over the first axis (blocks along the second axis),
+    # so that only one block of the spectrum is in memory at any time
+    ishape = chi.shape
+    ndim = len(ishape)
+    rshape = pshape[:-1] + (pshape[-1] // 2 + 1,)
+    axes = tuple(range(1, ndim))
+    crop = (slice(None),) + tuple(slice(n) for n in ishape[1:])
+    kgrid = _kspace_grid(ishape, pshape)
+
+    # blocks along second axis roughly matching size of a slab along first axis
+    step = max(1, block_size * rshape[1] // rshape[0])
+
+    # scaling
+    if b0range is None:
+        gamma = 42.58 * 1e6  # Hz / T
+        scale = gamma * B0
+    else:
+        scale = 1.0
+    bmin, bmax = np.inf, -np.inf
+
+    with tempfile.TemporaryFile() as file:
+        spectrum = np.memmap(file, dtype=np.complex64, mode="w+", shape=rshape)
+
+        # forward transform along trailing axes
+        for n in range(0, ishape[0], block_size):
+            stop = min(n + block_size, ishape[0])
+            slab = np.asarray(chi[n:stop], dtype=np.float32)
+            spectrum[n:stop] = rfftn(slab, axes=axes, s=pshape[1:])
+
+        # forward transform along first axis, convolution and inverse transform
+        for n in range(0, rshape[1], step):
+            block = fftn(spectrum[:, n : n + step], axes=(0,))
+            kblock = list(kgrid)
+            kblock[1] = kblock[1][:, n : n + step]
+            block *= _dipole(kblock, B0dir)
+            spectrum[:, n : n + step] = ifftn(block, axes=(0,))
+
+        # inverse transform along trailing axes
+        for n in range(0, ishape[0], block_size):
+            stop = min(n + block_size, ishape[0])
+            slab = irfftn(spectrum[n:stop], axes=axes, s=pshape[1:])
+            slab = slab[crop].astype(np.float32, copy=False)
+            slab *= scale
+            if b0range is not None:
+                bmin, bmax = min(bmin, slab.min()), max(bmax, slab.max())
+            elif mask is not None:
+                slab *= mask[n:stop] != 0
+            out[n:stop] = slab
+
+        del spectrum
+
+    # rescale and mask
+    if b0range is not None:
+        scale = (b0range[1] - b0range[0]) / (bmax - bmin)
+        for n in range(0, ishape[0], block_size):
+            stop = min(n + block_size, ishape[0])
+            slab = (np.asarray(out[n:stop]) - bmin) * scale + b0range[0]
+            if mask is not None:
+                slab *= mask[n:stop] != 0
+            out[n:stop] = slab
+
+    return out
+
+
+@lru_cache(maxsize=8)
+def _dipole_kernel(shape, pshape, B0dir):
+    dipole_kernel = _dipole(_kspace_grid(shape, pshape), B0dir)
+    dipole_kernel.flags.writeable = False
+    return dipole_kernel
+
+
+def _kspace_grid(shape, pshape):
+    # k space coordinates (non-centered, real-to-complex layout),
+    # in cycles per (unpadded) FOV, as broadcastable 1D grids
+    return kspace_grid(shape, pshape, [1.0 / n for n in shape], real=True)
+
 
-    return B0map.astype(np.float32)
+def _dipole(kgrid, B0dir):
+    # squared k-space norm, built from broadcastable 1D grids
+    knorm = sum(k**2 for k in kgrid) + np.finfo(np.float32).eps
+    kpar = sum(np.float32(b) * k for b, k in zip(B0dir, kgrid) if b != 0)
+    dipole_kernel = 1 / 3 - kpar**2 / knorm
+    return dipole_kernel.astype(np.float32, copy=False)
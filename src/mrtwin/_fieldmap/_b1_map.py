@@ -13,10 +13,11 @@ from typing import Sequence
 import numpy as np
 
 
-from .._utils import CacheDirType, get_mrtwin_dir
+from .._utils import CacheDirType, coordinate_grid, get_mrtwin_dir
 
 
-from ._birdcage import _birdcage
+from ._basis import FieldBasis
+from ._birdcage import _birdcage_geometry, _birdcage_block, _birdcage_rss
 
 
 def b1field(
@@ -31,6 +32,9 @@ def b1field(
     mask: np.ndarray | None = None,
     cache: bool | None = None,
     cache_dir: CacheDirType = None,
+    basis: str | None = None,
+    degree: int = 8,
+    modes: Sequence[int] | None = None,
 ):
     """
     Simulate inhomogeneous B1+ fields.
@@ -66,6 +70,8 @@ def b1field(
     mask : np.ndarray | None, optional
         Region of support of the object of
         shape ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D).
+        Maps are cached unmasked, and the mask is applied in-place
+        on the returned array, so that the same cache entry serves any mask.
         The default is ``None``.
     cache : bool | None, optional
         If ``True``, cache the phantom.
@@ -74,13 +80,29 @@ def b1field(
     cache_dir : CacheDirType, optional
         cache_directory for phantom caching.
         The default is ``None`` (``~/.cache/mrtwin``).
+    basis : str | None, optional
+        If provided, return a ``FieldBasis`` representation of the maps,
+        which can be evaluated at any matrix size. Valid entries are
+        ``"polynomial"`` and ``"fourier"``. ``mask`` is not applied to the
+        basis representation. The default is ``None`` (return dense maps).
+    degree : int, optional
+        Maximum basis order along each axis. Only used if ``basis``
+        is provided. The default is ``8``.
+    modes : Sequence[int] | None, optional
+        If provided, compute only the selected modes (out of ``nmodes``).
+        The magnitude range is still computed over all the ``nmodes`` modes, so that
+        the selected maps are identical to the corresponding entries of the full output.
+        The default is ``None`` (compute all the modes).
 
     Returns
     -------
-    smap : np.ndarray
+    smap : np.ndarray | FieldBasis
         Complex spatially varying b1+ maps of shape ``(nmodes, ny, nx)`` (2D)
-        or ``(nmodes, nz, ny, nx)`` (3D). Magnitude of the map represents
-        the relative flip angle scaling (wrt to the nominal).
+        or ``(nmodes, nz, ny, nx)`` (3D), with ``nmodes = len(modes)`` if ``modes``
+        is provided. Magnitude of the map represents the relative flip angle
+        scaling (wrt to the nominal). If ``nmodes == 1``, the real magnitude map of
+        shape ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D) is returned instead,
+        with or without ``modes=[0]``.
 
     Example
     -------
@@ -109,12 +131,23 @@ def b1field(
 
     >>> b1map = b1field((128, 128), nmodes=2) # b1map[0] is CP, b1map[1] is gradient mode.
 
+    A subset of the modes can be computed via ``modes`` argument, e.g.,
+    for large pTx systems:
+
+    >>> b1map = b1field((128, 128), nmodes=8, ncoils=8, modes=[0, 3]) # (2, 128, 128)
+
     Three dimensional B1+ maps of shape ``(nz, ny, nx)`` can be obtained as:
 
     >>> b1map = b1field((128, 128, 128))
 
     Beware that this will require more memory.
 
+    Smooth maps can be stored as a compact set of basis coefficients instead,
+    and evaluated at any matrix size:
+
+    >>> b1basis = b1field((128, 128, 128), coil_width=4.0, basis="polynomial", degree=8)
+    >>> b1map = b1basis((256, 256, 256))
+
     References
     ----------
     [1] https://github.com/mikgroup/sigpy/tree/main
@@ -127,6 +160,9 @@ def b1field(
         ncoils >= 2
     ), f"We support circular polarization only - found {ncoils} transmit elements."
     assert ncoils >= nmodes, f"Need ncoils (={ncoils}) to be >= nmodes (={nmodes})."
+    assert modes is None or all(0 <= n < nmodes for n in modes), ValueError(
+        f"Selected modes must be in [0, {nmodes}) - found {modes}."
+    )
 
     # Default values
     if shift is None:
@@ -148,12 +184,12 @@ def b1field(
     b1range_str = [str(value) for value in b1range]
     b1range_str = "-".join(tuple(b1range_str))
 
-    if mask is None:
-        is_masked = False
+    if modes is None:
+        modes_str = ""
     else:
-        is_masked = True
+        modes_str = "-".join(str(n) for n in modes) + "selected_"
 
-    file_name = f"b1map{shape_str}mtx_{nmodes}modes_{b1range_str}range_{coil_width}width_{ncoils}coils_{shift_str}shift_{nrings}rings_{dphi}deg_{is_masked}.npy"
+    file_name = f"b1map{shape_str}mtx_{nmodes}modes_{modes_str}{b1range_str}range_{coil_width}width_{ncoils}coils_{shift_str}shift_{nrings}rings_{dphi}deg.npy"
 
     # Get base directory
     cache_dir = get_mrtwin_dir(cache_dir)
@@ -162,17 +198,23 @@ def b1field(
     file_path = os.path.join(cache_dir, file_name)
 
     # Try to load
-    if os.path.exists(file_path):
-        return np.load(file_path)
-
-    # Generate coils
-    smap = _birdcage(
+    if basis is not None:
+        file_path = file_path.replace(".npy", f"_{basis}{degree}.npy")
+        if os.path.exists(file_path):
+            return FieldBasis(np.load(file_path), len(shape), basis)
+    elif os.path.exists(file_path):
+        return _apply_mask(np.load(file_path), mask)
+
+    # Generate coils magnitude (coil phase does not contribute to the modes)
+    coords = coordinate_grid(shape)
+    geometry = _birdcage_geometry(
         [ncoils] + list(shape), coil_width, nrings, shift, np.deg2rad(dphi)
     )
+    smap = abs(_birdcage_block(geometry, np.arange(ncoils), *coords))
 
     # Normalize
-    rss = sum(abs(smap) ** 2, 0) ** 0.5
-    smap /= rss
+    smap /= _birdcage_rss(geometry, *coords)
+    smap = smap.reshape(ncoils, -1)  # (nc, nvoxels)
 
     # Combine
     dalpha = 2 * math.pi / ncoils
@@ -180,33 +222,60 @@ def b1field(
     mode = np.arange(nmodes)
     phafu = np.exp(1j * mode[:, None] * alpha[None, :])  # (nmodes, nchannels)
 
-    # Get modes
-    smap = smap.T  # (nc, ...) -> (..., nc)
-    smap = [(abs(smap) * phafu[n]).sum(axis=-1) for n in range(nmodes)]
-    smap = np.stack(smap, axis=-1)  # (..., nmodes)
-    smap = smap.T  # (..., nmodes) -> (nmodes, ...)
+    # Get modes and magnitude range (over all the modes)
+    if modes is None:
+        smap, mag = _combine(phafu, smap)
+        bmin, bmax = mag.min(), mag.max()
+    else:
+        bmin, bmax = np.inf, -np.inf
+        for n in range(nmodes):
+            mag = _combine(phafu[[n]], smap)[1]
+            bmin, bmax = min(bmin, mag.min()), max(bmax, mag.max())
+        smap, mag = _combine(phafu[list(modes)], smap)
+    smap = smap.reshape(-1, *shape)  # (nmodes, ...)
+    mag = mag.reshape(-1, *shape)
 
     # Rescale
-    phase = smap / abs(smap)
-    smap = abs(smap)
-    smap = smap - smap.min()  # (min, max) -> (0, max - min)
-    smap = smap / smap.max()  # (0, max - min) -> (0, 1)
-    smap = (
-        smap * (b1range[1] - b1range[0]) + b1range[0]
-    )  # (0, 1) -> (b1range[0], b1range[1])
-    smap = smap * phase
-
+    np.divide(smap, mag, out=smap, where=mag > 0)  # phase
+    smap[mag == 0] = 1.0
+    scale = (b1range[1] - b1range[0]) / (bmax - bmin)
+    mag -= bmin  # (min, max) -> (0, max - min)
+    mag *= scale  # (0, max - min) -> (0, b1range[1] - b1range[0])
+    mag += b1range[0]  # (0, b1range[1] - b1range[0]) -> (b1range[0], b1range[1])
+    smap *= mag
+
+    # single mode: real magnitude (also when selected via modes)
     if nmodes == 1:
-        smap = abs(smap[0]).astype(np.float32)
-    else:
-        smap = smap.astype(np.complex64)
+        smap = mag[0]
 
-    # Mask
-    if mask is not None:
-        smap = mask * smap
+    # Basis representation
+    if basis is not None:
+        smap = FieldBasis.fit(smap, len(shape), degree, basis)
+        if cache and os.path.exists(file_path) is False:
+            np.save(file_path, smap.coeffs)
+        return smap
 
-    # Cache the result
+    # Cache the result (unmasked)
     if cache and os.path.exists(file_path) is False:
         np.save(file_path, smap)
 
+    return _apply_mask(smap, mask)
+
+
+# %% local utils
+def _apply_mask(smap, mask):
+    # in-place masking (maps are always cached unmasked)
+    if mask is not None:
+        smap *= mask
     return smap
+
+
+def _combine(phafu, smap):
+    # complex64 mode combination of (real) coil magnitudes of shape (..., nchannels, nvoxels),
+    # as real and imaginary single precision matrix products
+    out = np.empty(
+        smap.shape[:-2] + (phafu.shape[0], smap.shape[-1]), dtype=np.complex64
+    )
+    np.matmul(phafu.real.astype(np.float32), smap, out=out.real)
+    np.matmul(phafu.imag.astype(np.float32), smap, out=out.imag)
+    return out, abs(out)
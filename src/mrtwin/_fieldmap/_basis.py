@@ -0,0 +1,174 @@
+"""Basis-coefficient representation of smooth field maps."""
+
+__all__ = ["FieldBasis"]
+
+
+from typing import Sequence
+
+
+import numpy as np
+
+
+from .._utils import coordinate_grid
+
+VALID_BASES = ["polynomial", "fourier"]
+
+
+class FieldBasis:
+    """
+    Compact representation of smooth field maps.
+
+    Maps are represented as linear combinations of separable
+    (tensor-product) basis functions defined over the normalized FOV,
+    so that they can be evaluated on any matrix size.
+
+    Parameters
+    ----------
+    coeffs : np.ndarray
+        Basis coefficients of shape ``(..., degree + 1, degree + 1)`` (2D)
+        or ``(..., degree + 1, degree + 1, degree + 1)`` (3D).
+        Leading axes (e.g., channels or modes) are preserved on evaluation.
+    ndim : int
+        Number of spatial dimensions.
+    kind : str, optional
+        Basis type. Valid entries are:
+
+        * ``"polynomial"``: Legendre polynomials.
+        * ``"fourier"``: truncated Fourier (cosine) series. The map is evenly extended
+          across the FOV edges, so that no wrap-around ringing occurs.
+
+        The default is ``"polynomial"``.
+
+    Notes
+    -----
+    Normalized coordinates follow the field map generators convention, i.e., pixel
+    ``i`` of an axis of size ``n`` is located at ``x = 2 * i / n - 1``, so that
+    maps evaluated at different matrix sizes cover the same FOV.
+
+    Example
+    -------
+    >>> from mrtwin import b1field
+
+    Field maps generators can return a basis representation of the maps:
+
+    >>> b1basis = b1field((128, 128), basis="polynomial", degree=8)
+    >>> b1basis.coeffs.shape
+    (9, 9)
+
+    This can be evaluated at any matrix size:
+
+    >>> b1map = b1basis((256, 256))
+
+    Arbitrary maps can be fitted as:
+
+    >>> from mrtwin._fieldmap import FieldBasis
+    >>> b1basis = FieldBasis.fit(b1map, degree=8)
+
+    """
+
+    def __init__(self, coeffs: np.ndarray, ndim: int, kind: str = "polynomial"):
+        if kind not in VALID_BASES:
+            raise ValueError(f"Basis must be one of {VALID_BASES} - found {kind}.")
+        assert coeffs.ndim >= ndim, ValueError(
+            f"coeffs must have at least {ndim} dimensions - found {coeffs.ndim}."
+        )
+        self.coeffs = coeffs
+        self.ndim = ndim
+        self.kind = kind
+
+    @classmethod
+    def fit(
+        cls,
+        maps: np.ndarray,
+        ndim: int | None = None,
+        degree: int = 8,
+        kind: str = "polynomial",
+    ):
+        """
+        Fit basis coefficients to input maps (least squares).
+
+        Parameters
+        ----------
+        maps : np.ndarray
+            Input maps of shape ``(..., ny, nx)`` (2D) or ``(..., nz, ny, nx)`` (3D).
+        ndim : int | None, optional
+            Number of spatial dimensions. Leading axes of ``maps``
+            are treated as batch axes. The default is ``None``
+            (all axes of ``maps`` are spatial).
+        degree : int, optional
+            Maximum basis order along each axis. The default is ``8``.
+        kind : str, optional
+            Basis type (``"polynomial"`` or ``"fourier"``).
+            The default is ``"polynomial"``.
+
+        Returns
+        -------
+        FieldBasis
+            Basis representation of the input maps.
+
+        """
+        if kind not in VALID_BASES:
+            raise ValueError(f"Basis must be one of {VALID_BASES} - found {kind}.")
+        maps = np.asarray(maps)
+        if ndim is None:
+            ndim = maps.ndim
+        dtype = np.complex64 if np.iscomplexobj(maps) else np.float32
+
+        # separable least squares fit
+        mats = [np.linalg.pinv(_vander(n, degree, kind)) for n in maps.shape[-ndim:]]
+        coeffs = _separable(maps.astype(np.result_type(maps, np.float64)), mats)
+
+        return cls(coeffs.astype(dtype), ndim, kind)
+
+    @property
+    def degree(self):  # noqa
+        return self.coeffs.shape[-1] - 1
+
+    @property
+    def nbytes(self):  # noqa
+        return self.coeffs.nbytes
+
+    def __repr__(self):  # noqa
+        return f"FieldBasis(kind={self.kind}, degree={self.degree}, ndim={self.ndim}, batch={self.coeffs.shape[: -self.ndim]})"
+
+    def __call__(self, shape: Sequence[int]) -> np.ndarray:
+        """
+        Evaluate the maps on the given matrix size.
+
+        Parameters
+        ----------
+        shape : Sequence[int]
+            Matrix size ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D).
+
+        Returns
+        -------
+        np.ndarray
+            Maps of shape ``(..., ny, nx)`` (2D) or ``(..., nz, ny, nx)`` (3D).
+
+        """
+        assert len(shape) == self.ndim, ValueError(
+            f"shape must be a {self.ndim}-length sequence - found {len(shape)} elements."
+        )
+        mats = [
+            _vander(n, self.degree, self.kind).astype(np.float32, copy=False)
+            for n in shape
+        ]
+        return _separable(self.coeffs, mats)
+
+
+# %% local utils
+def _vander(n, degree, kind):
+    # basis functions sampled on the normalized grid, shape (n, degree + 1)
+    x = coordinate_grid((n,), 2.0 / n)[0] - 1.0
+    if kind == "polynomial":
+        return np.polynomial.legendre.legvander(x, degree)
+    return np.cos(0.5 * np.pi * np.arange(degree + 1) * (x[:, None] + 1.0))
+
+
+def _separable(array, mats):
+    # apply a matrix along each of the trailing axes
+    ndim = len(mats)
+    for n, mat in enumerate(mats):
+        axis = array.ndim - ndim + n
+        array = np.moveaxis(np.tensordot(mat, array, axes=([1], [axis])), 0, axis)
+    return array
@@ -1,14 +1,31 @@
 """Birdcage map generation."""
 
-__all__ = ["_birdcage"]
+__all__ = [
+    "_birdcage",
+    "_birdcage_geometry",
+    "_birdcage_stack",
+    "_birdcage_block",
+    "_birdcage_rss",
+]
 
 import math
 
 
 import numpy as np
+import numba as nb
+
+
+from .._utils import coordinate_grid
 
 
 def _birdcage(shape, coil_width, nrings, shift, dphi):  # noqa
+    geometry = _birdcage_geometry(shape, coil_width, nrings, shift, dphi)
+    coords = coordinate_grid(shape[1:])
+    smap = _birdcage_block(geometry, np.arange(shape[0]), *coords)
+    return smap.reshape(shape)
+
+
+def _birdcage_geometry(shape, coil_width, nrings, shift, dphi):  # noqa
     # default
     if shift is None:
         shift = [0.0 for ax in range(len(shape) - 1)]
@@ -22,48 +39,125 @@ def _birdcage(shape, coil_width, nrings, shift, dphi):  # noqa
     if len(shape) == 3:
         nc, ny, nx = shape
         phi = np.arange(nc) * (2 * math.pi / nc) + dphi
-        y, x = np.mgrid[:ny, :nx]
-
-        x0 = c_rad * np.cos(phi) + shape[-1] / 2.0 + shift[-1]
-        y0 = c_rad * np.sin(phi) + shape[-2] / 2.0 + shift[-2]
-
-        x_co = x[None, ...] - x0[:, None, None]
-        y_co = y[None, ...] - y0[:, None, None]
-
-        # coil magnitude
-        rr = np.sqrt(x_co**2 + y_co**2) / (2 * c_width)
-
-        # coil phase
-        phi = np.arctan2(x_co, -y_co) - phi[:, None, None]
-
+        z0 = np.zeros(nc)
     elif len(shape) == 4:
         nc, nz, ny, nx = shape
         phi = np.arange(nc) * (2 * math.pi / (nc + nrings)) + dphi
-        z, y, x = np.mgrid[:nz, :ny, :nx]
-
-        x0 = c_rad * np.cos(phi) + shape[-1] / 2.0 + shift[-1]
-        y0 = c_rad * np.sin(phi) + shape[-2] / 2.0 + shift[-2]
         z0 = (
             np.floor(np.arange(nc) / nrings)
             - 0.5 * (np.ceil(np.arange(nc) / nrings) - 1)
             + shape[-3] / 2.0
             + shift[-3]
         )
-
-        x_co = x[None, ...] - x0[:, None, None, None]
-        y_co = y[None, ...] - y0[:, None, None, None]
-        z_co = z[None, ...] - z0[:, None, None, None]
-
-        # coil magnitude
-        rr = np.sqrt(x_co**2 + y_co**2 + z_co**2) / (2 * c_width)
-
-        # coil phase
-        phi = np.arctan2(x_co, -y_co) - phi[:, None, None, None]
     else:
         raise ValueError("Can only generate shape with length 3 or 4")
 
-    # build coils
-    rr[rr == 0.0] = 1.0
-    smap = (1.0 / rr) * np.exp(1j * phi)
-
-    return smap.astype(np.complex64)
+    # coil centers
+    x0 = c_rad * np.cos(phi) + shape[-1] / 2.0 + shift[-1]
+    y0 = c_rad * np.sin(phi) + shape[-2] / 2.0 + shift[-2]
+
+    # (x0, y0, z0, phi, magnitude scaling)
+    return (
+        x0.astype(np.float64),
+        y0.astype(np.float64),
+        z0.astype(np.float64),
+        phi.astype(np.float64),
+        1.0 / (2 * c_width),
+    )
+
+
+def _birdcage_stack(geometries):  # noqa
+    # stack geometries of a batch of coil arrays:
+    # (x0, y0, z0, phi) of shape (nbatch, nc) and scale of shape (nbatch,)
+    return tuple(np.stack(values) for values in zip(*geometries))
+
+
+def _birdcage_block(geometry, channels, *coords):  # noqa
+    # coords: 1D (z), y, x pixel coordinates; z = 0 for 2D maps
+    # channels index the (flattened) channels of a single or stacked geometry
+    x0, y0, z0, phi, scale = geometry
+    scale = np.broadcast_to(np.asarray(scale)[..., None], np.shape(x0)).ravel()
+    x0, y0, z0, phi = [np.ravel(value) for value in (x0, y0, z0, phi)]
+    z, y, x = _expand_coords(coords)
+    channels = np.asarray(channels)
+    smap = np.empty((channels.size, z.size, y.size, x.size), dtype=np.complex64)
+    _birdcage_kernel(
+        smap,
+        x0[channels],
+        y0[channels],
+        z0[channels],
+        phi[channels],
+        scale[channels],
+        z,
+        y,
+        x,
+    )
+    return smap.reshape(channels.shape + tuple(np.size(c) for c in coords))
+
+
+def _birdcage_rss(geometry, *coords):  # noqa
+    # root sum of squares of the birdcage magnitude across all channels
+    # of a single (output of shape (*shape)) or stacked geometry (output of shape (nbatch, *shape))
+    x0, y0, z0, _, scale = geometry
+    batch_shape = np.shape(scale)
+    x0, y0, z0 = [np.reshape(value, (-1, np.shape(x0)[-1])) for value in (x0, y0, z0)]
+    scale = np.reshape(scale, -1).astype(np.float64)
+    z, y, x = _expand_coords(coords)
+    rss = np.empty((scale.size, z.size, y.size, x.size), dtype=np.float32)
+    _birdcage_rss_kernel(rss, x0, y0, z0, scale, z, y, x)
+    return rss.reshape(batch_shape + tuple(np.size(c) for c in coords))
+
+
+# %% local utils
+def _expand_coords(coords):
+    coords = [np.asarray(c, dtype=np.float64).ravel() for c in coords]
+    if len(coords) == 2:
+        coords = [np.zeros(1)] + coords
+    return coords
+
+
+@nb.njit(fastmath=True, parallel=True, cache=True)  # pragma: no cover
+def _birdcage_kernel(smap, x0, y0, z0, phi, scale, z, y, x):
+    nc, nz, ny, nx = smap.shape
+
+    # parallelize over (channel, slice) pairs
+    for n in nb.prange(nc * nz):
+        c = n // nz
+        k = n % nz
+        z_co = z[k] - z0[c]
+        for j in range(ny):
+            y_co = y[j] - y0[c]
+            for i in range(nx):
+                x_co = x[i] - x0[c]
+
+                # coil magnitude
+                rr = math.sqrt(x_co**2 + y_co**2 + z_co**2) * scale[c]
+                if rr == 0.0:
+                    rr = 1.0
+
+                # coil phase
+                phase = math.atan2(x_co, -y_co) - phi[c]
+                smap[c, k, j, i] = complex(math.cos(phase), math.sin(phase)) / rr
+
+
+@nb.njit(fastmath=True, parallel=True, cache=True)  # pragma: no cover
+def _birdcage_rss_kernel(rss, x0, y0, z0, scale, z, y, x):
+    nbatch, nz, ny, nx = rss.shape
+    nc = x0.shape[-1]
+
+    # parallelize over (batch, slice) pairs
+    for n in nb.prange(nbatch * nz):
+        b = n // nz
+        k = n % nz
+        for j in range(ny):
+            for i in range(nx):
+                value = 0.0
+                for c in range(nc):
+                    x_co = x[i] - x0[b, c]
+                    y_co = y[j] - y0[b, c]
+                    z_co = z[k] - z0[b, c]
+                    rr = math.sqrt(x_co**2 + y_co**2 + z_co**2) * scale[b]
+                    if rr == 0.0:
+                        rr = 1.0
+                    value += 1.0 / rr**2
+                rss[b, k, j, i] = math.sqrt(value)
@@ -0,0 +1,221 @@
+"""Random field maps ensemble generation routines."""
+
+__all__ = ["field_ensemble"]
+
+
+from typing import Iterator, Sequence
+
+
+import numpy as np
+
+
+from .._utils import coordinate_grid, prefetch as _prefetch
+
+
+from ._b0_map import b0field
+from ._b1_map import _combine
+from ._birdcage import (
+    _birdcage_geometry,
+    _birdcage_stack,
+    _birdcage_block,
+    _birdcage_rss,
+)
+
+
+def field_ensemble(
+    shape: Sequence[int],
+    nsamples: int,
+    chi: np.ndarray | None = None,
+    ncoils: int | None = None,
+    b1: bool = True,
+    batch_size: int = 1,
+    max_shift: float = 5.0,
+    max_dphi: float = 180.0,
+    b1range: Sequence[float] = (0.5, 2.0),
+    b1_width: Sequence[float] = (1.1, 4.0),
+    coil_width: Sequence[float] = (1.5, 3.0),
+    chi_scale: Sequence[float] = (0.8, 1.2),
+    B0: float = 1.5,
+    seed: int | None = None,
+    prefetch: int = 0,
+) -> Iterator[dict]:
+    """
+    Generate an ensemble of random B0, B1+ and coil sensitivity maps.
+
+    Field configurations (coil shifts, rotations and widths, B1+ ranges
+    and susceptibility scalings) are sampled uniformly within the
+    given bounds and the corresponding maps are generated in batches,
+    i.e., the coils of all the samples in a batch are evaluated
+    by a single kernel call.
+
+    Parameters
+    ----------
+    shape : Sequence[int]
+        Size of the matrix ``(ny, nx)`` (2D) or ``(nz, ny, nx)`` (3D).
+    nsamples : int
+        Number of samples in the ensemble.
+    chi : np.ndarray | None, optional
+        Object magnetic susceptibility map in ``[ppb]`` of shape ``shape``.
+        If provided, B0 maps are generated. The default is ``None``.
+    ncoils : int | None, optional
+        Number of receiver channels. If provided, coil sensitivity
+        maps are generated. The default is ``None``.
+    b1 : bool, optional
+        If ``True``, generate (single mode) B1+ maps.
+        The default is ``True``.
+    batch_size : int, optional
+        Number of samples generated at a time. The default is ``1``.
+    max_shift : float, optional
+        Maximum displacement of B1+ and receiver coils centers
+        along each axis in ``[px]``. The default is ``5.0``.
+    max_dphi : float, optional
+        Maximum bulk coil angle in ``[deg]``. The default is ``180.0°``.
+    b1range : Sequence[float], optional
+        Bounds for the range of B1+ magnitude. The default is ``(0.5, 2.0)``.
+    b1_width : Sequence[float], optional
+        Bounds for the width of the transmit coil, with respect to image dimension.
+        The default is ``(1.1, 4.0)``.
+    coil_width : Sequence[float], optional
+        Bounds for the width of the receiver coils, with respect to image dimension.
+        The default is ``(1.5, 3.0)``.
+    chi_scale : Sequence[float], optional
+        Bounds for the scaling of the susceptibility map. Only a global
+        scale is sampled, i.e., the spatial pattern of ``chi`` is not perturbed.
+        The default is ``(0.8, 1.2)``.
+    B0 : float, optional
+        Static field strength in [T]. The default is `1.5`.
+    seed : int | None, optional
+        Random number generator seed. The default is ``None``.
+    prefetch : int, optional
+        Number of batches generated ahead on a background thread.
+        The default is ``0`` (generate on the calling thread).
+
+    Yields
+    ------
+    dict
+        Batch of maps, with keys ``"B0"`` of shape ``(batch_size, *shape)``,
+        ``"B1"`` of shape ``(batch_size, *shape)`` and ``"smap"`` of shape
+        ``(batch_size, ncoils, *shape)`` (only for the requested fields), as well as
+        ``"params"``, i.e., a dictionary with the sampled parameters for the batch.
+        The last batch may contain less than ``batch_size`` samples.
+
+    Example
+    -------
+    >>> from mrtwin import shepplogan_phantom, field_ensemble
+
+    We can generate ``1000`` random B0, B1+ and 8-channel coil configurations
+    for a 2D Shepp-Logan phantom, in batches of ``50`` samples, by:
+
+    >>> chi = shepplogan_phantom(2, 128, segtype=False).Chi
+    >>> for batch in field_ensemble((128, 128), 1000, chi=chi, ncoils=8, batch_size=50, seed=42):
+    ...     B0, B1, smap = batch["B0"], batch["B1"], batch["smap"] # (50, 128, 128), (50, 128, 128), (50, 8, 128, 128)
+
+    """
+    shape = tuple(shape)
+    ndim = len(shape)
+    if chi is not None:
+        assert chi.shape == shape, ValueError(
+            f"chi must have shape {shape} - found {chi.shape}."
+        )
+
+    # sample all the configurations upfront (independent of batch size)
+    rng = np.random.default_rng(seed)
+    params = {}
+    if chi is not None:
+        params["chi_scale"] = rng.uniform(*chi_scale, size=nsamples)
+    if b1:
+        params["b1_shift"] = rng.uniform(-max_shift, max_shift, size=(nsamples, ndim))
+        params["b1_dphi"] = rng.uniform(-max_dphi, max_dphi, size=nsamples)
+        params["b1_width"] = rng.uniform(*b1_width, size=nsamples)
+        params["b1range"] = np.sort(rng.uniform(*b1range, size=(nsamples, 2)), axis=-1)
+    if ncoils is not None:
+        params["coil_shift"] = rng.uniform(-max_shift, max_shift, size=(nsamples, ndim))
+        params["coil_dphi"] = rng.uniform(-max_dphi, max_dphi, size=nsamples)
+        params["coil_width"] = rng.uniform(*coil_width, size=nsamples)
+
+    def _generator():
+        for start in range(0, nsamples, batch_size):
+            batch = {
+                key: value[start : start + batch_size] for key, value in params.items()
+            }
+            yield _generate(shape, chi, ncoils, batch, B0)
+
+    return _prefetch(_generator(), prefetch)
+
+
+# %% local utils
+def _generate(shape, chi, ncoils, params, B0):
+    out = {}
+
+    # B0 maps (batched convolution)
+    if chi is not None:
+        scale = params["chi_scale"].astype(np.float32)
+        chi = scale.reshape(-1, *[1] * len(shape)) * chi.astype(np.float32)
+        out["B0"] = b0field(chi, B0=B0, ndim=len(shape))
+
+    # B1+ maps
+    if "b1_shift" in params:
+        out["B1"] = _b1_batch(shape, params)
+
+    # coil sensitivity maps
+    if ncoils is not None:
+        out["smap"] = _smap_batch(shape, ncoils, params)
+
+    out["params"] = params
+    return out
+
+
+def _b1_batch(shape, params):
+    # single mode B1+ of two quadrature-driven elements (as in b1field defaults)
+    nchannels = 4
+    nrings = max(shape[0] // 4, 1)
+    nbatch = len(params["b1_dphi"])
+    geometry = _birdcage_stack(
+        [
+            _birdcage_geometry([nchannels, *shape], width, nrings, shift, dphi)
+            for shift, dphi, width in zip(
+                params["b1_shift"], np.deg2rad(params["b1_dphi"]), params["b1_width"]
+            )
+        ]
+    )
+
+    # normalized coils magnitude of shape (nbatch, nchannels, nvoxels)
+    coords = coordinate_grid(shape)
+    smap = abs(_birdcage_block(geometry, np.arange(nbatch * nchannels), *coords))
+    smap = smap.reshape(nbatch, nchannels, *shape)
+    smap /= _birdcage_rss(geometry, *coords)[:, None]
+    smap = smap.reshape(nbatch, nchannels, -1)
+
+    # combine (fundamental mode) and rescale each sample to its range
+    mag = _combine(np.ones((1, nchannels)), smap)[1][:, 0]  # (nbatch, nvoxels)
+    bmin = mag.min(axis=-1, keepdims=True)
+    bmax = mag.max(axis=-1, keepdims=True)
+    b1range = params["b1range"].astype(np.float32)
+    mag -= bmin
+    mag *= (b1range[:, [1]] - b1range[:, [0]]) / (bmax - bmin)
+    mag += b1range[:, [0]]
+
+    return mag.reshape(nbatch, *shape)
+
+
+def _smap_batch(shape, ncoils, params):
+    nrings = max(ncoils // 4, 1)
+    nbatch = len(params["coil_dphi"])
+    geometry = _birdcage_stack(
+        [
+            _birdcage_geometry([ncoils, *shape], width, nrings, shift, dphi)
+            for shift, dphi, width in zip(
+                params["coil_shift"],
+                np.deg2rad(params["coil_dphi"]),
+                params["coil_width"],
+            )
+        ]
+    )
+
+    # coils of shape (nbatch, ncoils, *shape), normalized by their root sum of squares
+    coords = coordinate_grid(shape)
+    smap = _birdcage_block(geometry, np.arange(nbatch * ncoils), *coords)
+    smap = smap.reshape(nbatch, ncoils, *shape)
+    smap /= _birdcage_rss(geometry, *coords)[:, None]
+
+    return smap
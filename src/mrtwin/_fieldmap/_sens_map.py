@@ -1,6 +1,6 @@
 """Coil sensitivity maps generation routines."""
 
-__all__ = ["sensmap"]
+__all__ = ["sensmap", "SensitivityMap", "LowRankSensitivityMap"]
 
 
 import os
@@ -12,10 +12,11 @@ from typing import Sequence
 import numpy as np
 
 
-from .._utils import CacheDirType, get_mrtwin_dir
+from .._utils import CacheDirType, coordinate_grid, get_mrtwin_dir
 
 
-from ._birdcage import _birdcage
+from ._basis import FieldBasis
+from ._birdcage import _birdcage, _birdcage_geometry, _birdcage_block, _birdcage_rss
 
 
 def sensmap(
@@ -26,6 +27,12 @@ def sensmap(
     nrings: int = None,
     cache: bool | None = None,
     cache_dir: CacheDirType = None,
+    lazy: bool = False,
+    nvcoils: int | None = None,
+    energy: float | None = None,
+    lowrank: bool = False,
+    basis: str | None = None,
+    degree: int = 8,
 ):
     """
     Simulate birdcage coils.
@@ -56,12 +63,40 @@ def sensmap(
     cache_dir : CacheDirType, optional
         cache_directory for phantom caching.
         The default is ``None`` (``~/.cache/mrtwin``).
+    lazy : bool, optional
+        If ``True``, return a ``SensitivityMap`` object computing
+        the requested channels and slices on demand. Lazy maps are never cached
+        on disk. If compression is requested, return a ``LowRankSensitivityMap``
+        (as for ``lowrank=True``). Not supported with ``basis``.
+        The default is ``False``.
+    nvcoils : int | None, optional
+        If provided, compress the physical channels to ``nvcoils``
+        virtual coils via SVD. The default is ``None`` (no compression).
+    energy : float | None, optional
+        If provided, compress the physical channels to the smallest number
+        of virtual coils retaining (at least) this fraction of the total
+        signal energy, e.g., ``0.99``. Mutually exclusive with ``nvcoils``.
+        The default is ``None`` (no compression).
+    lowrank : bool, optional
+        If ``True``, return a ``LowRankSensitivityMap`` object, i.e., the
+        physical channels factorized as virtual coils (spatial bases) times
+        channel weights, expanded on demand. The default is ``False``.
+    basis : str | None, optional
+        If provided, return a ``FieldBasis`` representation of the maps,
+        which can be evaluated at any matrix size. Valid entries are
+        ``"polynomial"`` and ``"fourier"``. If compression is requested,
+        the virtual coils are represented. The default is ``None`` (return dense maps).
+    degree : int, optional
+        Maximum basis order along each axis. Only used if ``basis``
+        is provided. The default is ``8``.
 
     Returns
     -------
-    smap : torch.Tensor
+    smap : np.ndarray | SensitivityMap | LowRankSensitivityMap | FieldBasis
         Complex spatially varying sensitivity maps of shape ``(nmodes, ny, nx)`` (2D)
         or ``(nmodes, nz, ny, nx)`` (3D). If ``nmodes = 1``, the first dimension is squeezed.
+        If compression is requested (and ``lowrank`` is ``False``), the first axis
+        contains the virtual coils.
 
     Example
     -------
@@ -79,7 +114,38 @@ def sensmap(
 
     >>> smap = sensmap((8, 128, 128, 128))
 
-    Beware that this will require more memory.
+    Beware that this will require more memory. To avoid storing the full coil stack,
+    maps can be generated lazily, and individual channels or slices computed on demand:
+
+    >>> smap = sensmap((64, 128, 128, 128), lazy=True)
+    >>> smap[:, 64].shape # single slice, all the channels
+    (64, 128, 128)
+    >>> smap[:8, 32:48].shape # channel subset, slab of 16 slices
+    (8, 16, 128, 128)
+
+    Large arrays can be compressed to a smaller set of virtual coils, either by
+    specifying their number or the fraction of signal energy to be retained:
+
+    >>> smap = sensmap((32, 128, 128), nvcoils=8)
+    >>> smap.shape
+    (8, 128, 128)
+    >>> smap = sensmap((32, 128, 128), energy=0.99)
+
+    Alternatively, the physical channels can be represented in low-rank
+    factorized form and expanded on demand:
+
+    >>> smap = sensmap((32, 128, 128), nvcoils=8, lowrank=True)
+    >>> smap.basis.shape, smap.weights.shape
+    ((8, 128, 128), (32, 8))
+    >>> smap[:4].shape # physical channels 0 to 3
+    (4, 128, 128)
+
+    Since coil sensitivities are smooth, they can also be stored as a compact set
+    of basis coefficients and evaluated at any matrix size:
+
+    >>> smap = sensmap((8, 128, 128), basis="polynomial", degree=12)
+    >>> smap((256, 256)).shape
+    (8, 256, 256)
 
     References
     ----------
@@ -91,6 +157,21 @@ def sensmap(
         shift = [0.0 for ax in range(len(shape) - 1)]
     if nrings is None:
         nrings = np.max((shape[0] // 4, 1))
+    assert nvcoils is None or energy is None, ValueError(
+        "Please provide either nvcoils or energy, not both."
+    )
+    assert energy is None or 0.0 < energy <= 1.0, ValueError(
+        f"energy must be in (0, 1] - found {energy}."
+    )
+    assert basis is None or not lowrank, ValueError(
+        "Basis representation of low-rank maps is not supported."
+    )
+    assert basis is None or not lazy, ValueError(
+        "Basis representation of lazy maps is not supported."
+    )
+    compress = nvcoils is not None or energy is not None or lowrank
+    if lazy and not compress and basis is None:
+        return SensitivityMap(shape, coil_width, shift, dphi, nrings)
     if cache is None and len(shape) == 3:  # (nc, ny, nx) -> 2D
         cache = False
     elif cache is None and len(shape) == 4:  # (nc, nz, ny, nx) -> 3D
@@ -104,6 +185,14 @@ def sensmap(
     shift_str = "x".join(tuple(shift_str))
 
     file_name = f"sensmap{shape_str}mtx_{coil_width}width_{shift_str}shift_{nrings}rings_{dphi}deg.npy"
+    if nvcoils is not None:
+        file_name = file_name.replace(".npy", f"_{nvcoils}vcoils.npy")
+    elif energy is not None:
+        file_name = file_name.replace(".npy", f"_{energy}energy.npy")
+    elif lowrank:
+        file_name = file_name.replace(".npy", "_lowrank.npy")
+    if basis is not None:
+        file_name = file_name.replace(".npy", f"_{basis}{degree}.npy")
 
     # Get base directory
     cache_dir = get_mrtwin_dir(cache_dir)
@@ -111,6 +200,35 @@ def sensmap(
     # Get file path
     file_path = os.path.join(cache_dir, file_name)
 
+    # Basis representation
+    if basis is not None:
+        if os.path.exists(file_path):
+            return FieldBasis(np.load(file_path), len(shape) - 1, basis)
+        if compress:
+            smap = SensitivityMap(shape, coil_width, shift, dphi, nrings)
+            smap = _svd_compress(smap, nvcoils, energy)[0]
+        else:
+            smap = SensitivityMap(shape, coil_width, shift, dphi, nrings)[...]
+        smap = FieldBasis.fit(smap, len(shape) - 1, degree, basis)
+        if cache:
+            np.save(file_path, smap.coeffs)
+        return smap
+
+    # Coil compression
+    if compress:
+        weights_path = file_path.replace(".npy", "_weights.npy")
+        if os.path.exists(file_path) and os.path.exists(weights_path):
+            basis, weights = np.load(file_path), np.load(weights_path)
+        else:
+            smap = SensitivityMap(shape, coil_width, shift, dphi, nrings)
+            basis, weights = _svd_compress(smap, nvcoils, energy)
+            if cache:
+                np.save(file_path, basis)
+                np.save(weights_path, weights)
+        if lowrank or lazy:
+            return LowRankSensitivityMap(basis, weights)
+        return basis
+
     # Try to load
     if os.path.exists(file_path):
         return np.load(file_path)
@@ -119,11 +237,244 @@ def sensmap(
     smap = _birdcage(shape, coil_width, nrings, shift, np.deg2rad(dphi))
 
     # Normalize
-    rss = sum(abs(smap) ** 2, 0) ** 0.5
-    smap /= rss
+    geometry = _birdcage_geometry(shape, coil_width, nrings, shift, np.deg2rad(dphi))
+    smap /= _birdcage_rss(geometry, *coordinate_grid(shape[1:]))
 
     # Cache the result
     if cache and os.path.exists(file_path) is False:
         np.save(file_path, smap)
 
     return smap
+
+
+class SensitivityMap:
+    """
+    Lazily evaluated birdcage coil sensitivity maps.
+
+    Coil sensitivities are computed on demand for the requested channels and
+    voxels via NumPy-style indexing. The root-sum-of-squares normalization is computed
+    across all channels (without storing them) and cached for each slice along
+    the first spatial axis, so that channel subsets and slabs can be generated
+    independently while matching the normalization of the full coil stack.
+
+    Parameters
+    ----------
+    shape : Iterable[int]
+        Size of the matrix ``(ncoils, ny, nx)`` (2D)
+        or ``(ncoils, nz, ny, nx)`` (3D) for the sensitivity coils.
+    coil_width : float, optional
+        Width of the coil, with respect to image dimension.
+        The default is ``2.0``.
+    shift : Sequence[int] | None, optional
+        Displacement of the coil center with respect to matrix center.
+        The default is ``(0, 0)`` / ``(0, 0, 0)``.
+    dphi : float, optional
+        Bulk coil angle in ``[deg]``.
+        The default is ``0.0°``.
+    nrings : int | None, optional
+        Number of rings for a cylindrical hardware set-up.
+        The default is ``ncoils // 4``.
+
+    Notes
+    -----
+    Each axis can be indexed by an integer, a slice, or a 1D integer / boolean
+    array. Array indices are applied independently for each axis
+    (i.e., outer indexing, as in ``np.ix_``).
+
+    """
+
+    def __init__(
+        self,
+        shape: Sequence[int],
+        coil_width: float = 2.0,
+        shift: Sequence[int] | None = None,
+        dphi: float = 0.0,
+        nrings: int | None = None,
+    ):
+        assert len(shape) in (3, 4), ValueError(
+            f"Can only generate shape with length 3 or 4 - found {len(shape)}."
+        )
+        self.shape = tuple(int(n) for n in shape)
+        self.dtype = np.dtype(np.complex64)
+        self._geometry = _birdcage_geometry(
+            self.shape, coil_width, nrings, shift, np.deg2rad(dphi)
+        )
+        self._rss = {}
+
+    @property
+    def ndim(self):  # noqa
+        return len(self.shape)
+
+    @property
+    def size(self):  # noqa
+        return int(np.prod(self.shape))
+
+    def __len__(self):  # noqa
+        return self.shape[0]
+
+    def __repr__(self):  # noqa
+        return f"SensitivityMap(shape={self.shape}, dtype={self.dtype})"
+
+    def __array__(self, dtype=None, copy=None):  # noqa
+        smap = self[...]
+        if dtype is not None:
+            smap = smap.astype(dtype, copy=False)
+        return smap
+
+    def __getitem__(self, idx):  # noqa
+        index, oshape = _outer_index(idx, self.shape)
+        channels, *coords = index
+
+        # compute block and normalize
+        smap = _birdcage_block(self._geometry, channels, *coords)
+        smap /= self._get_rss(coords)
+
+        return smap.reshape(oshape)
+
+    def _get_rss(self, coords):
+        if self.ndim == 3:
+            if 0 not in self._rss:
+                self._rss[0] = _birdcage_rss(
+                    self._geometry, *coordinate_grid(self.shape[1:])
+                )
+            return self._rss[0][np.ix_(*coords)]
+
+        # compute missing slices
+        z, y, x = coords
+        missing = [k for k in np.unique(z).tolist() if k not in self._rss]
+        if missing:
+            rss = _birdcage_rss(
+                self._geometry, missing, *coordinate_grid(self.shape[2:])
+            )
+            self._rss.update(zip(missing, rss))
+
+        return np.stack([self._rss[k][np.ix_(y, x)] for k in z.tolist()])
+
+
+class LowRankSensitivityMap:
+    """
+    Low-rank factorized coil sensitivity maps.
+
+    Physical channels are represented as linear combinations of
+    a small number of spatial bases (virtual coils), i.e.,
+    ``smap[c] = sum_k weights[c, k] * basis[k]``, and expanded on demand
+    via NumPy-style indexing.
+
+    Parameters
+    ----------
+    basis : np.ndarray
+        Virtual coils of shape ``(nvcoils, ny, nx)`` (2D)
+        or ``(nvcoils, nz, ny, nx)`` (3D).
+    weights : np.ndarray
+        Channel weights of shape ``(ncoils, nvcoils)``.
+
+    Notes
+    -----
+    Channel and spatial indices are applied independently
+    (i.e., outer indexing, as in ``np.ix_``).
+
+    """
+
+    def __init__(self, basis: np.ndarray, weights: np.ndarray):
+        assert weights.ndim == 2 and weights.shape[1] == basis.shape[0], ValueError(
+            f"weights must have shape (ncoils, {basis.shape[0]}) - found {weights.shape}."
+        )
+        self.basis = np.asarray(basis, dtype=np.complex64)
+        self.weights = np.asarray(weights, dtype=np.complex64)
+        self.shape = (self.weights.shape[0],) + tuple(self.basis.shape[1:])
+        self.dtype = np.dtype(np.complex64)
+
+    @property
+    def rank(self):  # noqa
+        return self.basis.shape[0]
+
+    @property
+    def ndim(self):  # noqa
+        return len(self.shape)
+
+    def __len__(self):  # noqa
+        return self.shape[0]
+
+    def __repr__(self):  # noqa
+        return f"LowRankSensitivityMap(shape={self.shape}, rank={self.rank})"
+
+    def __array__(self, dtype=None, copy=None):  # noqa
+        smap = self[...]
+        if dtype is not None:
+            smap = smap.astype(dtype, copy=False)
+        return smap
+
+    def __getitem__(self, idx):  # noqa
+        index, oshape = _outer_index(idx, self.shape)
+        channels, *coords = index
+
+        # expand selected channels over selected voxels
+        smap = np.tensordot(
+            self.weights[channels], self.basis[(slice(None),) + np.ix_(*coords)], axes=1
+        )
+
+        return smap.reshape(oshape)
+
+
+# %% local utils
+def _svd_compress(smap, nvcoils, energy, block_size=16):
+    nc = smap.shape[0]
+    blocks = [slice(n, n + block_size) for n in range(0, smap.shape[1], block_size)]
+
+    # channel covariance (accumulated blockwise)
+    cov = np.zeros((nc, nc), dtype=np.complex128)
+    for block in blocks:
+        data = np.asarray(smap[:, block]).reshape(nc, -1)
+        cov += data @ data.conj().T
+
+    # principal components, sorted by decreasing energy
+    eigval, eigvec = np.linalg.eigh(cov)
+    eigval, eigvec = eigval[::-1].clip(0.0), eigvec[:, ::-1]
+    if nvcoils is None and energy is not None:
+        nvcoils = int(np.searchsorted(np.cumsum(eigval) / eigval.sum(), energy)) + 1
+    elif nvcoils is None:
+        nvcoils = nc
+    nvcoils = min(nvcoils, nc)
+    weights = np.ascontiguousarray(eigvec[:, :nvcoils]).astype(np.complex64)
+
+    # project on virtual coils
+    basis = np.empty((nvcoils,) + tuple(smap.shape[1:]), dtype=np.complex64)
+    for block in blocks:
+        basis[:, block] = np.tensordot(weights.conj().T, smap[:, block], axes=1)
+
+    return basis, weights
+
+
+def _outer_index(idx, shape):
+    if not isinstance(idx, tuple):
+        idx = (idx,)
+
+    # expand ellipsis
+    nellipsis = sum(i is Ellipsis for i in idx)
+    if nellipsis > 1:
+        raise IndexError("an index can only have a single ellipsis ('...')")
+    if nellipsis == 1:
+        pos = [i is Ellipsis for i in idx].index(True)
+        fill = (slice(None),) * (len(shape) - len(idx) + 1)
+        idx = idx[:pos] + fill + idx[pos + 1 :]
+    if len(idx) > len(shape):
+        raise IndexError(
+            f"too many indices: map is {len(shape)}-dimensional, but {len(idx)} were indexed"
+        )
+    idx = idx + (slice(None),) * (len(shape) - len(idx))
+
+    # convert to integer arrays
+    index, oshape = [], []
+    for i, n in zip(idx, shape):
+        if isinstance(i, (int, np.integer)):
+            index.append(np.arange(n)[[i]])
+        else:
+            i = np.arange(n)[i]
+            if i.ndim != 1:
+                raise IndexError(
+                    "only integers, slices and 1D arrays are valid indices"
+                )
+            index.append(i)
+            oshape.append(i.size)
+
+    return index, tuple(oshape)
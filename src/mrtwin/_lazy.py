@@ -0,0 +1,55 @@
+"""Lazy loading of sub-package routines."""
+
+__all__ = ["lazy_attributes"]
+
+import importlib
+import sys
+
+
+def lazy_attributes(package: str, attributes: dict[str, str]):
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy loading.
+
+    Each attribute is imported from its defining module on first access
+    (and then stored in the package namespace), so that heavy dependencies
+    (e.g., ``numba``, ``scipy.signal``, ``brainweb_dl``) are loaded only by
+    the features that need them.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package (i.e., ``__name__``).
+    attributes : dict[str, str]
+        Mapping between attribute names and the
+        (relative) name of the module defining them.
+
+    Returns
+    -------
+    __getattr__ : Callable
+        Module-level attribute getter.
+    __dir__ : Callable
+        Module-level attribute listing.
+
+    Example
+    -------
+    >>> from ._lazy import lazy_attributes
+
+    In the ``__init__.py`` of a package, we can defer
+    the import of ``b1field`` from ``._fieldmap`` as:
+
+    >>> __getattr__, __dir__ = lazy_attributes(__name__, {"b1field": "._fieldmap"})
+
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name):  # noqa
+        if name not in attributes:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(attributes[name], package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():  # noqa
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
@@ -2,8 +2,39 @@
 
 __all__ = []
 
-from ._rigid_motion import rigid_motion  # noqa
-from ._girf import generate_girf  # noqa
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from ._rigid_motion import rigid_motion  # noqa
+    from ._continuous_motion import continuous_motion  # noqa
+    from ._apply_motion import apply_motion  # noqa
+    from ._kspace_motion import kspace_motion  # noqa
+    from ._girf import generate_girf  # noqa
+    from ._girf import apply_girf  # noqa
+    from ._girf import stream_girf  # noqa
+    from ._girf import predict_trajectory  # noqa
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "rigid_motion": "._rigid_motion",
+        "continuous_motion": "._continuous_motion",
+        "apply_motion": "._apply_motion",
+        "kspace_motion": "._kspace_motion",
+        "generate_girf": "._girf",
+        "apply_girf": "._girf",
+        "stream_girf": "._girf",
+        "predict_trajectory": "._girf",
+    },
+)
 
 __all__.append("rigid_motion")
+__all__.append("continuous_motion")
+__all__.append("apply_motion")
+__all__.append("kspace_motion")
 __all__.append("generate_girf")
+__all__.append("apply_girf")
+__all__.append("stream_girf")
+__all__.append("predict_trajectory")
@@ -0,0 +1,201 @@
+"""Continuous-time rigid motion generation routines."""
+
+__all__ = ["continuous_motion"]
+
+
+from typing import Sequence
+
+
+import numpy as np
+
+
+def continuous_motion(
+    ndim: int,
+    times: np.ndarray,
+    nsubjects: int | None = None,
+    drift: Sequence[float] = (1.0, 1.0),
+    drift_time: float = 30.0,
+    respiration: Sequence[float] = (0.2, 0.5),
+    respiration_rate: float = 15.0,
+    cardiac: Sequence[float] = (0.02, 0.05),
+    heart_rate: float = 70.0,
+    jerk: Sequence[float] = (2.0, 2.0),
+    jerk_rate: float = 0.5,
+    dt: float = 0.05,
+    seed: int | np.random.Generator = 42,
+):
+    """
+    Generate continuous-time rigid motion pattern.
+
+    Motion is modeled as the sum of a slow random drift
+    (Ornstein-Uhlenbeck process), periodic respiratory and cardiac
+    components and sudden jerks, occurring as a Poisson process.
+
+    Parameters
+    ----------
+    ndim : int
+        Generate 2D (in-plane only) or 3D motion pattern.
+    times : np.ndarray
+        Sampling times in ``[s]`` of shape ``(ntimes,)``, e.g.,
+        the start time of each TR or readout from a sequence timing table.
+    nsubjects : int | None, optional
+        If provided, generate ``nsubjects`` independent motion patterns
+        at once. The default is ``None`` (single motion pattern).
+    drift : Sequence[float], optional
+        Standard deviation of the drift rotation in ``[deg]`` and translation in ``[mm]``.
+        The default is ``(1.0, 1.0)``.
+    drift_time : float, optional
+        Correlation time of the drift in ``[s]``. The default is ``30.0``.
+    respiration : Sequence[float], optional
+        Amplitude of the respiration induced rotation in ``[deg]`` and
+        translation in ``[mm]``. The default is ``(0.2, 0.5)``.
+    respiration_rate : float, optional
+        Mean respiration rate in ``[breaths/min]``. The default is ``15.0``.
+    cardiac : Sequence[float], optional
+        Amplitude of the cardiac induced rotation in ``[deg]`` and
+        translation in ``[mm]``. The default is ``(0.02, 0.05)``.
+    heart_rate : float, optional
+        Mean heart rate in ``[bpm]``. The default is ``70.0``.
+    jerk : Sequence[float], optional
+        Standard deviation of the jerks rotation in ``[deg]`` and translation in ``[mm]``.
+        The default is ``(2.0, 2.0)``.
+    jerk_rate : float, optional
+        Mean number of jerks per minute. The default is ``0.5``.
+    dt : float, optional
+        Time step in ``[s]`` of the grid used to generate the drift
+        and jerks, which are then linearly interpolated to ``times``.
+        The default is ``0.05``.
+    seed : int | np.random.Generator, optional
+        Random number generator seed (or generator).
+        The default is ``42``.
+
+    Notes
+    -----
+    The drift is sampled exactly on a grid of step ``dt``, so
+    the cost does not depend on the number of sampling times.
+    Jerks are sudden displacements that decay
+    with the drift correlation time.
+
+    Respiratory (Lujan model, i.e., ``cos^4``) and cardiac (sinusoidal) components
+    are evaluated exactly at the sampling times. For each subject, rates are jittered
+    by up to ``10%`` around their mean values, phases are random and each component
+    displaces the object along a random rotation axis and translation direction.
+
+    Returns
+    -------
+    tuple[np.ndarray] | np.ndarray
+        Motion parameters, in the same format as ``rigid_motion``,
+        each of shape ``(ntimes,)``, i.e., ``(angleZ, dy, dx)`` (2D) or
+        ``(angleX, angleY, angleZ, dz, dy, dx)`` (3D) in ``[deg]`` and ``[mm]``.
+        If ``nsubjects`` is provided, motion parameters are returned as
+        a single array of shape ``(nsubjects, 3, ntimes)`` (2D)
+        or ``(nsubjects, 6, ntimes)`` (3D).
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from mrtwin import continuous_motion
+
+    We can generate a 6-degree continuous rigid motion pattern
+    for a 5 minutes scan with ``TR = 10 ms`` as:
+
+    >>> times = np.arange(30000) * 10e-3 # [s]
+    >>> roll, pitch, yaw, dz, dy, dx = continuous_motion(ndim=3, times=times)
+
+    Multiple independent patterns can be generated in a single call as:
+
+    >>> motion = continuous_motion(ndim=3, times=times, nsubjects=100) # (100, 6, 30000)
+
+    """
+    if ndim not in (2, 3):
+        raise ValueError(f"Invalid number of dims! must be 2 or 3 - found {ndim}")
+    assert drift_time > 0, ValueError(
+        f"drift_time must be positive - found {drift_time}."
+    )
+    assert dt > 0, ValueError(f"dt must be positive - found {dt}.")
+
+    times = np.asarray(times, dtype=np.float64).ravel()
+    rng = np.random.default_rng(seed)
+    nsub = nsubjects or 1
+
+    # drift and jerks (on regular grid)
+    grid, x = _drift(
+        times, nsub, ndim, drift, drift_time, jerk, jerk_rate / 60.0, dt, rng
+    )
+    x = _interp(times, grid, x)
+
+    # physiological components (at sampling times)
+    for amplitude, rate, waveform in (
+        (respiration, respiration_rate, _respiration),
+        (cardiac, heart_rate, np.sin),
+    ):
+        freq = rate / 60.0 * rng.uniform(0.9, 1.1, size=(nsub, 1, 1))
+        phase = rng.uniform(0.0, 2 * np.pi, size=(nsub, 1, 1))
+        direction = _direction(amplitude, nsub, ndim, rng)[..., None]
+        wave = waveform(2 * np.pi * freq * times + phase).astype(np.float32)
+        x += direction.astype(np.float32) * wave
+
+    if nsubjects is None:
+        return tuple(x[0])
+    return x
+
+
+# %% local utils
+def _amplitude(value, ndim):
+    # (rotation, translation) -> (nparams,)
+    nrot = 1 if ndim == 2 else 3
+    return np.asarray(nrot * [value[0]] + ndim * [value[1]], dtype=np.float64)
+
+
+def _direction(value, nsub, ndim, rng):
+    # random rotation axis and translation direction scaled by amplitude
+    nrot = 1 if ndim == 2 else 3
+    rotation = rng.standard_normal((nsub, nrot))
+    translation = rng.standard_normal((nsub, ndim))
+    rotation /= np.linalg.norm(rotation, axis=-1, keepdims=True)
+    translation /= np.linalg.norm(translation, axis=-1, keepdims=True)
+    return np.concatenate((rotation, translation), axis=-1) * _amplitude(value, ndim)
+
+
+def _respiration(arg):
+    # Lujan model (n = 2), rescaled to [-1, 1]
+    return 2.0 * np.cos(0.5 * arg) ** 4 - 1.0
+
+
+def _drift(times, nsub, ndim, drift, drift_time, jerk, jerk_rate, dt, rng):
+    from scipy.signal import lfilter
+
+    # regular grid covering sampling times
+    tmin, tmax = times.min(), times.max()
+    nsteps = max(int(np.ceil((tmax - tmin) / dt)) + 1, 2)
+    grid = tmin + dt * np.arange(nsteps)
+
+    # Ornstein-Uhlenbeck process as AR(1): x[n] = a * x[n-1] + sqrt(1 - a**2) * w[n]
+    # (first sample drawn from stationary distribution)
+    a = np.exp(-dt / drift_time)
+    nparams = 3 if ndim == 2 else 6
+    innovation = rng.standard_normal((nsub, nparams, nsteps))
+    innovation[..., 1:] *= np.sqrt(1 - a**2)
+    innovation *= _amplitude(drift, ndim)[:, None]
+
+    # jerks (Poisson process)
+    subject, step = np.nonzero(rng.random((nsub, nsteps)) < jerk_rate * dt)
+    jumps = rng.standard_normal((subject.size, nparams)) * _amplitude(jerk, ndim)
+    innovation[subject, :, step] += jumps
+
+    return grid, lfilter([1.0], [1.0, -a], innovation, axis=-1)
+
+
+def _interp(times, grid, x):
+    # linear interpolation along last axis (regular grid)
+    dt = grid[1] - grid[0]
+    pos = (times - grid[0]) / dt
+    idx = np.clip(pos.astype(np.int64), 0, grid.size - 2)
+    weight = (pos - idx).astype(np.float32)[:, None]
+
+    # gather contiguous rows (time first)
+    xt = np.ascontiguousarray(x.reshape(-1, grid.size).T, dtype=np.float32)
+    out = xt[idx + 1] - xt[idx]
+    out *= weight
+    out += xt[idx]
+    return np.ascontiguousarray(out.T).reshape(*x.shape[:-1], times.size)
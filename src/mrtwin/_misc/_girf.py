@@ -1,13 +1,18 @@
 """Gradient Impulse Response Function generation routines."""
 
-__all__ = ["generate_girf"]
+__all__ = ["generate_girf", "apply_girf", "stream_girf", "predict_trajectory"]
 
-from typing import Sequence
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator, Sequence
 
 
 import numpy as np
 
 
+from .._utils import rfftn, irfftn, next_fast_len
+
+
 def generate_girf(
     dt: float, N: int, fwhm: float | Sequence[float], delay: float | Sequence[float]
 ):
@@ -31,18 +36,20 @@ def generate_girf(
         Width in Hz of the magnitude response of the gradient
         system for the three axes ``z, y, x``.
         If it is a scalar, assume the
-        same delay for all the axes.
+        same delay for all the axes. A batch of settings
+        of shape ``(..., 3)`` can be provided.
     delay : float | Sequence[float]
         Non-integer delay (in seconds) for the three axes
         ``z, y, x``. If it is a scalar, assume the
-        same delay for all the axes.
+        same delay for all the axes. A batch of settings
+        of shape ``(..., 3)`` can be provided.
 
     Returns
     -------
     tuple[np.ndarray, np.ndarray]
         A tuple containing:
         - The frequency axis (in Hz) as a NumPy array.
-        - Complex GIRF of shape ``(3, N)``.
+        - Complex GIRF of shape ``(3, N)`` (``(..., 3, N)`` for batched settings).
 
     Notes
     -----
@@ -66,47 +73,336 @@ def generate_girf(
 
     >>> freqs, girf = generate_girf(4e-6, 25000, 5.0e3, 1.1e-6)
 
+    Multiple settings can be generated at once, e.g., for ``4`` different delays:
+
+    >>> import numpy as np
+    >>> delay = np.linspace(0.5e-6, 2e-6, 4)[:, None] * np.ones(3) # (4, 3)
+    >>> freqs, girf = generate_girf(4e-6, 25000, 5.0e3, delay) # (4, 3, 25000)
+
     """
-    # Handle scalar case
-    if np.isscalar(fwhm):
-        fwhm = [fwhm] * 3
-    fwhm = list(fwhm)
-    if np.isscalar(delay):
-        delay = [delay] * 3
-    delay = list(delay)
+    fwhm, delay = _broadcast_settings(fwhm, delay)
 
     # Calculate frequency axis (Hz)
     freqs = np.fft.fftfreq(N, d=dt)
 
-    # Generate GIRF magnitude
-    girf_magn = np.stack([_gaussian_freq_domain(dt, N, f) for f in fwhm], axis=0)
-    girf_magn = girf_magn.astype(np.float32)
+    return freqs, _girf(freqs, fwhm, delay)
 
-    # Generate GIRF phase
-    girf_phase = np.stack([_phase_shift_line(dt, N, d) for d in delay], axis=0)
-    girf_phase = girf_phase.astype(np.float32)
 
-    return freqs, girf_magn * np.exp(1j * girf_phase)
+def apply_girf(
+    grad: np.ndarray,
+    dt: float,
+    fwhm: float | Sequence[float],
+    delay: float | Sequence[float],
+    pad: float = 1.0,
+    block_size: int | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Apply an approximate Gradient Impulse Response Function (GIRF) to gradient waveforms.
 
+    Parameters
+    ----------
+    grad : np.ndarray
+        Nominal gradient waveforms of shape ``(..., 3, nt)``,
+        e.g., ``(ninterleaves, 3, nt)``, for the axes ``z, y, x``.
+    dt : float
+        Gradient raster time (in seconds).
+    fwhm : float | Sequence[float]
+        Width in Hz of the magnitude response of the gradient
+        system for the three axes ``z, y, x``. A batch of settings
+        of shape ``(nsettings, 3)`` can be provided.
+    delay : float | Sequence[float]
+        Non-integer delay (in seconds) for the three axes
+        ``z, y, x``. A batch of settings of shape ``(nsettings, 3)`` can be provided.
+    pad : float, optional
+        Zero-padding factor used to avoid circular wrap-around.
+        Waveforms of length ``nt`` are padded to the smallest FFT-friendly
+        (5-smooth) size not smaller than ``(1 + pad) * nt``.
+        The default is ``1.0`` (linear convolution).
+    block_size : int | None, optional
+        If provided, filter the waveforms ``block_size`` samples at a time
+        via overlap-add block convolution (see ``stream_girf``), so that
+        ``grad`` (and ``out``) can be memory-mapped arrays larger than the available memory.
+        The default is ``None`` (single FFT over the whole waveforms).
+    out : np.ndarray | None, optional
+        Output array (e.g., a memory-mapped array). Only used if ``block_size``
+        is provided. The default is ``None`` (allocate a new array).
 
-def _gaussian_freq_domain(dt: float, N: int, fwhm: float):
-    # Calculate frequency axis (Hz)
-    freqs = np.fft.fftfreq(N, d=dt)
+    Returns
+    -------
+    np.ndarray
+        Actual gradient waveforms of shape ``(..., 3, nt)``
+        (``(nsettings, ..., 3, nt)`` for batched settings).
 
-    # Calculate standard deviation from FWHM
-    sigma_f = fwhm / (2 * np.sqrt(2 * np.log(2)))
+    Notes
+    -----
+    Convolution is performed with real-to-complex FFTs in single precision,
+    and GIRF spectra are cached for each FFT length and setting.
 
-    # Generate Gaussian in the frequency domain
-    gaussian = np.exp(-0.5 * (freqs / sigma_f) ** 2)
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mrtwin import apply_girf
 
-    return gaussian
+    We can apply the same response to ``ninterleaves=32`` spiral waveforms as:
 
+    >>> grad = np.random.rand(32, 3, 5000) # (ninterleaves, 3, nt) in [T/m]
+    >>> grad = apply_girf(grad, 4e-6, 5.0e3, 1.1e-6)
 
-def _phase_shift_line(dt: float, N: int, delay: float):
-    # Calculate frequency axis (Hz)
-    freqs = np.fft.fftfreq(N, d=dt)
+    Long waveforms stored on disk can be processed block by block:
+
+    >>> grad = np.load("grad.npy", mmap_mode="r") # doctest: +SKIP
+    >>> out = np.lib.format.open_memmap("out.npy", "w+", np.float32, grad.shape) # doctest: +SKIP
+    >>> grad = apply_girf(grad, 4e-6, 5.0e3, 1.1e-6, block_size=2**16, out=out) # doctest: +SKIP
+
+    """
+    grad = np.asanyarray(grad)
+    assert grad.ndim >= 2 and grad.shape[-2] == 3, ValueError(
+        f"grad must have shape (..., 3, nt) - found {grad.shape}."
+    )
+    fwhm, delay = _broadcast_settings(fwhm, delay)
+    nt = grad.shape[-1]
+
+    # streaming computation
+    if block_size is not None:
+        if out is None:
+            out = np.empty(fwhm.shape[:-1] + grad.shape, dtype=np.float32)
+        chunks = (grad[..., n : n + block_size] for n in range(0, nt, block_size))
+        start = 0
+        for chunk in stream_girf(chunks, dt, fwhm, delay):
+            stop = start + chunk.shape[-1]
+            out[..., start:stop] = chunk
+            start = stop
+        return out
+
+    grad = np.asarray(grad, dtype=np.float32)
+    nfft = next_fast_len(np.ceil((1 + pad) * nt))
+
+    # get GIRF spectrum (..., 3, nfft // 2 + 1)
+    girf = _girf_spectrum(dt, nfft, tuple(fwhm.ravel()), tuple(delay.ravel()))
+    girf = girf.reshape(*fwhm.shape[:-1], *[1] * (grad.ndim - 2), 3, -1)
+
+    # apply
+    spectrum = rfftn(grad, axes=(-1,), s=(nfft,))
+    spectrum = spectrum * girf
+    grad = irfftn(spectrum, axes=(-1,), s=(nfft,))[..., :nt]
+
+    return grad.astype(np.float32, copy=False)
+
+
+def stream_girf(
+    chunks: Iterable[np.ndarray],
+    dt: float,
+    fwhm: float | Sequence[float],
+    delay: float | Sequence[float],
+    ntaps: int | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    Apply an approximate Gradient Impulse Response Function (GIRF) to streamed waveforms.
+
+    Waveforms are filtered chunk by chunk via overlap-add block convolution
+    with a truncated (FIR) impulse response, so that arbitrarily long waveforms
+    (e.g., whole-scan gradient trains) can be processed with bounded memory.
+
+    Parameters
+    ----------
+    chunks : Iterable[np.ndarray]
+        Consecutive chunks of the nominal gradient waveforms,
+        each of shape ``(..., 3, nchunk)``.
+    dt : float
+        Gradient raster time (in seconds).
+    fwhm : float | Sequence[float]
+        Width in Hz of the magnitude response of the gradient
+        system for the three axes ``z, y, x``. A batch of settings
+        of shape ``(nsettings, 3)`` can be provided.
+    delay : float | Sequence[float]
+        Non-integer delay (in seconds) for the three axes
+        ``z, y, x``. A batch of settings of shape ``(nsettings, 3)`` can be provided.
+    ntaps : int | None, optional
+        Length of the impulse response (rounded up to an odd number), e.g.,
+        ``T / dt`` for a GIRF measured over a time window ``T``.
+        The default is ``None`` (cover the delay plus ``8`` standard
+        deviations of the Gaussian impulse response on each side).
+
+    Yields
+    ------
+    np.ndarray
+        Actual gradient waveforms chunks, of the same size as the input ones
+        (with a leading ``nsettings`` axis for batched settings).
+
+    Notes
+    -----
+    Impulse response spectra are cached for each FFT length (i.e., chunk size).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mrtwin import stream_girf
+
+    >>> chunks = (np.random.rand(3, 2**16) for _ in range(100)) # (3, 6553600) samples
+    >>> for chunk in stream_girf(chunks, 4e-6, 5.0e3, 1.1e-6):
+    ...     pass # process chunk
+
+    """
+    fwhm, delay = _broadcast_settings(fwhm, delay)
+    if ntaps is None:
+        sigma_t = (2 * np.sqrt(2 * np.log(2))) / (2 * np.pi * fwhm.min())
+        ntaps = 2 * int(np.ceil((np.abs(delay).max() + 8 * sigma_t) / dt)) + 3
+    ntaps = int(ntaps) // 2 * 2 + 1
+    lag = ntaps // 2
+    settings = (tuple(fwhm.ravel()), tuple(delay.ravel()))
+
+    tail = None  # overlap from previous chunks
+    pending = None  # filtered samples not yet returned
+    sizes = deque()  # sizes of chunks not yet returned
+    skip = lag  # leading samples to be discarded (filter latency)
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float32)
+        nchunk = chunk.shape[-1]
+        nfft = next_fast_len(nchunk + ntaps - 1)
+
+        # linear convolution of current chunk
+        kernel = _kernel_spectrum(dt, nfft, ntaps, *settings)
+        kernel = kernel.reshape(*fwhm.shape[:-1], *[1] * (chunk.ndim - 2), 3, -1)
+        spectrum = rfftn(chunk, axes=(-1,), s=(nfft,))
+        spectrum = spectrum * kernel
+        conv = irfftn(spectrum, axes=(-1,), s=(nfft,))[..., : nchunk + ntaps - 1]
+
+        # overlap-add
+        if tail is not None:
+            conv[..., : ntaps - 1] += tail
+        ready, tail = conv[..., :nchunk], conv[..., nchunk:]
+        if skip > 0:
+            ready, skip = ready[..., skip:], max(skip - nchunk, 0)
+
+        # return chunks as soon as they are complete
+        pending = ready if pending is None else np.concatenate((pending, ready), -1)
+        sizes.append(nchunk)
+        while sizes and pending.shape[-1] >= sizes[0]:
+            size = sizes.popleft()
+            yield pending[..., :size].astype(np.float32)
+            pending = pending[..., size:]
+
+    # flush
+    if sizes:
+        needed = sum(sizes) - pending.shape[-1]
+        pending = np.concatenate((pending, tail[..., skip : skip + needed]), -1)
+        for size in sizes:
+            yield pending[..., :size].astype(np.float32)
+            pending = pending[..., size:]
+
+
+def predict_trajectory(
+    grad: np.ndarray,
+    dt: float,
+    fwhm: float | Sequence[float],
+    delay: float | Sequence[float],
+    pad: float = 1.0,
+    gamma: float = 42.58 * 1e6,
+) -> np.ndarray:
+    """
+    Predict the actual k-space trajectory from nominal gradient waveforms.
+
+    Gradient waveforms are filtered with an approximate
+    Gradient Impulse Response Function (GIRF) and integrated over time.
+
+    Parameters
+    ----------
+    grad : np.ndarray
+        Nominal gradient waveforms in ``[T/m]`` of shape ``(..., 3, nt)``,
+        e.g., ``(ninterleaves, 3, nt)``, for the axes ``z, y, x``.
+    dt : float
+        Gradient raster time (in seconds).
+    fwhm : float | Sequence[float]
+        Width in Hz of the magnitude response of the gradient
+        system for the three axes ``z, y, x``. A batch of settings
+        of shape ``(nsettings, 3)`` can be provided.
+    delay : float | Sequence[float]
+        Non-integer delay (in seconds) for the three axes
+        ``z, y, x``. A batch of settings of shape ``(nsettings, 3)`` can be provided.
+    pad : float, optional
+        Zero-padding factor used to avoid circular wrap-around.
+        The default is ``1.0`` (linear convolution).
+    gamma : float, optional
+        Gyromagnetic ratio in ``[Hz/T]``.
+        The default is ``42.58e6`` (1H imaging).
+
+    Returns
+    -------
+    np.ndarray
+        Predicted k-space trajectory in ``[1/m]`` of shape ``(..., 3, nt)``
+        (``(nsettings, ..., 3, nt)`` for batched settings).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mrtwin import predict_trajectory
+
+    We can predict the trajectory of ``ninterleaves=32`` spiral waveforms
+    for ``4`` different gradient delays as:
+
+    >>> grad = np.random.rand(32, 3, 5000) # (ninterleaves, 3, nt) in [T/m]
+    >>> delay = np.linspace(0.5e-6, 2e-6, 4)[:, None] * np.ones(3) # (4, 3)
+    >>> traj = predict_trajectory(grad, 4e-6, 5.0e3, delay) # (4, 32, 3, 5000)
+
+    """
+    grad = apply_girf(grad, dt, fwhm, delay, pad)
+    traj = np.cumsum(grad, axis=-1, dtype=np.float64)
+    traj *= gamma * dt
+    return traj.astype(np.float32)
+
+
+# %% local utils
+def _broadcast_settings(fwhm, delay):
+    fwhm = np.asarray(fwhm, dtype=np.float64)
+    if fwhm.ndim == 0:
+        fwhm = np.full(3, fwhm)
+    delay = np.asarray(delay, dtype=np.float64)
+    if delay.ndim == 0:
+        delay = np.full(3, delay)
+    fwhm, delay = np.broadcast_arrays(fwhm, delay)
+    assert fwhm.shape[-1] == 3, ValueError(
+        f"fwhm and delay must have shape (..., 3) - found {fwhm.shape}."
+    )
+    return fwhm, delay
+
+
+@lru_cache(maxsize=16)
+def _girf_spectrum(dt, nfft, fwhm, delay):
+    # real-to-complex layout GIRF for flattened settings
+    freqs = np.fft.rfftfreq(nfft, d=dt)
+    fwhm = np.asarray(fwhm).reshape(-1, 3)
+    delay = np.asarray(delay).reshape(-1, 3)
+    girf = _girf(freqs, fwhm, delay)
+    girf.flags.writeable = False
+    return girf
+
+
+@lru_cache(maxsize=16)
+def _kernel_spectrum(dt, nfft, ntaps, fwhm, delay):
+    # truncated impulse response (taps -ntaps // 2, ..., ntaps // 2),
+    # zero-padded to nfft in real-to-complex layout
+    freqs = np.fft.fftfreq(ntaps, d=dt)
+    fwhm = np.asarray(fwhm).reshape(-1, 3)
+    delay = np.asarray(delay).reshape(-1, 3)
+    taps = np.fft.fftshift(np.fft.ifft(_girf(freqs, fwhm, delay), axis=-1), axes=-1)
+    kernel = np.fft.rfft(taps.real, n=nfft, axis=-1).astype(np.complex64)
+    kernel.flags.writeable = False
+    return kernel
+
+
+def _girf(freqs, fwhm, delay):
+    # Calculate standard deviation from FWHM
+    sigma_f = fwhm[..., None] / (2 * np.sqrt(2 * np.log(2)))
+
+    # Generate Gaussian in the frequency domain
+    girf_magn = np.exp(-0.5 * (freqs / sigma_f) ** 2).astype(np.float32)
 
     # Generate the linear phase ramp: -2 * pi * f * delay
-    phase_ramp = -2 * np.pi * freqs * delay
+    girf_phase = (-2 * np.pi * freqs * delay[..., None]).astype(np.float32)
+
+    girf = np.empty(girf_magn.shape, dtype=np.complex64)
+    np.multiply(girf_magn, np.cos(girf_phase), out=girf.real)
+    np.multiply(girf_magn, np.sin(girf_phase), out=girf.imag)
 
-    return phase_ramp
+    return girf
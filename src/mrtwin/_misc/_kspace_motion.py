@@ -0,0 +1,103 @@
+"""K-space rigid motion routines."""
+
+__all__ = ["kspace_motion"]
+
+
+from typing import Sequence
+
+
+import numpy as np
+
+
+from ._rigid_motion import _motion_params, _rotation_matrix
+
+
+def kspace_motion(
+    coords: np.ndarray,
+    motion: Sequence[np.ndarray],
+    data: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply a rigid motion pattern in k-space.
+
+    For an object rotated by ``R`` about the center of the FOV and translated by ``t``,
+    the k-space sample acquired at ``k`` is ``exp(-i 2 pi k . t) F(R^T k)``,
+    where ``F`` is the k-space of the static object. Hence, motion is simulated by
+    rotating the sampling coordinates and applying a linear phase to the data,
+    without resampling the image.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        Nominal k-space coordinates in ``[1/m]`` of shape ``(nframes, ..., ndim, nsamples)``,
+        e.g., ``(nshots, 3, nsamples)``, for the axes ``z, y, x`` (3D) or ``y, x`` (2D).
+        Coordinates of shape ``(ndim, nsamples)`` are shared by all the motion frames.
+    motion : Sequence[np.ndarray]
+        Motion parameters, as returned by ``rigid_motion``, i.e.,
+        ``(angleZ, dy, dx)`` (2D) or ``(angleX, angleY, angleZ, dz, dy, dx)`` (3D)
+        in ``[deg]`` and ``[mm]``, each of shape ``(nframes,)``.
+    data : np.ndarray | None, optional
+        K-space data of the static object sampled at the rotated coordinates
+        of shape ``(nframes, ..., nsamples)``. If provided, the motion induced phase
+        is applied to the data and returned in place of the phase.
+        The default is ``None``.
+
+    Returns
+    -------
+    coords : np.ndarray
+        Rotated k-space coordinates in ``[1/m]`` of shape ``(nframes, ..., ndim, nsamples)``.
+    phase : np.ndarray
+        Motion induced phase of shape ``(nframes, ..., nsamples)``
+        (or motion corrupted ``data``, if provided).
+
+    Example
+    -------
+    >>> import numpy as np
+    >>> from mrtwin import rigid_motion, kspace_motion
+
+    We can simulate motion between the ``nshots=1000`` shots of a 3D acquisition as:
+
+    >>> coords = np.random.randn(1000, 3, 512) * 100.0 # (nshots, 3, nsamples) in [1/m]
+    >>> motion = rigid_motion(ndim=3, nframes=1000)
+    >>> coords, phase = kspace_motion(coords, motion) # (1000, 3, 512), (1000, 512)
+
+    The static object can then be sampled at the new coordinates
+    (e.g., via NUFFT) and multiplied by the phase to obtain the motion corrupted data.
+
+    """
+    ndim, angles, shifts = _motion_params(motion)
+    nframes = angles.shape[0]
+
+    # get coordinates
+    coords = np.asarray(coords, dtype=np.float32)
+    assert coords.shape[-2] == ndim, ValueError(
+        f"coords must have {ndim} spatial axes - found {coords.shape[-2]}."
+    )
+    if coords.ndim == 2:
+        coords = np.broadcast_to(coords, (nframes,) + coords.shape)
+    assert coords.shape[0] == nframes, ValueError(
+        f"coords must have {nframes} frames - found {coords.shape[0]}."
+    )
+
+    # get rotation and translation for each frame
+    rotation = np.swapaxes(_rotation_matrix(angles), -1, -2)[..., -ndim:, -ndim:]
+    shifts = 1e-3 * shifts[..., -ndim:]  # [mm] -> [m]
+
+    # flatten intermediate axes
+    oshape = coords.shape
+    coords = coords.reshape(nframes, -1, ndim, oshape[-1])
+
+    # compute phase (nominal coordinates)
+    arg = np.matmul(shifts[:, None, None, :].astype(np.float32), coords)[..., 0, :]
+    arg *= -2 * np.pi
+    phase = np.empty(arg.shape, dtype=np.complex64)
+    np.cos(arg, out=phase.real)
+    np.sin(arg, out=phase.imag)
+    phase = phase.reshape(*oshape[:-2], oshape[-1])
+
+    # rotate coordinates
+    coords = np.matmul(rotation[:, None].astype(np.float32), coords).reshape(oshape)
+
+    if data is not None:
+        return coords, data * phase
+    return coords, phase
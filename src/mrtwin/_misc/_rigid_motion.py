@@ -14,7 +14,8 @@ def rigid_motion(
     ndim: int,
     nframes: int,
     degree: str | Sequence[float] = "moderate",
-    seed: int = 42,
+    seed: int | np.random.Generator = 42,
+    ntrajectories: int | None = None,
 ):
     """
     Generate rigid motion pattern as a Markov Chain process.
@@ -27,9 +28,12 @@ def rigid_motion(
         Number of motion frames.
     degree : str | Sequence[float], optional
         Severity of motion. The default is ``"moderate"``.
-    seed : int, optional
-        Random number generator seed.
+    seed : int | np.random.Generator, optional
+        Random number generator seed (or generator).
         The default is ``42``.
+    ntrajectories : int | None, optional
+        If provided, generate ``ntrajectories`` independent motion patterns
+        at once. The default is ``None`` (single motion pattern).
 
     Notes
     -----
@@ -74,6 +78,10 @@ def rigid_motion(
         * dx : np.ndarray
             Translation towards ``x`` axis in ``[mm]`` of shape ``(nframes,)``.
 
+        If ``ntrajectories`` is provided, motion parameters are returned as
+        a single array of shape ``(ntrajectories, 3, nframes)`` (2D)
+        or ``(ntrajectories, 6, nframes)`` (3D), with the parameters
+        in the same order as above.
 
     Example
     -------
@@ -83,23 +91,25 @@ def rigid_motion(
 
     >>> roll, pitch, yaw, dz, dy, dx = rigid_motion(ndim=3, nframes=1000)
 
+    Multiple independent patterns can be generated in a single call as:
+
+    >>> motion = rigid_motion(ndim=3, nframes=1000, ntrajectories=100) # (100, 6, 1000)
+
     """
+    if ndim not in (2, 3):
+        raise ValueError(f"Invalid number of dims! must be 2 or 3 - found {ndim}")
+
     # Markov rate (I don't remember what this is :()
     rate = [[0.9, 0.05, 0.05], [0.4, 0.3, 0.3], [0.4, 0.3, 0.3]]
-    transition_mtx = np.array(rate, np.float32)
+    transition_mtx = np.cumsum(np.array(rate, np.float32), axis=-1)
 
     # generate probability array
-    np.random.seed(seed)
-    change = np.random.rand(6, nframes)
-
-    # generate six random series
-    x = _generate_series(6, nframes, transition_mtx, change)
+    rng = np.random.default_rng(seed)
+    change = rng.random((ntrajectories or 1, 6, nframes), dtype=np.float32)
 
-    # rescale series
-    x_max = np.abs(x).max(axis=1)[:, None]
-    x_max[x_max == 0] = 1
-    x = x / x_max
-    x = x.astype(np.float32)
+    # generate six random series for each trajectory, normalized to [-1, 1]
+    x = _generate_series(transition_mtx, change.reshape(-1, nframes))
+    x = x.reshape(change.shape)
 
     # get motion range
     if isinstance(degree, str):
@@ -114,23 +124,74 @@ def rigid_motion(
                 f"Severity of motion not recognized - must be either 'subtle', 'moderate', 'severe' or a (rotation, translation) tuple in (deg, mm). Found {degree}."
             )
 
-    # set
-    roll = degree[0] * x[0]  # deg, rotation around x
-    pitch = degree[0] * x[1]  # deg, rotation around y
-    yaw = degree[0] * x[2]  # deg, rotation around z
-    dx = degree[1] * x[3]  # mm, translation around x
-    dy = degree[1] * x[4]  # mm, translation around x
-    dz = degree[1] * x[5]  # mm, translation around x
-
+    # set (roll, pitch, yaw) in [deg] and (dz, dy, dx) in [mm]
     if ndim == 2:
-        return yaw, dy, dx
-    elif ndim == 3:
-        return roll, pitch, yaw, dz, dy, dx
+        index, scale = [2, 4, 3], [degree[0], degree[1], degree[1]]
     else:
-        raise ValueError(f"Invalid number of dims! must be 2 or 3 - found {ndim}")
+        index, scale = [0, 1, 2, 5, 4, 3], 3 * [degree[0]] + 3 * [degree[1]]
+    x = x[:, index] * np.asarray(scale, dtype=np.float32)[:, None]
+
+    if ntrajectories is None:
+        return tuple(x[0])
+    return x
 
 
 # %% local utils
+def _motion_params(motion):
+    # parse rigid_motion output into (ndim, angles, shifts), with
+    # angles = (roll, pitch, yaw) in [deg] and shifts = (dz, dy, dx) in [mm],
+    # each of shape (nframes, 3)
+    motion = np.stack([np.asarray(param, dtype=np.float64) for param in motion])
+    if motion.shape[0] == 3:
+        ndim = 2
+        zeros = np.zeros_like(motion[0])
+        angles = np.stack((zeros, zeros, motion[0]), axis=-1)
+        shifts = np.stack((zeros, motion[1], motion[2]), axis=-1)
+    elif motion.shape[0] == 6:
+        ndim = 3
+        angles = motion[:3].T
+        shifts = motion[3:].T
+    else:
+        raise ValueError(
+            f"Motion must contain 3 (2D) or 6 (3D) parameters - found {motion.shape[0]}"
+        )
+    return ndim, angles, shifts
+
+
+def _rotation_matrix(angles):
+    # rotation matrices of shape (..., 3, 3) acting on (z, y, x) coordinates
+    # for rotations (roll, pitch, yaw) in [deg] about x, y and z axes
+    roll, pitch, yaw = np.deg2rad(np.moveaxis(np.asarray(angles), -1, 0))
+    ones, zeros = np.ones_like(roll), np.zeros_like(roll)
+    Rx = np.stack(
+        [
+            np.stack([ones, zeros, zeros], -1),
+            np.stack([zeros, np.cos(roll), -np.sin(roll)], -1),
+            np.stack([zeros, np.sin(roll), np.cos(roll)], -1),
+        ],
+        -2,
+    )
+    Ry = np.stack(
+        [
+            np.stack([np.cos(pitch), zeros, np.sin(pitch)], -1),
+            np.stack([zeros, ones, zeros], -1),
+            np.stack([-np.sin(pitch), zeros, np.cos(pitch)], -1),
+        ],
+        -2,
+    )
+    Rz = np.stack(
+        [
+            np.stack([np.cos(yaw), -np.sin(yaw), zeros], -1),
+            np.stack([np.sin(yaw), np.cos(yaw), zeros], -1),
+            np.stack([zeros, zeros, ones], -1),
+        ],
+        -2,
+    )
+    R = Rz @ Ry @ Rx  # (x, y, z) coordinates
+
+    return R[..., ::-1, ::-1]  # (z, y, x) coordinates
+
+
 # adapted from
 # https://ipython-books.github.io/131-simulating-a-discrete-time-markov-chain/
 
@@ -138,29 +199,40 @@ def rigid_motion(
 states = np.array([0, -1, 1], np.int64)
 
 
-@nb.njit(fastmath=True, parallel=True)  # pragma: no cover
-def _generate_series(n_parameters, n_frames, transition_matrix, change):
-    # pre-allocate state history
-    state_history = np.zeros((n_parameters, n_frames), dtype=np.int64)
+@nb.njit(fastmath=True, parallel=True, cache=True)  # pragma: no cover
+def _generate_series(transition_matrix, change):
+    n_series, n_frames = change.shape
 
-    # initialize states
-    current_state = np.zeros(n_parameters, dtype=np.int64)
+    # pre-allocate normalized state history
+    state_history = np.zeros((n_series, n_frames), dtype=np.float32)
 
-    for p in nb.prange(n_parameters):
+    for p in nb.prange(n_series):
+        current_state = 0
+        position = 0
+        max_position = 0
         for t in range(1, n_frames):
-            current_state[p] = _generate_state(
-                transition_matrix[current_state[p]], change[p, t]
+            current_state = _generate_state(
+                transition_matrix[current_state], change[p, t]
             )
-            state_history[p, t] = state_history[p, t - 1] + states[current_state[p]]
+            position += states[current_state]
+            max_position = max(max_position, abs(position))
+            state_history[p, t] = position
+
+        # rescale series
+        if max_position > 0:
+            scale = np.float32(1.0 / max_position)
+            for t in range(n_frames):
+                state_history[p, t] *= scale
 
     return state_history
 
 
 @nb.njit(fastmath=True, cache=True)  # pragma: no cover
-def _generate_state(probability, change):
-    if change <= probability[0]:
+def _generate_state(cumulative_probability, change):
+    # sample next state from cumulative transition probabilities
+    if change <= cumulative_probability[0]:
         out_state = 0
-    elif change <= probability[0] + probability[1]:
+    elif change <= cumulative_probability[1]:
         out_state = 1
     else:
         out_state = 2
@@ -19,6 +19,7 @@ def osf_phantom(
     osf_dir: CacheDirType = None,
     force: bool = False,
     verify: bool = True,
+    mmap: bool = False,
 ) -> PhantomType:
     """
     Get OSF phantom.
@@ -55,6 +56,12 @@ def osf_phantom(
         Enable SSL verification.
         DO NOT DISABLE (i.e., ``verify=False``) IN PRODUCTION.
         The default is ``True``.
+    mmap : bool, optional
+        If ``True``, memory-map the cached parameter maps instead of
+        loading them in memory. Tissue property maps are then evaluated
+        on access. Requires ``cache=True`` (or an existing cache file),
+        otherwise a warning is raised and maps are loaded in memory.
+        The default is ``False``.
 
     Returns
     -------
@@ -85,6 +92,13 @@ def osf_phantom(
     >>> ax[1].axis("off"), ax[1].set_title("T2 [ms]")
     >>> fig.colorbar(im, ax=ax[1], fraction=0.046, pad=0.04)
 
+    Large 3D phantoms can be streamed slice-by-slice, with constant memory usage,
+    by memory-mapping the cached maps (optionally prefetching on a background thread):
+
+    >>> phantom = osf_phantom(ndim=3, subject=1, mmap=True)
+    >>> for slice in phantom.iter_slices(axis=0, prefetch=2):
+    ...     T1, T2 = slice["T1"], slice["T2"]
+
     """
     return NumericOSFPhantom(
         ndim,
@@ -97,4 +111,5 @@ def osf_phantom(
         osf_dir,
         force,
         verify,
+        mmap,
     )
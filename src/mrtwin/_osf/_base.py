@@ -3,6 +3,7 @@
 __all__ = ["OSFPhantom"]
 
 import os
+import warnings
 import numpy as np
 
 from typing import Sequence
@@ -30,6 +31,7 @@ class OSFPhantom(PhantomMixin):
         osf_dir: CacheDirType = None,
         force: bool = False,
         verify: bool = True,
+        mmap: bool = False,
     ):
         # keep dim
         self._ndim = ndim
@@ -52,12 +54,22 @@ class OSFPhantom(PhantomMixin):
             osf_dir,
             force,
             verify,
+            mmap,
         )
 
         # cache the result
         if cache:
             self.cache(file_path, self.maps)
 
+        # replace in-memory maps with their memory-mapped cached copy
+        if cache and mmap and not isinstance(self.maps, np.memmap):
+            self.maps = np.load(file_path, mmap_mode="r")
+        if mmap and not isinstance(self.maps, np.memmap):
+            warnings.warn(
+                "mmap=True requires cache=True (or an existing cache file) -"
+                " maps loaded in memory."
+            )
+
     def _default_prescription(
         self,
         ndim: int,
@@ -97,8 +109,8 @@ class OSFPhantom(PhantomMixin):
         ptype = "Dense"
         msg = f"{ptype} OSF phantom with following properties:\n"
         msg += f"Number of spatial dimensions: {self._ndim}\n"
-        msg += f"Tissue properties: {self._properties.keys()}\n"
-        _shape = list(self._properties.values())[0].shape[-self._ndim :]
+        msg += f"Tissue properties: {self.properties.keys()}\n"
+        _shape = self._spatial_shape
         msg += f"Matrix size: {_shape}\n"
 
         return msg
@@ -153,6 +165,7 @@ class OSFPhantom(PhantomMixin):
         osf_dir: CacheDirType,
         force: bool,
         verify: bool,
+        mmap: bool = False,
     ):
         """
         Get OSF parameter maps.
@@ -183,6 +196,9 @@ class OSFPhantom(PhantomMixin):
         verify : bool
             Enable SSL verification.
             DO NOT DISABLE (i.e., verify=False)IN PRODUCTION.
+        mmap : bool, optional
+            If True, memory-map the cached maps instead of loading them.
+            The default is False.
 
         Returns
         -------
@@ -200,7 +216,7 @@ class OSFPhantom(PhantomMixin):
 
         # try to load
         if os.path.exists(file_path) and not (force):
-            return np.load(file_path), file_path
+            return np.load(file_path, mmap_mode="r" if mmap else None), file_path
         else:
             maps = get_osf_maps(
                 ndim, subject, shape, output_res, osf_dir, force, verify
@@ -2,12 +2,14 @@
 
 __all__ = ["NumericOSFPhantom"]
 
+from collections.abc import Mapping
 from typing import Sequence
 
+import numpy as np
 
 from .. import _classes
 
-from .._build import PhantomMixin
+from .._build import PhantomMixin, _take
 from .._utils import CacheDirType
 
 from ._base import OSFPhantom
@@ -30,6 +32,7 @@ class NumericOSFPhantom(OSFPhantom, PhantomMixin):
         osf_dir: CacheDirType = None,
         force: bool = False,
         verify: bool = True,
+        mmap: bool = False,
     ):
 
         # initialize segmentation
@@ -43,6 +46,7 @@ class NumericOSFPhantom(OSFPhantom, PhantomMixin):
             osf_dir,
             force,
             verify,
+            mmap,
         )
 
         # initialize model
@@ -57,38 +61,101 @@ class NumericOSFPhantom(OSFPhantom, PhantomMixin):
             Static field strength in [T].
 
         """
-        self._properties = {}
-        self.properties["M0"] = self.maps[0]
-        self.properties["T1"] = _classes.extrapolate_t1(self.maps[1], 3.0, B0)
-        self._properties["T2"] = fudge_factor * self.maps[2]
-        self._properties["T2s"] = _classes.extrapolate_t2star(
-            self.maps[3],
-            self._properties["T2"],
-            3.0,
-            B0,
-        )
-        self.properties["Chi"] = self.maps[4]
+        self._B0 = B0
+
+        # memory-mapped maps are converted on access
+        if isinstance(self.maps, np.memmap):
+            self._properties = None
+        else:
+            self._properties = _get_properties(self.maps, B0)
+
+    def get_slice(self, idx: int, axis: int = 0):
+        """
+        Get a single phantom slice as dense tissue property maps.
+
+        Parameters
+        ----------
+        idx : int
+            Slice index.
+        axis : int, optional
+            Spatial axis along which slice is extracted.
+            The default is ``0``.
+
+        Returns
+        -------
+        dict
+            Tissue property maps for the selected slice.
+
+        """
+        return _get_properties(_take(self.maps, idx, axis, self._ndim), self._B0)
+
+    @property
+    def _spatial_shape(self):
+        return self.maps.shape[-self._ndim :]
 
     @property
     def M0(self):  # noqa
-        return self._properties["M0"]
+        return self.properties["M0"]
 
     @property
     def T1(self):  # noqa
-        return self._properties["T1"]
+        return self.properties["T1"]
 
     @property
     def T2(self):  # noqa
-        return self._properties["T2"]
+        return self.properties["T2"]
 
     @property
     def T2s(self):  # noqa
-        return self._properties["T2s"]
+        return self.properties["T2s"]
 
     @property
     def Chi(self):  # noqa
-        return self._properties["Chi"]
+        return self.properties["Chi"]
 
     @property
     def properties(self):  # noqa
+        if self._properties is None:
+            return _LazyProperties(self.maps, self._B0)
         return self._properties
+
+
+# %% local utils
+PROPERTIES = ["M0", "T1", "T2", "T2s", "Chi"]
+
+
+class _LazyProperties(Mapping):
+    # tissue properties of memory-mapped maps, converted on access
+    # (M0 and Chi are returned as memory-mapped views)
+
+    def __init__(self, maps, B0):
+        self._maps = maps
+        self._B0 = B0
+
+    def __getitem__(self, key):
+        if key not in PROPERTIES:
+            raise KeyError(key)
+        return _get_property(self._maps, key, self._B0)
+
+    def __iter__(self):
+        return iter(PROPERTIES)
+
+    def __len__(self):
+        return len(PROPERTIES)
+
+
+def _get_properties(maps, B0):
+    return {key: _get_property(maps, key, B0) for key in PROPERTIES}
+
+
+def _get_property(maps, key, B0):
+    if key == "M0":
+        return maps[0]
+    if key == "T1":
+        return _classes.extrapolate_t1(maps[1], 3.0, B0)
+    if key == "T2":
+        return fudge_factor * maps[2]
+    if key == "T2s":
+        return _classes.extrapolate_t2star(maps[3], fudge_factor * maps[2], 3.0, B0)
+    if key == "Chi":
+        return maps[4]
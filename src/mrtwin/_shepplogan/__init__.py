@@ -1,17 +1,44 @@
 """Shepp-Logan Phantom sub-package."""
 
-__all__ = ["shepplogan_phantom"]
+__all__ = ["shepplogan_phantom", "shepplogan_kspace"]
 
 from typing import Sequence
+
+import numpy as np
+
 from .._utils import CacheDirType, PhantomType
 
-from ._shepplogan import NumericSheppLoganPhantom, CrispSheppLoganPhantom
-from ._shepplogan_mw import NumericMWSheppLoganPhantom, CrispMWSheppLoganPhantom
-from ._shepplogan_mt import NumericMTSheppLoganPhantom, CrispMTSheppLoganPhantom
-from ._shepplogan_mwmt import NumericMWMTSheppLoganPhantom, CrispMWMTSheppLoganPhantom
+from ._kspace import get_shepp_logan_kspace
+
+from ._shepplogan import (
+    NumericSheppLoganPhantom,
+    CrispSheppLoganPhantom,
+    FuzzySheppLoganPhantom,
+)
+from ._shepplogan_mw import (
+    NumericMWSheppLoganPhantom,
+    CrispMWSheppLoganPhantom,
+    FuzzyMWSheppLoganPhantom,
+)
+from ._shepplogan_mt import (
+    NumericMTSheppLoganPhantom,
+    CrispMTSheppLoganPhantom,
+    FuzzyMTSheppLoganPhantom,
+)
+from ._shepplogan_mwmt import (
+    NumericMWMTSheppLoganPhantom,
+    CrispMWMTSheppLoganPhantom,
+    FuzzyMWMTSheppLoganPhantom,
+)
 
 VALID_MODELS = ["single-pool", "mt-model", "mw-model", "mwmt-model"]
-VALID_SEGMENTATION = ["crisp"]
+VALID_SEGMENTATION = ["crisp", "fuzzy"]
+TISSUE_MODELS = {
+    "single-pool": FuzzySheppLoganPhantom,
+    "mw-model": FuzzyMWSheppLoganPhantom,
+    "mt-model": FuzzyMTSheppLoganPhantom,
+    "mwmt-model": FuzzyMWMTSheppLoganPhantom,
+}
 
 
 def shepplogan_phantom(
@@ -19,6 +46,8 @@ def shepplogan_phantom(
     shape: int | Sequence[int],
     model: str = "single-pool",
     segtype: str | bool = "crisp",
+    output_res: float | Sequence[float] | None = None,
+    offset: float | Sequence[float] | None = None,
     B0: float = 1.5,
     cache: bool = None,
     cache_dir: CacheDirType = None,
@@ -44,10 +73,22 @@ def shepplogan_phantom(
 
         The default is ``"single-pool"``.
     segtype : str | bool, optional
-        Phantom type. If it is a string (``"crisp"``)
-        select crisp segmentation.
+        Phantom type. If it is a string (``"fuzzy"`` or ``"crisp"``)
+        select fuzzy and crisp segmentation, respectively.
+        Fuzzy segmentation accounts for partial volume effects
+        at tissue boundaries.
         If it is ``False``, return a dense numeric phantom.
         The default is ``crisp``.
+    output_res: float | Sequence[float] | None, optional
+        Resolution of the output data in ``[mm]``. The phantom spans a ``256 mm`` FOV
+        and is evaluated directly on the prescribed grid, with voxel ``n // 2``
+        along each axis at the FOV center. If scalar, assume isotropic resolution.
+        The default is ``None`` (``shape`` samples spanning the whole phantom).
+    offset: float | Sequence[float] | None, optional
+        Position of the FOV center with respect to the phantom center in ``[mm]``
+        for the axes ``z, y, x`` (3D) or ``y, x`` (2D).
+        If scalar, assume the same offset along each axis.
+        The default is ``None`` (no offset).
     B0 : float, optional
         Static field strength in [T].
         The default is `1.5`.
@@ -87,6 +128,14 @@ def shepplogan_phantom(
     >>> ax[1].axis("off"), ax[1].set_title("T2 [ms]")
     >>> fig.colorbar(im, ax=ax[1], fraction=0.046, pad=0.04)
 
+    A phantom with a prescribed resolution and FOV (e.g., ``1.0 x 1.0 x 2.0 mm``
+    over a ``192 x 192 x 120 mm`` FOV, shifted by ``10 mm`` along ``z``)
+    is obtained without resampling as:
+
+    >>> phantom = shepplogan_phantom(
+    ...     ndim=3, shape=(60, 192, 192), output_res=(2.0, 1.0, 1.0), offset=(10.0, 0.0, 0.0)
+    ... )
+
     """
     # check validity
     assert model in VALID_MODELS, ValueError(f"model must be one of {VALID_MODELS}")
@@ -98,27 +147,107 @@ def shepplogan_phantom(
     params = {
         "ndim": ndim,
         "shape": shape,
+        "output_res": output_res,
+        "offset": offset,
         "B0": B0,
         "cache": cache,
         "cache_dir": cache_dir,
     }
     if model == "single-pool":
+        if segtype == "fuzzy":
+            return FuzzySheppLoganPhantom(**params)
         if segtype == "crisp":
             return CrispSheppLoganPhantom(**params)
         if segtype is False:
             return NumericSheppLoganPhantom(**params)
     if model == "mw-model":
+        if segtype == "fuzzy":
+            return FuzzyMWSheppLoganPhantom(**params)
         if segtype == "crisp":
             return CrispMWSheppLoganPhantom(**params)
         if segtype is False:
             return NumericMWSheppLoganPhantom(**params)
     if model == "mt-model":
+        if segtype == "fuzzy":
+            return FuzzyMTSheppLoganPhantom(**params)
         if segtype == "crisp":
             return CrispMTSheppLoganPhantom(**params)
         if segtype is False:
             return NumericMTSheppLoganPhantom(**params)
     if model == "mwmt-model":
+        if segtype == "fuzzy":
+            return FuzzyMWMTSheppLoganPhantom(**params)
         if segtype == "crisp":
             return CrispMWMTSheppLoganPhantom(**params)
         if segtype is False:
             return NumericMWMTSheppLoganPhantom(**params)
+
+
+def shepplogan_kspace(
+    coords: np.ndarray,
+    model: str = "single-pool",
+    B0: float = 1.5,
+    output_res: float = 1.0,
+    block_size: int = 2**16,
+) -> dict:
+    """
+    Get analytic k-space of SheppLogan phantom tissue properties.
+
+    Signal is evaluated in closed form from the ellipsoids
+    definition, without rasterization and gridding.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        K-space coordinates in ``[1/m]`` of shape ``(..., ndim, nsamples)``
+        for the axes ``z, y, x`` (3D) or ``y, x`` (2D, i.e., central axial slice).
+        The phantom spans a ``256 mm`` FOV, centered at the origin.
+    model : str, optional
+        String selecting one of the built-in
+        tissue models. Valid entries are:
+
+        * ``"single-pool"``: Single pool tissue model.
+        * ``"mw-model"``: Myelin Water (MW) + Free Water (Intra-Extracellular, IEW)
+        * ``"mt-model"``: Macromolecular pool + Free Water (IEW + MW)
+        * ``"mwmt-model"``: Macromolecular pool + MW + IEW
+
+        The default is ``"single-pool"``.
+    B0 : float, optional
+        Static field strength in [T].
+        The default is `1.5`.
+    output_res : float, optional
+        Resolution in ``[mm]`` used to normalize the signal, so that it matches
+        the Discrete Fourier Transform of the phantom sampled at that resolution.
+        The default is ``1.0``.
+    block_size : int, optional
+        Number of k-space samples evaluated at a time, to bound memory usage.
+        The default is ``2**16``.
+
+    Returns
+    -------
+    dict
+        K-space of each tissue property map, as in ``phantom.properties``,
+        of shape ``(..., nsamples)`` (leading pool axis for multi-pool properties).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from mrtwin import shepplogan_kspace
+
+    We can evaluate the k-space of a 3D Shepp-Logan phantom
+    over ``1000`` radial spokes as:
+
+    >>> coords = np.random.randn(1000, 3, 1) * np.linspace(-500, 500, 256) # (1000, 3, 256) in [1/m]
+    >>> kspace = shepplogan_kspace(coords)
+    >>> M0 = kspace["M0"] # (1000, 256)
+
+    """
+    assert model in VALID_MODELS, ValueError(f"model must be one of {VALID_MODELS}")
+
+    # get tissue properties
+    phantom = TISSUE_MODELS[model].__new__(TISSUE_MODELS[model])
+    phantom.get_model(B0)
+
+    return get_shepp_logan_kspace(
+        coords, phantom._label, phantom.properties, output_res, block_size
+    )
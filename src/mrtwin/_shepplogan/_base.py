@@ -16,29 +16,35 @@ from ._segmentation import get_shepp_logan
 class SheppLoganPhantom(PhantomMixin):
     """Base Shepp-Logan phantom builder."""
 
+    _fuzzy = False
+
     def __init__(
         self,
         ndim: int,
         shape: int | Sequence[int] | None = None,
+        output_res: float | Sequence[float] | None = None,
+        offset: float | Sequence[float] | None = None,
         cache: bool = True,
         cache_dir: CacheDirType = None,
     ):
         # keep dim
         self._ndim = ndim
 
-        # default shape
-        if np.isscalar(shape):
-            shape = [shape] * ndim
-        shape = np.asarray(shape)
+        # default shape, resolution and offset
+        shape, output_res, offset = self._default_prescription(
+            ndim, shape, output_res, offset
+        )
 
         # get filename
-        _fname = self.get_filename(ndim, shape)
+        _fname = self.get_filename(ndim, shape, output_res, offset)
 
         # try to load segmentation
         self.segmentation, file_path = self.get_segmentation(
             _fname,
             ndim,
             shape,
+            output_res,
+            offset,
             cache,
             cache_dir,
         )
@@ -47,11 +53,47 @@ class SheppLoganPhantom(PhantomMixin):
         if cache:
             self.cache(file_path, self.segmentation)
 
+    def _default_prescription(
+        self,
+        ndim: int,
+        output_shape: int | Sequence[int] | None,
+        output_res: float | Sequence[float] | None,
+        offset: float | Sequence[float] | None,
+    ):
+        # default shape
+        if np.isscalar(output_shape):
+            output_shape = ndim * [output_shape]
+        output_shape = np.asarray(output_shape)
+
+        # default resolution (None: shape samples spanning the whole phantom)
+        if output_res is not None and np.isscalar(output_res):
+            output_res = ndim * [output_res]
+        if output_res is not None:
+            assert len(output_res) == ndim, ValueError(
+                "If output_res is not None, it must be either a scalar or a ndim-length sequence."
+            )
+            output_res = np.asarray(output_res, dtype=float)
+
+        # default offset (None: FOV centered on the phantom)
+        if offset is not None and np.isscalar(offset):
+            offset = ndim * [offset]
+        if offset is not None:
+            assert len(offset) == ndim, ValueError(
+                "If offset is not None, it must be either a scalar or a ndim-length sequence."
+            )
+            offset = np.asarray(offset, dtype=float)
+            if not offset.any():
+                offset = None
+
+        return output_shape, output_res, offset
+
     def __repr__(self):  # noqa
         if self.segmentation is None:
             ptype = "Dense"
         elif len(self.segmentation.shape) == self._ndim:
             ptype = "Crisp"
+        else:
+            ptype = "Fuzzy"
         msg = f"{ptype} Shepp-Logan phantom with following properties:\n"
         msg += f"Number of spatial dimensions: {self._ndim}\n"
         msg += f"Tissue properties: {self._properties.keys()}\n"
@@ -68,9 +110,11 @@ class SheppLoganPhantom(PhantomMixin):
         self,
         ndim: int,
         shape: int | Sequence[int],
+        resolution: float | Sequence[float] | None = None,
+        offset: float | Sequence[float] | None = None,
     ):
         """
-        Generate filename starting from matrix shape.
+        Generate filename starting from FOV, matrix shape and FOV offset.
 
         Parameters
         ----------
@@ -80,6 +124,12 @@ class SheppLoganPhantom(PhantomMixin):
         shape: int | Sequence[int]
             Shape of the output data, the data will be interpolated to the given shape.
             If int, assume isotropic matrix.
+        resolution: float | Sequence[float] | None, optional
+            Resolution of the output data in ``[mm]``.
+            The default is ``None`` (whole phantom).
+        offset: float | Sequence[float] | None, optional
+            Position of the FOV center in ``[mm]``.
+            The default is ``None`` (no offset).
 
         Returns
         -------
@@ -89,19 +139,29 @@ class SheppLoganPhantom(PhantomMixin):
         """
         shape_str = [str(di) for di in shape.tolist()]
         shape_str = "x".join(tuple(shape_str))
+        fname = f"{self.__class__.__name__.lower()}"
+
+        if resolution is not None:
+            res_str = [f"{ri:g}" for ri in resolution.tolist()]
+            fname += "_" + "x".join(tuple(res_str)) + "res"
+        if offset is not None:
+            offset_str = [f"{oi:g}" for oi in offset.tolist()]
+            fname += "_" + "x".join(tuple(offset_str)) + "offset"
 
-        return f"{self.__class__.__name__.lower()}_{shape_str}mtx.npy"
+        return f"{fname}_{shape_str}mtx.npy"
 
     def get_segmentation(
         self,
         fname: str,
         ndim: int,
         shape: int | Sequence[int],
+        output_res: float | Sequence[float] | None,
+        offset: float | Sequence[float] | None,
         cache: bool,
         cache_dir: CacheDirType,
     ):
         """
-        Get crisp Shepp-Logan tissue segmentation.
+        Get crisp or fuzzy Shepp-Logan tissue segmentation.
 
         Parameters
         ----------
@@ -113,6 +173,12 @@ class SheppLoganPhantom(PhantomMixin):
         shape: int | Sequence[int]
             Shape of the output data, the data will be interpolated to the given shape.
             If int, assume isotropic matrix.
+        output_res: float | Sequence[float] | None
+            Resolution of the output data in ``[mm]``.
+            If ``None``, ``shape`` samples span the whole phantom.
+        offset: float | Sequence[float] | None
+            Position of the FOV center with respect to the phantom center in ``[mm]``.
+            If ``None``, the FOV is centered on the phantom.
         cache : bool
             If True, cache the result.
         cache_dir : CacheDirType
@@ -136,7 +202,13 @@ class SheppLoganPhantom(PhantomMixin):
         if os.path.exists(file_path):
             return np.load(file_path), file_path
         else:
-            segmentation = get_shepp_logan(ndim, shape)
+            segmentation = get_shepp_logan(
+                ndim,
+                shape,
+                fuzzy=self._fuzzy,
+                output_res=output_res,
+                offset=offset,
+            )
 
         return segmentation, file_path
 
@@ -0,0 +1,152 @@
+"""Analytic k-space of Shepp-Logan MR phantom."""
+
+__all__ = ["get_shepp_logan_kspace"]
+
+import numpy as np
+
+from ._segmentation import FOV, mr_ellipsoid_parameters
+
+
+def get_shepp_logan_kspace(
+    coords: np.ndarray,
+    labels: np.ndarray,
+    properties: dict,
+    output_res: float = 1.0,
+    block_size: int = 2**16,
+) -> dict:
+    """
+    Get analytic Shepp-Logan k-space.
+
+    Each tissue property map is a linear combination of the ellipsoids
+    indicator functions, whose Fourier transform is known in closed form.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        K-space coordinates in ``[1/m]`` of shape ``(..., ndim, nsamples)``
+        for the axes ``z, y, x`` (3D) or ``y, x`` (2D, i.e., central axial slice).
+        The origin of the image space is at the center of the FOV.
+    labels : np.ndarray
+        Label of each tissue class of shape ``(nclasses,)``.
+        Tissues without a class are assigned a value of ``0``.
+    properties : dict
+        Tissue properties, each of shape ``(..., nclasses)``.
+    output_res : float, optional
+        Resolution in ``[mm]`` used to normalize the signal, so that it matches
+        the Discrete Fourier Transform of the phantom sampled at that resolution.
+        The default is ``1.0``.
+    block_size : int, optional
+        Number of k-space samples evaluated at a time.
+        The default is ``2**16``.
+
+    Returns
+    -------
+    dict
+        K-space of each tissue property map,
+        of shape ``(..., *coords.shape[:-2], nsamples)``.
+        Background values are subtracted, i.e., background contributes to ``k = 0`` only.
+
+    """
+    coords = np.asarray(coords, dtype=np.float64)
+    ndim = coords.shape[-2]
+    assert ndim == 2 or ndim == 3, ValueError(
+        f"Number of spatial dimensions (={ndim}) must be either 2 or 3."
+    )
+    center, axes, rotation, tissues = _ellipsoids(ndim)
+
+    # ellipsoids weights for all the properties of shape (nrows, nellipsoids)
+    weights, pshapes = [], []
+    for value in properties.values():
+        value = np.asarray(value, dtype=np.float64)
+        weights.append(_weights(labels, value, tissues).reshape(-1, tissues.size))
+        pshapes.append(value.shape[:-1])
+    weights = np.concatenate(weights)
+
+    # normalized k-space (ellipsoid domain [-1, 1] spans FOV)
+    scale = 0.5 * FOV * 1e-3
+    kshape = coords.shape[:-2] + coords.shape[-1:]
+    coords = np.moveaxis(coords, -2, -1).reshape(-1, ndim) * scale
+    weights *= (scale / (output_res * 1e-3)) ** ndim
+
+    # evaluate in blocks
+    output = np.empty((weights.shape[0], coords.shape[0]), dtype=np.complex64)
+    for start in range(0, coords.shape[0], block_size):
+        k = coords[start : start + block_size]
+        output[:, start : start + block_size] = weights @ _ellipsoid_ft(
+            k, center, axes, rotation
+        )
+
+    # split properties
+    out, start = {}, 0
+    for param, pshape in zip(properties.keys(), pshapes):
+        nrows = int(np.prod(pshape))
+        out[param] = output[start : start + nrows].reshape(*pshape, *kshape)
+        start += nrows
+
+    return out
+
+
+# %% local utils
+def _ellipsoids(ndim):
+    E = mr_ellipsoid_parameters()
+    xc, yc, zc, a, b, c, theta = E[:, :7].T
+    labels = (np.sign(E[:, 7]) * E[:, 10]).astype(np.int64)
+
+    # in-plane rotation (ellipsoid frame = R @ (x, y, z))
+    ct, st = np.cos(theta), np.sin(theta)
+    zeros, ones = np.zeros_like(ct), np.ones_like(ct)
+    rotation = np.stack(
+        (
+            np.stack((ct, st, zeros), axis=-1),
+            np.stack((st, -ct, zeros), axis=-1),
+            np.stack((zeros, zeros, ones), axis=-1),
+        ),
+        axis=-2,
+    )
+
+    # 3D: (z, y, x) ordering
+    if ndim == 3:
+        center = np.stack((zc, yc, xc), axis=-1)
+        axes = np.stack((a, b, c), axis=-1)
+        return center, axes, rotation[..., ::-1], labels
+
+    # 2D: central axial cross section
+    keep = np.abs(zc) < c
+    shrink = np.sqrt(1 - (zc[keep] / c[keep]) ** 2)
+    center = np.stack((yc, xc), axis=-1)[keep]
+    axes = np.stack((a, b), axis=-1)[keep] * shrink[:, None]
+    rotation = rotation[keep][:, :2, :2][..., ::-1]
+    return center, axes, rotation, labels[keep]
+
+
+def _weights(labels, values, tissues):
+    # property value for each label
+    table = np.zeros(values.shape[:-1] + (np.abs(tissues).max() + 1,))
+    table[..., np.asarray(labels)] = values
+
+    # ellipsoids weights (property values relative to background)
+    weights = table[..., np.abs(tissues)] - table[..., [0]]
+    return np.sign(tissues) * weights
+
+
+def _ellipsoid_ft(k, center, axes, rotation):
+    # Fourier transform of ellipsoid indicators of shape (nellipsoids, nsamples)
+    ndim = k.shape[-1]
+    phase = np.exp(-2j * np.pi * (center @ k.T))
+    rho = np.matmul(rotation, k.T) * axes[:, :, None]
+    x = 2 * np.pi * np.sqrt((rho**2).sum(axis=1))
+    volume = np.prod(axes, axis=-1)[:, None]
+
+    # unit ball (disk) Fourier transform
+    small = x < 1e-3
+    xs = np.where(small, 1.0, x)
+    if ndim == 3:
+        ball = 4 * np.pi * (np.sin(xs) - xs * np.cos(xs)) / xs**3
+        ball = np.where(small, 4 * np.pi / 3 * (1 - x**2 / 10), ball)
+    else:
+        from scipy.special import j1
+
+        ball = 2 * np.pi * j1(xs) / xs
+        ball = np.where(small, np.pi * (1 - x**2 / 8), ball)
+
+    return volume * ball * phase
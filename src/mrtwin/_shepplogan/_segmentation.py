@@ -1,15 +1,15 @@
-"""Wrapper around Phantominator to extract MR tissue segmentation."""
+"""Shepp-Logan MR tissue segmentation (adapted from Phantominator)."""
 
 __all__ = ["get_shepp_logan"]
 
-import importlib
-
 from typing import Dict, Sequence
 
 import numpy as np
 import numpy.typing as npt
+import numba as nb
 
-mr_shepp_logan = importlib.import_module("phantominator.mr_shepp_logan")
+# physical size (in mm) of the normalized [-1, 1] phantom domain
+FOV = 256.0
 
 
 def _mr_relaxation_parameters() -> Dict[str, npt.ArrayLike]:
@@ -124,13 +124,16 @@ def mr_ellipsoid_parameters() -> npt.ArrayLike:
     return E
 
 
-# Monkey patch
-mr_shepp_logan.mr_ellipsoid_parameters = mr_ellipsoid_parameters
-
-
-def get_shepp_logan(ndim: int, shape: int | Sequence[int]):
+def get_shepp_logan(
+    ndim: int,
+    shape: int | Sequence[int],
+    fuzzy: bool = False,
+    oversamp: int = 4,
+    output_res: float | Sequence[float] | None = None,
+    offset: float | Sequence[float] | None = None,
+):
     """
-    Get crisp Shepp-Logan tissue segmentation.
+    Get crisp or fuzzy Shepp-Logan tissue segmentation.
 
     Parameters
     ----------
@@ -140,11 +143,27 @@ def get_shepp_logan(ndim: int, shape: int | Sequence[int]):
     shape: int | Sequence[int]
         Shape of the output data, the data will be interpolated to the given shape.
         If int, assume isotropic matrix.
+    fuzzy : bool, optional
+        If ``True``, return partial volume (fuzzy) segmentation.
+        The default is ``False``.
+    oversamp : int, optional
+        Supersampling factor along each axis for voxels crossed
+        by an ellipsoid boundary (fuzzy segmentation only).
+        The default is ``4``.
+    output_res : float | Sequence[float] | None, optional
+        Resolution of the output data in ``[mm]``. If scalar, assume isotropic resolution.
+        Voxel ``n // 2`` along each axis is centered at the FOV center.
+        The default is ``None`` (``shape`` samples spanning the whole phantom).
+    offset : float | Sequence[float] | None, optional
+        Position of the FOV center with respect to the phantom center in ``[mm]``.
+        If scalar, assume the same offset along each axis.
+        The default is ``None`` (no offset).
 
     Returns
     -------
     np.ndarray.
-        Shepp-Logan segmentation.
+        Shepp-Logan segmentation of shape ``shape`` (crisp, ``uint8``)
+        or ``(nclasses, *shape)`` (fuzzy, ``float32``).
 
     """
     assert ndim == 2 or ndim == 3, ValueError(
@@ -154,27 +173,189 @@ def get_shepp_logan(ndim: int, shape: int | Sequence[int]):
     # default params
     if np.isscalar(shape):
         shape = shape * np.ones(ndim, dtype=int)
-    elif ndim == 3:
-        shape = [shape[1], shape[2], shape[0]]
 
     # cast to list
-    shape = list(shape)
+    shape = [int(n) for n in shape]
     assert len(shape) == ndim, ValueError(
         "If shape must be either a scalar or a ndim-length sequence."
     )
 
+    # default resolution and offset
+    if output_res is not None:
+        output_res = np.broadcast_to(np.asarray(output_res, dtype=float), (ndim,))
+    if offset is None:
+        offset = 0.0
+    offset = np.broadcast_to(np.asarray(offset, dtype=float), (ndim,))
+
+    # grid (single central slice for 2D)
+    grid = [
+        _grid(shape[n], None if output_res is None else output_res[n], offset[n])
+        for n in range(ndim)
+    ]
     if ndim == 2:
-        shape = shape + [5]
-        zlims = (0, 0.5)
-    else:
-        zlims = (-1, 1)
+        shape = [1] + shape
+        grid = [np.zeros(1)] + grid
+    z, y, x = grid
 
     # build segmentation
-    _, data, _ = mr_shepp_logan.mr_shepp_logan(shape, zlims=zlims)
+    geometry, labels, bbox = _ellipsoids(x, y, z)
+    data = np.zeros(shape, dtype=np.uint8)
+    _rasterize(data, geometry, labels, bbox, z, y, x)
+
+    # partial volume
+    if fuzzy:
+        spacing = np.asarray([_spacing(z), _spacing(y), _spacing(x)])
+        tol = 0.5 * np.linalg.norm(spacing) / geometry[:, 3:6].min(axis=-1)
+        offsets = _offsets(spacing, oversamp)
+        crisp = data
+        data = np.zeros([labels.max() + 1] + shape, dtype=np.float32)
+        _rasterize_fuzzy(data, crisp, geometry, labels, bbox, tol, offsets, z, y, x)
 
     if ndim == 2:
-        data = data[:, :, 0]
+        data = data[..., 0, :, :]
+
+    return data
+
+
+# %% local utils
+def _ellipsoids(x, y, z):
+    E = mr_ellipsoid_parameters()
+    xc, yc, zc, a, b, c, theta = E[:, :7].T
+
+    # labels (negative ellipsoids subtract the enclosing label)
+    labels = (np.sign(E[:, 7]) * E[:, 10]).astype(np.int64)
+
+    # bounding boxes (ellipsoids are rotated in the xy plane only)
+    ct, st = np.cos(theta), np.sin(theta)
+    hx = np.sqrt((a * ct) ** 2 + (b * st) ** 2)
+    hy = np.sqrt((a * st) ** 2 + (b * ct) ** 2)
+    bbox = np.stack(
+        (
+            *_index_range(z, zc, c),
+            *_index_range(y, yc, hy),
+            *_index_range(x, xc, hx),
+        ),
+        axis=-1,
+    )
+
+    geometry = np.stack((xc, yc, zc, a, b, c, ct, st), axis=-1)
+    return geometry, labels, bbox
+
+
+def _grid(n, res, offset):
+    # sampling positions in normalized units (phantom spans [-1, 1])
+    if res is None:
+        grid = np.linspace(-1, 1, n)
     else:
-        data = data.transpose(-1, 0, 1)
+        grid = (np.arange(n) - n // 2) * res / (0.5 * FOV)
+    if offset:
+        grid = grid + offset / (0.5 * FOV)
+    return grid
+
 
-    return np.ascontiguousarray(data).astype(int)
+def _spacing(grid):
+    if grid.size == 1:
+        return 0.0
+    return (grid[-1] - grid[0]) / (grid.size - 1)
+
+
+def _offsets(spacing, oversamp):
+    # subvoxel sample offsets of shape (nsamples, 3)
+    offsets = [
+        (np.arange(oversamp) + 0.5) / oversamp - 0.5 if d > 0 else np.zeros(1)
+        for d in spacing
+    ]
+    offsets = np.meshgrid(*offsets, indexing="ij")
+    return np.stack([o.ravel() * d for o, d in zip(offsets, spacing)], axis=-1)
+
+
+def _index_range(grid, center, halfwidth):
+    # first and last index of grid within [center - halfwidth, center + halfwidth]
+    # (one voxel margin, the exact test is performed by the rasterizer)
+    if grid.size == 1:
+        start = np.zeros(center.shape, dtype=np.int64)
+        return start, start
+    step = _spacing(grid)
+    start = np.floor((center - halfwidth - grid[0]) / step) - 1
+    stop = np.ceil((center + halfwidth - grid[0]) / step) + 1
+    start = np.clip(start, 0, grid.size - 1).astype(np.int64)
+    stop = np.clip(stop, 0, grid.size - 1).astype(np.int64)
+    return start, stop
+
+
+@nb.njit(parallel=True, cache=True)  # pragma: no cover
+def _rasterize(output, geometry, labels, bbox, z, y, x):
+    nz, ny, nx = output.shape
+
+    # parallelize over rows; no fastmath, so that boundary voxels are exact
+    for n in nb.prange(nz * ny):
+        k = n // ny
+        j = n % ny
+        for e in range(geometry.shape[0]):
+            if k < bbox[e, 0] or k > bbox[e, 1] or j < bbox[e, 2] or j > bbox[e, 3]:
+                continue
+            xc, yc, zc, a, b, c, ct, st = geometry[e]
+            dy = y[j] - yc
+            dz = (z[k] - zc) ** 2 / c**2
+            for i in range(bbox[e, 4], bbox[e, 5] + 1):
+                dx = x[i] - xc
+                if (dx * ct + dy * st) ** 2 / a**2 + (
+                    dx * st - dy * ct
+                ) ** 2 / b**2 + dz <= 1:
+                    output[k, j, i] += labels[e]
+
+
+@nb.njit(fastmath=True, parallel=True, cache=True)  # pragma: no cover
+def _rasterize_fuzzy(output, crisp, geometry, labels, bbox, tol, offsets, z, y, x):
+    nz, ny, nx = crisp.shape
+    weight = 1.0 / offsets.shape[0]
+
+    # parallelize over rows
+    for n in nb.prange(nz * ny):
+        k = n // ny
+        j = n % ny
+
+        # find voxels crossed by an ellipsoid boundary
+        edge = np.zeros(nx, dtype=np.bool_)
+        for e in range(geometry.shape[0]):
+            if k < bbox[e, 0] or k > bbox[e, 1] or j < bbox[e, 2] or j > bbox[e, 3]:
+                continue
+            xc, yc, zc, a, b, c, ct, st = geometry[e]
+            dy = y[j] - yc
+            dz = (z[k] - zc) ** 2 / c**2
+            for i in range(bbox[e, 4], bbox[e, 5] + 1):
+                dx = x[i] - xc
+                r = (dx * ct + dy * st) ** 2 / a**2 + (dx * st - dy * ct) ** 2 / b**2
+                if abs(np.sqrt(r + dz) - 1.0) <= tol[e]:
+                    edge[i] = True
+
+        for i in range(nx):
+            # pure voxels
+            if not edge[i]:
+                output[crisp[k, j, i], k, j, i] = 1.0
+                continue
+
+            # supersample edge voxels
+            for s in range(offsets.shape[0]):
+                zs = z[k] + offsets[s, 0]
+                ys = y[j] + offsets[s, 1]
+                xs = x[i] + offsets[s, 2]
+                label = 0
+                for e in range(geometry.shape[0]):
+                    if (
+                        k < bbox[e, 0]
+                        or k > bbox[e, 1]
+                        or j < bbox[e, 2]
+                        or j > bbox[e, 3]
+                        or i < bbox[e, 4]
+                        or i > bbox[e, 5]
+                    ):
+                        continue
+                    xc, yc, zc, a, b, c, ct, st = geometry[e]
+                    dx = xs - xc
+                    dy = ys - yc
+                    if (dx * ct + dy * st) ** 2 / a**2 + (
+                        dx * st - dy * ct
+                    ) ** 2 / b**2 + (zs - zc) ** 2 / c**2 <= 1:
+                        label += labels[e]
+                output[label, k, j, i] += weight
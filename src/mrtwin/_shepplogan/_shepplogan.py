@@ -1,6 +1,10 @@
 """Single-pool Shepp-Logan phantom builder class."""
 
-__all__ = ["CrispSheppLoganPhantom", "NumericSheppLoganPhantom"]
+__all__ = [
+    "FuzzySheppLoganPhantom",
+    "CrispSheppLoganPhantom",
+    "NumericSheppLoganPhantom",
+]
 
 from typing import Sequence
 
@@ -8,19 +12,23 @@ import numpy as np
 
 from .. import _classes
 
-from .._build import CrispPhantomMixin
+from .._build import FuzzyPhantomMixin, CrispPhantomMixin
 from .._utils import CacheDirType
 
 from ._base import SheppLoganPhantom
 
 
-class CrispSheppLoganPhantom(SheppLoganPhantom, CrispPhantomMixin):
+class FuzzySheppLoganPhantom(SheppLoganPhantom, FuzzyPhantomMixin):
     """Fuzzy Shepp-Logan phantom builder."""
 
+    _fuzzy = True
+
     def __init__(
         self,
         ndim: int,
         shape: int | Sequence[int] = None,
+        output_res: float | Sequence[float] = None,
+        offset: float | Sequence[float] = None,
         B0: float = 1.5,
         cache: bool = True,
         cache_dir: CacheDirType = None,
@@ -30,6 +38,8 @@ class CrispSheppLoganPhantom(SheppLoganPhantom, CrispPhantomMixin):
         super().__init__(
             ndim,
             shape,
+            output_res,
+            offset,
             cache,
             cache_dir,
         )
@@ -90,6 +100,15 @@ class CrispSheppLoganPhantom(SheppLoganPhantom, CrispPhantomMixin):
         return self._properties
 
 
+class CrispSheppLoganPhantom(CrispPhantomMixin, FuzzySheppLoganPhantom):
+    """Crisp Shepp-Logan phantom builder."""
+
+    # CrispPhantomMixin comes first, so that numeric phantoms
+    # keep their segmentation (as_numeric does not erase it)
+
+    _fuzzy = False
+
+
 class NumericSheppLoganPhantom(CrispSheppLoganPhantom):
     """Numeric Shepp-Logan phantom builder."""
 
@@ -97,6 +116,8 @@ class NumericSheppLoganPhantom(CrispSheppLoganPhantom):
         self,
         ndim: int,
         shape: int | Sequence[int] = None,
+        output_res: float | Sequence[float] = None,
+        offset: float | Sequence[float] = None,
         B0: float = 1.5,
         cache: bool = True,
         cache_dir: CacheDirType = None,
@@ -105,6 +126,8 @@ class NumericSheppLoganPhantom(CrispSheppLoganPhantom):
         super().__init__(
             ndim,
             shape,
+            output_res,
+            offset,
             B0,
             cache,
             cache_dir,
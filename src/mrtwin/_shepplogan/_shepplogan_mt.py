@@ -1,16 +1,24 @@
 """Two-pool (Water + MT) Shepp-Logan phantom builder class."""
 
-__all__ = ["CrispMTSheppLoganPhantom", "NumericMTSheppLoganPhantom"]
+__all__ = [
+    "FuzzyMTSheppLoganPhantom",
+    "CrispMTSheppLoganPhantom",
+    "NumericMTSheppLoganPhantom",
+]
 
 import numpy as np
 
 from .. import _classes
 
-from ._shepplogan import CrispSheppLoganPhantom, NumericSheppLoganPhantom
+from ._shepplogan import (
+    FuzzySheppLoganPhantom,
+    CrispSheppLoganPhantom,
+    NumericSheppLoganPhantom,
+)
 
 
-class CrispMTSheppLoganPhantom(CrispSheppLoganPhantom):
-    """Crisp MT Shepp-Logan phantom builder."""
+class FuzzyMTSheppLoganPhantom(FuzzySheppLoganPhantom):
+    """Fuzzy MT Shepp-Logan phantom builder."""
 
     def get_model(self, B0: float):
         """Initialize model.
@@ -60,8 +68,16 @@ class CrispMTSheppLoganPhantom(CrispSheppLoganPhantom):
         return _properties
 
 
+class CrispMTSheppLoganPhantom(
+    FuzzyMTSheppLoganPhantom, CrispSheppLoganPhantom
+):  # noqa
+    """Crisp MT Shepp-Logan phantom builder."""
+
+    pass
+
+
 class NumericMTSheppLoganPhantom(
-    CrispMTSheppLoganPhantom, NumericSheppLoganPhantom
+    FuzzyMTSheppLoganPhantom, NumericSheppLoganPhantom
 ):  # noqa
     """Numeric MT Shepp-Logan phantom builder."""
 
@@ -1,16 +1,24 @@
 """Two-pool (I/E W + MW) Shepp-Logan phantom builder class."""
 
-__all__ = ["CrispMWSheppLoganPhantom", "NumericMWSheppLoganPhantom"]
+__all__ = [
+    "FuzzyMWSheppLoganPhantom",
+    "CrispMWSheppLoganPhantom",
+    "NumericMWSheppLoganPhantom",
+]
 
 import numpy as np
 
 from .. import _classes
 
-from ._shepplogan import CrispSheppLoganPhantom, NumericSheppLoganPhantom
+from ._shepplogan import (
+    FuzzySheppLoganPhantom,
+    CrispSheppLoganPhantom,
+    NumericSheppLoganPhantom,
+)
 
 
-class CrispMWSheppLoganPhantom(CrispSheppLoganPhantom):
-    """Crisp MW Shepp-Logan phantom builder."""
+class FuzzyMWSheppLoganPhantom(FuzzySheppLoganPhantom):
+    """Fuzzy MW Shepp-Logan phantom builder."""
 
     def get_model(self, B0: float):
         """Initialize model.
@@ -86,8 +94,16 @@ class CrispMWSheppLoganPhantom(CrispSheppLoganPhantom):
         return _properties
 
 
+class CrispMWSheppLoganPhantom(
+    FuzzyMWSheppLoganPhantom, CrispSheppLoganPhantom
+):  # noqa
+    """Crisp MW Shepp-Logan phantom builder."""
+
+    pass
+
+
 class NumericMWSheppLoganPhantom(
-    CrispMWSheppLoganPhantom, NumericSheppLoganPhantom
+    FuzzyMWSheppLoganPhantom, NumericSheppLoganPhantom
 ):  # noqa
     """Numeric MW Shepp-Logan phantom builder."""
 
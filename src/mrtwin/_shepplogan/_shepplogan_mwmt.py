@@ -1,15 +1,23 @@
 """Three-pool (I/E W + MW + MT) Shepp-Logan phantom builder class."""
 
-__all__ = ["CrispMWMTSheppLoganPhantom", "NumericMWMTSheppLoganPhantom"]
+__all__ = [
+    "FuzzyMWMTSheppLoganPhantom",
+    "CrispMWMTSheppLoganPhantom",
+    "NumericMWMTSheppLoganPhantom",
+]
 
 import numpy as np
 
 from .. import _classes
 
-from ._shepplogan import CrispSheppLoganPhantom, NumericSheppLoganPhantom
+from ._shepplogan import (
+    FuzzySheppLoganPhantom,
+    CrispSheppLoganPhantom,
+    NumericSheppLoganPhantom,
+)
 
 
-class CrispMWMTSheppLoganPhantom(CrispSheppLoganPhantom):
+class FuzzyMWMTSheppLoganPhantom(FuzzySheppLoganPhantom):
     """Fuzzy MW-MT Shepp-Logan phantom builder."""
 
     def get_model(self, B0: float):
@@ -96,8 +104,16 @@ class CrispMWMTSheppLoganPhantom(CrispSheppLoganPhantom):
         return _properties
 
 
+class CrispMWMTSheppLoganPhantom(
+    FuzzyMWMTSheppLoganPhantom, CrispSheppLoganPhantom
+):  # noqa
+    """Crisp MW-MT Shepp-Logan phantom builder."""
+
+    pass
+
+
 class NumericMWMTSheppLoganPhantom(
-    CrispMWMTSheppLoganPhantom, NumericSheppLoganPhantom
+    FuzzyMWMTSheppLoganPhantom, NumericSheppLoganPhantom
 ):  # noqa
     """Numeric MW-MT Shepp-Logan phantom builder."""
 
@@ -20,6 +20,14 @@ Path
 ----
 Utilities to handle i.e., cache folder position.
 
+Prefetch
+--------
+Utilities for background generator consumption.
+
+Grid
+----
+Cached image space and k-space coordinate grids.
+
 
 """
 
@@ -27,21 +35,27 @@ __all__ = []
 
 from . import _download
 from . import _fft
+from . import _grid
 from . import _pathlib
+from . import _prefetch
 from . import _resample
 from . import _resize
 from . import _typing
 
 from ._download import *  # noqa
 from ._fft import *  # noqa
+from ._grid import *  # noqa
 from ._pathlib import *  # noqa
+from ._prefetch import *  # noqa
 from ._resample import *  # noqa
 from ._resize import *  # noqa
 from ._typing import *  # noqa
 
 __all__.extend(_download.__all__)
 __all__.extend(_fft.__all__)
+__all__.extend(_grid.__all__)
 __all__.extend(_pathlib.__all__)
+__all__.extend(_prefetch.__all__)
 __all__.extend(_resample.__all__)
 __all__.extend(_resize.__all__)
 __all__.extend(_typing.__all__)
@@ -2,7 +2,6 @@
 
 __all__ = ["ssl_verification"]
 
-import requests
 from contextlib import contextmanager
 
 
@@ -11,6 +10,9 @@ def ssl_verification(verify=True):  # noqa
     # Default behaviour (do not disable)
     if verify:
         yield
+        return
+
+    import requests
 
     # Store the original `requests.Session.send` method
     original_send = requests.Session.send
@@ -1,17 +1,240 @@
 """Centered ND FFT subroutines."""
 
-__all__ = ["fftc", "ifftc"]
+__all__ = [
+    "fftc",
+    "ifftc",
+    "fftn",
+    "ifftn",
+    "rfftn",
+    "irfftn",
+    "get_fft_backend",
+    "set_fft_backend",
+    "next_fast_len",
+]
+
+import os
+
+from functools import lru_cache
 
 import numpy as np
 
+VALID_BACKENDS = ["numpy", "scipy", "pyfftw"]
+
+# current configuration (None: read from environment variables)
+_config = {"backend": None, "workers": None}
+
+
+def set_fft_backend(backend: str, workers: int | None = None):
+    """
+    Select the FFT backend used by MR-Twin.
+
+    Parameters
+    ----------
+    backend : str
+        FFT backend. Valid entries are:
+
+        * ``"numpy"``: ``numpy.fft`` (single-threaded).
+        * ``"scipy"``: ``scipy.fft`` (multi-threaded, default).
+        * ``"pyfftw"``: ``pyfftw`` scipy interface, with plan caching
+          (multi-threaded, requires ``pyfftw`` to be installed).
+
+    workers : int | None, optional
+        Number of threads used by multi-threaded backends.
+        Negative values count from the number of available CPUs
+        (i.e., ``-1`` uses all of them). The default is ``None``
+        (keep current value).
+
+    Notes
+    -----
+    Unless this routine is called, backend and number of workers are read
+    from the ``MRTWIN_FFT_BACKEND`` and ``MRTWIN_FFT_WORKERS`` environment
+    variables when a transform is computed. If they are not set, ``scipy``
+    backend is used with a single worker. This is a change with respect to
+    MR-Twin releases before the backend selection was introduced, which always
+    used ``numpy.fft``: results are the same up to floating point round-off,
+    but ``scipy.fft`` computes single precision inputs in single precision.
+
+    Example
+    -------
+    >>> import mrtwin
+
+    We can switch to pyFFTW using 8 threads as:
+
+    >>> mrtwin.set_fft_backend("pyfftw", workers=8)
+
+    """
+    backend = _parse_backend(backend, "FFT backend")
+    if workers is not None:
+        workers = _parse_workers(workers, "workers")
+    if backend == "pyfftw":
+        _get_pyfftw()
+    _config["backend"] = backend
+    if workers is not None:
+        _config["workers"] = workers
+
+
+def get_fft_backend() -> tuple[str, int]:
+    """
+    Get the FFT backend used by MR-Twin.
+
+    Returns
+    -------
+    str
+        FFT backend name.
+    int
+        Number of threads used by multi-threaded backends.
+
+    """
+    backend, workers = _config["backend"], _config["workers"]
+    if backend is None:
+        backend = _parse_backend(
+            os.environ.get("MRTWIN_FFT_BACKEND", "scipy"), "MRTWIN_FFT_BACKEND"
+        )
+    if workers is None:
+        workers = _parse_workers(
+            os.environ.get("MRTWIN_FFT_WORKERS", 1), "MRTWIN_FFT_WORKERS"
+        )
+    return backend, workers
+
+
+def fftn(x, axes=None, s=None, norm=None):  # noqa
+    fft, kwargs = _get_backend()
+    return fft.fftn(x, s=s, axes=axes, norm=norm, **kwargs)
+
+
+def ifftn(x, axes=None, s=None, norm=None):  # noqa
+    fft, kwargs = _get_backend()
+    return fft.ifftn(x, s=s, axes=axes, norm=norm, **kwargs)
+
+
+def rfftn(x, axes=None, s=None, norm=None):  # noqa
+    fft, kwargs = _get_backend()
+    return fft.rfftn(x, s=s, axes=axes, norm=norm, **kwargs)
+
+
+def irfftn(x, axes=None, s=None, norm=None):  # noqa
+    fft, kwargs = _get_backend()
+    return fft.irfftn(x, s=s, axes=axes, norm=norm, **kwargs)
+
+
+def next_fast_len(n: int) -> int:
+    """
+    Get the smallest FFT-friendly (5-smooth) size not smaller than the input.
+
+    Parameters
+    ----------
+    n : int
+        Minimum size.
+
+    Returns
+    -------
+    int
+        Smallest integer ``>= n`` whose prime factors are only 2, 3 and 5.
+
+    """
+    n = max(int(n), 1)
+    while True:
+        m = n
+        for p in (2, 3, 5):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
+
 
 def fftc(x, ax):  # noqa
-    return np.fft.fftshift(
-        np.fft.fftn(np.fft.ifftshift(x, axes=ax), axes=ax, norm=None), axes=ax
-    )
+    return _centered(fftn, x, ax)
 
 
 def ifftc(x, ax):  # noqa
-    return np.fft.fftshift(
-        np.fft.ifftn(np.fft.ifftshift(x, axes=ax), axes=ax, norm=None), axes=ax
-    )
+    return _centered(ifftn, x, ax)
+
+
+# %% local utils
+def _centered(transform, x, ax):
+    ax = [a % x.ndim for a in ax]
+
+    # odd sizes: explicit shifts
+    if any(x.shape[a] % 2 for a in ax):
+        return np.fft.fftshift(
+            transform(np.fft.ifftshift(x, axes=ax), axes=ax), axes=ax
+        )
+
+    # even sizes: shifts are equivalent to (-1)^n modulation
+    # of input and output, up to a global sign (-1)^(N/2)
+    sign = (-1) ** sum(x.shape[a] // 2 for a in ax)
+    y = np.empty(x.shape, dtype=np.result_type(x, np.float32))
+    _modulate(x, ax, sign, out=y)
+    y = transform(y, axes=ax)
+    _modulate(y, ax, 1, out=y)
+
+    return y
+
+
+def _modulate(x, ax, sign, out):
+    # multiply by sign * (-1)^(n0 + n1 + ...) in a single pass:
+    # checkerboard over ax[1:], alternating sign along ax[0]
+    mod = sign * _checkerboard(tuple(x.shape), tuple(ax[1:]))
+    even = [slice(None)] * x.ndim
+    odd = [slice(None)] * x.ndim
+    even[ax[0]] = slice(0, None, 2)
+    odd[ax[0]] = slice(1, None, 2)
+    np.multiply(x[tuple(even)], mod, out=out[tuple(even)])
+    np.multiply(x[tuple(odd)], -mod, out=out[tuple(odd)])
+
+
+@lru_cache(maxsize=16)
+def _checkerboard(shape, axes):
+    mod = np.ones([1] * len(shape), dtype=np.float32)
+    for axis in axes:
+        mod1d = np.ones(shape[axis], dtype=np.float32)
+        mod1d[1::2] = -1
+        mod = mod * mod1d.reshape([-1 if n == axis else 1 for n in range(len(shape))])
+    return mod
+
+
+def _parse_backend(backend, name):
+    if backend not in VALID_BACKENDS:
+        raise ValueError(f"{name} must be one of {VALID_BACKENDS} - found {backend!r}.")
+    return backend
+
+
+def _parse_workers(workers, name):
+    try:
+        value = int(workers)
+    except (TypeError, ValueError):
+        value = 0
+    if value == 0:
+        raise ValueError(
+            f"{name} must be a non-zero integer (negative values count from the"
+            f" number of available CPUs) - found {workers!r}."
+        )
+    return value
+
+
+def _get_backend():
+    backend, workers = get_fft_backend()
+    if backend == "numpy":
+        return np.fft, {}
+    if backend == "scipy":
+        import scipy.fft
+
+        return scipy.fft, {"workers": workers}
+    if backend == "pyfftw":
+        if workers < 0:
+            workers = os.cpu_count() + 1 + workers
+        return _get_pyfftw(), {"workers": workers}
+    raise ValueError(f"FFT backend must be one of {VALID_BACKENDS} - found {backend}.")
+
+
+def _get_pyfftw():
+    try:
+        import pyfftw
+        import pyfftw.interfaces.scipy_fft
+    except ImportError as e:
+        raise ImportError(
+            "pyfftw backend requires pyfftw - install it via 'pip install pyfftw'."
+        ) from e
+    pyfftw.interfaces.cache.enable()
+    return pyfftw.interfaces.scipy_fft
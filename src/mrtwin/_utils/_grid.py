@@ -0,0 +1,105 @@
+"""Cached coordinate grids."""
+
+__all__ = ["coordinate_grid", "kspace_grid"]
+
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+
+def coordinate_grid(
+    shape: Sequence[int], spacing: float | Sequence[float] | None = None
+) -> tuple[np.ndarray, ...]:
+    """
+    Get (cached) image space coordinates.
+
+    Parameters
+    ----------
+    shape : Sequence[int]
+        Grid shape.
+    spacing : float | Sequence[float] | None, optional
+        Grid spacing along each axis. The default is ``None`` (``1.0``).
+
+    Returns
+    -------
+    tuple[np.ndarray, ...]
+        Read-only coordinate vectors ``n * spacing``, ``n = 0, ..., shape - 1``,
+        one for each axis, reshaped to be mutually broadcastable.
+
+    """
+    shape, spacing = _normalize(shape, spacing)
+    return _coordinate_grid(shape, spacing)
+
+
+def kspace_grid(
+    shape: Sequence[int],
+    pshape: Sequence[int] | None = None,
+    spacing: float | Sequence[float] | None = None,
+    real: bool = False,
+) -> tuple[np.ndarray, ...]:
+    """
+    Get (cached) k-space coordinates.
+
+    Coordinates follow the (non-centered) FFT layout.
+
+    Parameters
+    ----------
+    shape : Sequence[int]
+        Image space grid shape. Only used as the default ``pshape``
+        and to validate the length of ``spacing``.
+    pshape : Sequence[int] | None, optional
+        Zero-padded grid shape. The default is ``None`` (no padding).
+    spacing : float | Sequence[float] | None, optional
+        Image space grid spacing along each axis. The default is ``None`` (``1.0``).
+    real : bool, optional
+        If ``True``, last axis follows real-to-complex FFT layout.
+        The default is ``False``.
+
+    Returns
+    -------
+    tuple[np.ndarray, ...]
+        Read-only ``float32`` spatial frequencies (in cycles per ``spacing`` unit),
+        one for each axis, reshaped to be mutually broadcastable.
+
+    """
+    shape, spacing = _normalize(shape, spacing)
+    pshape = shape if pshape is None else tuple(int(n) for n in pshape)
+    return _kspace_grid(pshape, spacing, real)
+
+
+# %% local utils
+def _normalize(shape, spacing):
+    shape = tuple(int(n) for n in shape)
+    if spacing is None:
+        spacing = 1.0
+    if np.isscalar(spacing):
+        spacing = (float(spacing),) * len(shape)
+    spacing = tuple(float(d) for d in spacing)
+    assert len(spacing) == len(shape), ValueError(
+        f"spacing must be a {len(shape)}-length sequence - found {len(spacing)} elements."
+    )
+    return shape, spacing
+
+
+def _broadcastable(vectors):
+    ndim = len(vectors)
+    out = []
+    for n, vec in enumerate(vectors):
+        vec = vec.reshape([-1 if ax == n else 1 for ax in range(ndim)])
+        vec.flags.writeable = False
+        out.append(vec)
+    return tuple(out)
+
+
+@lru_cache(maxsize=32)
+def _coordinate_grid(shape, spacing):
+    return _broadcastable([np.arange(n) * d for n, d in zip(shape, spacing)])
+
+
+@lru_cache(maxsize=32)
+def _kspace_grid(pshape, spacing, real):
+    kgrid = [np.fft.fftfreq(n, d) for n, d in zip(pshape, spacing)]
+    if real:
+        kgrid[-1] = np.fft.rfftfreq(pshape[-1], spacing[-1])
+    return _broadcastable([k.astype(np.float32) for k in kgrid])
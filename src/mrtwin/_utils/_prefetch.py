@@ -0,0 +1,83 @@
+"""Background prefetching of generators."""
+
+__all__ = ["prefetch"]
+
+import queue
+import threading
+
+from typing import Iterable, Iterator
+
+_SENTINEL = object()
+
+
+def prefetch(iterable: Iterable, depth: int = 1) -> Iterator:
+    """
+    Consume an iterable on a background thread.
+
+    Items are produced ahead of the consumer and stored in a bounded
+    queue, so that I/O (e.g., reading a memory-mapped array) overlaps
+    with downstream computation while memory stays bounded by ``depth`` items.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        Input iterable (typically a generator).
+    depth : int, optional
+        Maximum number of items produced ahead of the consumer.
+        If ``depth <= 0``, the iterable is consumed on the calling thread.
+        The default is ``1``.
+
+    Yields
+    ------
+    Any
+        Items of the input iterable, in order.
+
+    """
+    if depth <= 0:
+        yield from iterable
+        return
+
+    buffer = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def _producer():
+        try:
+            for item in iterable:
+                if not _put(buffer, item, stop):
+                    return
+        except BaseException as e:  # propagate to consumer
+            _put(buffer, _Raise(e), stop)
+            return
+        _put(buffer, _SENTINEL, stop)
+
+    worker = threading.Thread(target=_producer, daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _SENTINEL:
+                break
+            if isinstance(item, _Raise):
+                raise item.error
+            yield item
+    finally:
+        # release producer if consumer stops early
+        stop.set()
+        worker.join()
+
+
+# %% local utils
+class _Raise:
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(buffer, item, stop):
+    while not stop.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
@@ -5,9 +5,6 @@ __all__ = ["resample"]
 import numpy as np
 
 
-from scipy.ndimage import zoom
-
-
 from ._broadcasting import _expand_shapes
 
 
@@ -37,4 +34,6 @@ def resample(input, oshape):
     # interpolate
     scale = np.asarray(oshape1) / np.asarray(ishape1)
 
+    from scipy.ndimage import zoom
+
     return zoom(input, scale, order=1)
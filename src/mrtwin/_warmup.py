@@ -0,0 +1,147 @@
+"""Compiled kernels warm-up routines."""
+
+__all__ = ["warmup"]
+
+import os
+import sys
+import time
+import warnings
+
+from typing import Sequence
+
+import numpy as np
+
+# modules defining compiled (numba) kernels
+KERNEL_MODULES = [
+    "mrtwin._misc._rigid_motion",
+    "mrtwin._misc._apply_motion",
+    "mrtwin._shepplogan._segmentation",
+    "mrtwin._fieldmap._birdcage",
+]
+
+
+def warmup(
+    routines: Sequence[str] | None = None,
+    cache_dir: str | os.PathLike | None = None,
+) -> dict[str, float]:
+    """
+    Precompile numba kernels and populate their on-disk cache.
+
+    Each routine is run on a tiny problem, so that its kernels are compiled
+    for the same argument types used in actual simulations and saved to disk.
+    Subsequent processes load the compiled kernels from the cache instead of
+    JIT-compiling them, reducing first-call latency to cache loading time.
+
+    Parameters
+    ----------
+    routines : Sequence[str] | None, optional
+        Routines to be warmed up. Valid entries are
+        ``"rigid_motion"``, ``"apply_motion"``, ``"shepplogan_phantom"``,
+        ``"sensmap"`` and ``"b1field"``.
+        The default is ``None`` (all routines).
+    cache_dir : str | os.PathLike | None, optional
+        Kernels cache directory. Worker processes must use the same directory,
+        by setting the ``NUMBA_CACHE_DIR`` environment variable.
+        It must be set before any of the routines is used in the current process.
+        The default is ``None`` (use ``NUMBA_CACHE_DIR`` if set, otherwise
+        ``__pycache__`` next to mrtwin sources, falling back to a user-wide directory).
+
+    Returns
+    -------
+    dict[str, float]
+        Warm-up time in ``[s]`` of each routine (compilation or cache loading).
+
+    Notes
+    -----
+    The cache is invalidated when mrtwin sources change (e.g., upon upgrade)
+    and compiled code is specific to the CPU model, hence the warm-up
+    should be repeated after each install and on each node type.
+
+    The same warm-up can be performed from command line as:
+
+    .. code-block:: bash
+
+        mrtwin warmup --cache-dir /shared/numba-cache
+
+    Example
+    -------
+    >>> import mrtwin
+
+    Before launching a job array, we can populate a shared cache as:
+
+    >>> mrtwin.warmup(cache_dir="/shared/numba-cache")
+
+    Then, each worker loads the precompiled kernels by running with
+    ``NUMBA_CACHE_DIR=/shared/numba-cache``.
+
+    """
+    if routines is None:
+        routines = list(WARMUP)
+    for routine in routines:
+        assert routine in WARMUP, ValueError(
+            f"routines must be in {list(WARMUP)} - found {routine}."
+        )
+
+    # set cache directory
+    if cache_dir is not None:
+        cache_dir = os.fspath(cache_dir)
+        loaded = [name for name in KERNEL_MODULES if name in sys.modules]
+        if loaded:
+            warnings.warn(
+                f"Kernels in {loaded} were already loaded and will keep their cache directory."
+            )
+        os.environ["NUMBA_CACHE_DIR"] = cache_dir
+        if "numba" in sys.modules:
+            sys.modules["numba"].config.CACHE_DIR = cache_dir
+
+    elapsed = {}
+    for routine in routines:
+        t0 = time.perf_counter()
+        WARMUP[routine]()
+        elapsed[routine] = time.perf_counter() - t0
+
+    return elapsed
+
+
+# %% local utils
+def _rigid_motion():
+    from ._misc import rigid_motion
+
+    rigid_motion(3, 4, ntrajectories=2)
+
+
+def _apply_motion():
+    from ._misc import apply_motion
+
+    # crisp (native and converted) segmentations, fuzzy segmentations and maps
+    motion = ([1.0], [1.0], [1.0])
+    for dtype in (np.uint8, np.int64, np.float32):
+        apply_motion(np.ones((4, 4), dtype=dtype), motion, order=0)
+    apply_motion(np.ones((4, 4), dtype=np.float32), motion, order=1)
+
+
+def _shepplogan_phantom():
+    from ._shepplogan._segmentation import get_shepp_logan
+
+    get_shepp_logan(2, 8, fuzzy=True)
+
+
+def _sensmap():
+    from ._fieldmap import sensmap
+
+    sensmap((2, 4, 4), cache=False)
+
+
+def _b1field():
+    from ._fieldmap import b1field
+
+    b1field((4, 4), cache=False)
+
+
+WARMUP = {
+    "rigid_motion": _rigid_motion,
+    "apply_motion": _apply_motion,
+    "shepplogan_phantom": _shepplogan_phantom,
+    "sensmap": _sensmap,
+    "b1field": _b1field,
+}
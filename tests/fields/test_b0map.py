@@ -124,3 +124,110 @@ def test_b0field_output_units():
     assert np.max(np.abs(b0map_3T)) > np.max(
         np.abs(b0map_1T)
     ), "B0 field with 3T should have larger field values than with 1T."
+
+
+@pytest.mark.parametrize("shape", [(64, 64), (32, 32, 32)])
+@pytest.mark.parametrize("b0range", [None, (-500, 500)])
+def test_b0field_batch(shape, b0range):
+    """
+    Test that batched b0field matches individual calls.
+    """
+    chi = np.random.rand(4, *shape)
+
+    # Call the b0field function on the whole batch
+    b0maps = b0field(chi, b0range=b0range, ndim=len(shape))
+
+    # Validate the output shape
+    assert b0maps.shape == (
+        4,
+        *shape,
+    ), f"Expected shape {(4, *shape)}, but got {b0maps.shape}."
+
+    # Validate against single map computation
+    for n in range(4):
+        np.testing.assert_allclose(
+            b0maps[n], b0field(chi[n], b0range=b0range), rtol=1e-5, atol=1e-3
+        )
+
+
+def test_b0field_orientation():
+    """
+    Test that field orientation along x matches transposed computation along y.
+    """
+    chi = np.random.rand(32, 48)
+
+    # Default orientation is along first axis
+    b0map = b0field(chi)
+    atol = 1e-5 * np.abs(b0map).max()
+    np.testing.assert_allclose(b0map, b0field(chi, B0dir=(2.0, 0.0)), atol=atol)
+
+    # B0 along x on (ny, nx) is B0 along y on (nx, ny)
+    b0map_x = b0field(chi, B0dir=(0.0, 1.0))
+    b0map_t = b0field(np.ascontiguousarray(chi.T)).T
+    np.testing.assert_allclose(b0map_x, b0map_t, atol=atol)
+
+
+@pytest.mark.parametrize("pad", [0.5, 1.0])
+@pytest.mark.parametrize("shape", [(50, 50), (24, 30, 36)])
+def test_b0field_padding(shape, pad):
+    """
+    Test that padded b0field reduces wrap-around with respect to explicit zero-padding.
+    """
+    chi = np.random.rand(*shape)
+    B0dir = np.ones(len(shape))
+
+    b0map = b0field(chi, pad=pad, B0dir=B0dir)
+
+    # Validate the output shape matches the input shape
+    assert b0map.shape == shape, f"Expected shape {shape}, but got {b0map.shape}."
+    assert np.isfinite(b0map).all(), "B0 map should not contain NaNs or Infs."
+
+    # Reference: chi explicitly zero-padded to 4x FOV, then cropped
+    crop = tuple(slice(n) for n in shape)
+    chi_padded = np.zeros([4 * n for n in shape])
+    chi_padded[crop] = chi
+    expected = b0field(chi_padded, B0dir=B0dir)[crop]
+
+    # Compare relative error within 4 voxels from the edges
+    edge = np.ones(shape, dtype=bool)
+    edge[tuple(slice(4, n - 4) for n in shape)] = False
+
+    def _error(b0map):
+        return np.linalg.norm((b0map - expected)[edge]) / np.linalg.norm(expected[edge])
+
+    error = _error(b0map)
+    error_unpadded = _error(b0field(chi, B0dir=B0dir))
+    assert (
+        error < 0.5 * error_unpadded
+    ), f"Padded error {error} should be smaller than unpadded error {error_unpadded}."
+
+
+@pytest.mark.parametrize("shape", [(40, 30), (20, 24, 18)])
+@pytest.mark.parametrize("pad", [0.0, 1.0])
+@pytest.mark.parametrize("b0range", [None, (-500, 500)])
+def test_b0field_blockwise(tmp_path, shape, pad, b0range):
+    """
+    Test that out-of-core b0field on memory-mapped arrays matches in-memory computation.
+    """
+    chi = np.random.rand(*shape).astype(np.float32)
+    mask = chi > 0.3
+
+    # Store input and output on disk
+    np.save(tmp_path / "chi.npy", chi)
+    chi_mmap = np.load(tmp_path / "chi.npy", mmap_mode="r")
+    out = np.lib.format.open_memmap(
+        tmp_path / "b0.npy", mode="w+", dtype=np.float32, shape=shape
+    )
+
+    # Compute in memory and blockwise
+    expected = b0field(chi, b0range=b0range, mask=mask, pad=pad)
+    b0map = b0field(
+        chi_mmap, b0range=b0range, mask=mask, pad=pad, block_size=3, out=out
+    )
+
+    # Validate the output is written in the provided array
+    assert b0map is out, "Output should be written in the provided array."
+
+    # Validate against in-memory computation
+    atol = 1e-5 * np.abs(expected).max()
+    np.testing.assert_allclose(np.asarray(b0map), expected, atol=atol)
@@ -168,3 +168,100 @@ def test_b1field_with_3d_input():
 
     # Validate the output shape matches the input shape
     assert b1map.shape == shape, f"Expected shape {(1, *shape)}, but got {b1map.shape}."
+
+
+@pytest.mark.parametrize("basis", ["polynomial", "fourier"])
+def test_b1field_basis(basis, tmp_path):
+    """
+    Test the basis representation of b1field at different matrix sizes.
+    """
+    shape = (64, 64)
+    b1basis = b1field(shape, coil_width=4.0, basis=basis, degree=8, cache=False)
+    assert b1basis.coeffs.shape == (9, 9), "Unexpected coefficients shape."
+
+    # Validate evaluation at different resolutions
+    # (the Fourier series of the non-periodic field converges slowly at the edges,
+    # hence its fit is validated by RMS error)
+    for size in [64, 128]:
+        expected = b1field((size, size), coil_width=4.0, cache=False)
+        b1map = b1basis((size, size))
+        assert b1map.shape == (size, size), f"Unexpected shape {b1map.shape}."
+        if basis == "polynomial":
+            np.testing.assert_allclose(b1map, expected, atol=1e-4)
+        else:
+            error = np.sqrt(np.mean((b1map - expected) ** 2))
+            assert error < 0.03, f"RMS error {error} exceeds 0.03."
+
+    # Validate caching
+    b1basis = b1field(shape, nmodes=2, basis=basis, cache=True, cache_dir=tmp_path)
+    cached = b1field(shape, nmodes=2, basis=basis, cache=True, cache_dir=tmp_path)
+    np.testing.assert_array_equal(cached.coeffs, b1basis.coeffs)
+    assert cached((32, 32)).shape == (2, 32, 32), "Unexpected multi-mode shape."
+
+
+@pytest.mark.parametrize("basis", ["polynomial", "fourier"])
+def test_b1field_basis_convergence(basis):
+    """
+    Test that the basis fit error decreases with the basis degree.
+    """
+    shape = (64, 64)
+    expected = b1field(shape, coil_width=4.0, cache=False)
+
+    errors = []
+    for degree in [2, 4, 8]:
+        b1basis = b1field(
+            shape, coil_width=4.0, basis=basis, degree=degree, cache=False
+        )
+        errors.append(np.abs(b1basis(shape) - expected).max())
+
+    assert np.all(np.diff(errors) < 0), f"Fit error should decrease, got {errors}."
+    assert errors[-1] < 0.5 * errors[0], f"Fit error should halve, got {errors}."
+
+
+def test_b1field_modes():
+    """
+    Test that selected modes match the corresponding entries of the full output.
+    """
+    shape = (32, 32, 32)
+    b1map = b1field(shape, nmodes=4, ncoils=4, cache=False)
+    b1sel = b1field(shape, nmodes=4, ncoils=4, modes=[1, 3], cache=False)
+
+    assert b1sel.shape == (2,) + shape, f"Unexpected shape {b1sel.shape}."
+    assert b1sel.dtype == np.complex64, "Selected modes should be complex64."
+    np.testing.assert_allclose(b1sel, b1map[[1, 3]], atol=1e-6)
+    assert np.isfinite(b1map).all(), "B1 map should not contain NaN values."
+
+
+def test_b1field_single_mode():
+    """
+    Test that selecting the only mode matches the default single-mode output.
+    """
+    shape = (32, 32)
+    b1map = b1field(shape, cache=False)
+    b1sel = b1field(shape, modes=[0], cache=False)
+
+    assert b1sel.shape == shape, f"Unexpected shape {b1sel.shape}."
+    assert b1sel.dtype == b1map.dtype, f"Unexpected dtype {b1sel.dtype}."
+    np.testing.assert_allclose(b1sel, b1map, rtol=1e-6)
+
+
+def test_b1field_mask_cache(tmp_path):
+    """
+    Test that maps are cached unmasked and masks are applied at read time.
+    """
+    shape = (32, 32)
+    mask1 = np.zeros(shape, dtype=bool)
+    mask1[8:24, 8:24] = True
+    mask2 = np.zeros(shape, dtype=bool)
+    mask2[:, :16] = True
+
+    expected = b1field(shape, cache=False)
+    b1map1 = b1field(shape, mask=mask1, cache=True, cache_dir=tmp_path)
+    b1map2 = b1field(shape, mask=mask2, cache=True, cache_dir=tmp_path)
+    b1map = b1field(shape, cache=True, cache_dir=tmp_path)
+
+    # Validate single cache entry and masking
+    assert len(list(tmp_path.glob("b1map*.npy"))) == 1, "Expected one cache entry."
+    np.testing.assert_allclose(b1map1, mask1 * expected)
+    np.testing.assert_allclose(b1map2, mask2 * expected)
+    np.testing.assert_allclose(b1map, expected)
@@ -0,0 +1,94 @@
+"""Test birdcage coil engine."""
+
+import math
+
+
+import pytest
+
+
+import numpy as np
+import numpy.testing as npt
+
+
+from mrtwin._fieldmap._birdcage import _birdcage_block
+from mrtwin._fieldmap._birdcage import _birdcage_geometry
+from mrtwin._fieldmap._birdcage import _birdcage_rss
+from mrtwin._utils import coordinate_grid
+
+# kernels are compiled with fastmath, hence they are not bit-identical
+# to the NumPy reference: allow float32 round-off
+RTOL = 1e-5
+ATOL = 1e-6
+
+
+@pytest.mark.parametrize(
+    "shape", [(8, 32, 24), (4, 32, 24), (8, 6, 32, 24), (12, 5, 16, 16)]
+)
+@pytest.mark.parametrize("shift", [None, (1.5, -3.0, 2.0)])
+def test_birdcage_block(shape, shift):
+    """
+    Test the birdcage kernel against the dense NumPy implementation.
+    """
+    nrings = max(shape[0] // 4, 1)
+    if shift is not None:
+        shift = shift[-(len(shape) - 1) :]
+    geometry = _birdcage_geometry(shape, 1.5, nrings, shift, 0.3)
+    coords = coordinate_grid(shape[1:])
+
+    # full output
+    smap = _birdcage_block(geometry, np.arange(shape[0]), *coords)
+    expected = _birdcage_dense(shape, 1.5, nrings, shift, 0.3)
+    npt.assert_allclose(smap, expected, rtol=RTOL, atol=ATOL)
+
+    # subset of channels
+    channels = np.asarray([shape[0] - 1, 1])
+    smap = _birdcage_block(geometry, channels, *coords)
+    npt.assert_allclose(smap, expected[channels], rtol=RTOL, atol=ATOL)
+
+    # root sum of squares
+    rss = _birdcage_rss(geometry, *coords)
+    expected = (np.abs(expected) ** 2).sum(axis=0) ** 0.5
+    npt.assert_allclose(rss, expected, rtol=RTOL, atol=ATOL)
+
+
+# %% local utils
+def _birdcage_dense(shape, coil_width, nrings, shift, dphi):
+    # reference implementation (full-size mgrid and float64/complex128 temporaries)
+    if shift is None:
+        shift = [0.0 for ax in range(len(shape) - 1)]
+
+    c_width = coil_width * min(shape[-2:])
+    c_rad = 0.5 * c_width
+
+    if len(shape) == 3:
+        nc, ny, nx = shape
+        phi = np.arange(nc) * (2 * math.pi / nc) + dphi
+        y, x = np.mgrid[:ny, :nx]
+        z, z0 = np.zeros_like(x), np.zeros(nc)
+    else:
+        nc, nz, ny, nx = shape
+        phi = np.arange(nc) * (2 * math.pi / (nc + nrings)) + dphi
+        z, y, x = np.mgrid[:nz, :ny, :nx]
+        z0 = (
+            np.floor(np.arange(nc) / nrings)
+            - 0.5 * (np.ceil(np.arange(nc) / nrings) - 1)
+            + shape[-3] / 2.0
+            + shift[-3]
+        )
+
+    x0 = c_rad * np.cos(phi) + shape[-1] / 2.0 + shift[-1]
+    y0 = c_rad * np.sin(phi) + shape[-2] / 2.0 + shift[-2]
+
+    # broadcast coil centers against spatial grid
+    axes = (slice(None),) + x.ndim * (None,)
+    x_co = x[None, ...] - x0[axes]
+    y_co = y[None, ...] - y0[axes]
+    z_co = z[None, ...] - z0[axes]
+
+    rr = np.sqrt(x_co**2 + y_co**2 + z_co**2) / (2 * c_width)
+    phi = np.arctan2(x_co, -y_co) - phi[axes]
+
+    rr[rr == 0.0] = 1.0
+    smap = (1.0 / rr) * np.exp(1j * phi)
+
+    return smap.astype(np.complex64)
@@ -0,0 +1,71 @@
+"""Test random field maps ensemble generation."""
+
+import pytest
+import numpy as np
+
+from mrtwin import b0field, b1field, field_ensemble, sensmap
+
+
+@pytest.mark.parametrize("shape", [(32, 32), (16, 32, 32)])
+def test_field_ensemble_shapes(shape):
+    """
+    Test that batches have the expected shapes, including the last one.
+    """
+    chi = np.random.rand(*shape).astype(np.float32)
+    batches = list(field_ensemble(shape, 5, chi=chi, ncoils=4, batch_size=2, seed=0))
+
+    # Validate number of batches and their size
+    assert len(batches) == 3, f"Expected 3 batches, but got {len(batches)}."
+    for batch, size in zip(batches, [2, 2, 1]):
+        assert batch["B0"].shape == (size,) + shape, "Unexpected B0 batch shape."
+        assert batch["B1"].shape == (size,) + shape, "Unexpected B1 batch shape."
+        assert batch["smap"].shape == (size, 4) + shape, "Unexpected smap shape."
+        assert batch["params"]["b1_shift"].shape == (size, len(shape))
+
+
+def test_field_ensemble_samples():
+    """
+    Test that ensemble samples match the individual field generators.
+    """
+    shape = (32, 32)
+    chi = np.random.rand(*shape).astype(np.float32)
+    batch = next(field_ensemble(shape, 2, chi=chi, ncoils=4, batch_size=2, seed=0))
+    params = batch["params"]
+
+    for n in range(2):
+        expected = b0field(params["chi_scale"][n].astype(np.float32) * chi)
+        np.testing.assert_allclose(batch["B0"][n], expected, rtol=1e-4, atol=1e-2)
+
+        expected = b1field(
+            shape,
+            b1range=tuple(params["b1range"][n]),
+            shift=tuple(params["b1_shift"][n]),
+            dphi=params["b1_dphi"][n],
+            coil_width=params["b1_width"][n],
+            cache=False,
+        )
+        np.testing.assert_allclose(batch["B1"][n], expected, rtol=1e-6)
+
+        expected = sensmap(
+            (4,) + shape,
+            shift=tuple(params["coil_shift"][n]),
+            dphi=params["coil_dphi"][n],
+            coil_width=params["coil_width"][n],
+            cache=False,
+        )
+        np.testing.assert_allclose(batch["smap"][n], expected, rtol=1e-6)
+
+
+def test_field_ensemble_reproducible():
+    """
+    Test that sampled configurations depend on the seed, not on batching or prefetching.
+    """
+    shape = (32, 32)
+    ref = list(field_ensemble(shape, 4, ncoils=4, seed=1))
+    out = list(field_ensemble(shape, 4, ncoils=4, batch_size=3, seed=1, prefetch=2))
+    for key in ("B1", "smap"):
+        np.testing.assert_allclose(
+            np.concatenate([b[key] for b in out]),
+            np.concatenate([b[key] for b in ref]),
+            rtol=1e-6,
+        )
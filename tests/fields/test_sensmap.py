@@ -103,3 +103,119 @@ def test_sensmap_default():
 
     # Validate the output contains complex numbers
     assert np.iscomplexobj(smap), "Sensmap output should be a complex numpy array."
+
+
+@pytest.mark.parametrize("shape", [(8, 64, 64), (8, 16, 32, 32)])
+def test_sensmap_lazy(shape):
+    """
+    Test that lazy sensitivity maps match the dense ones for any block.
+    """
+    expected = sensmap(shape, shift=[2] * (len(shape) - 1), cache=False)
+    smap = sensmap(shape, shift=[2] * (len(shape) - 1), lazy=True)
+
+    # Validate shape and full evaluation
+    assert smap.shape == shape, f"Expected shape {shape}, but got {smap.shape}."
+    np.testing.assert_allclose(np.asarray(smap), expected, rtol=1e-5, atol=1e-6)
+
+    # Validate channel / slab blocks
+    for idx in [
+        0,
+        (slice(2, 5), 3),
+        ([0, 3], Ellipsis, slice(None, None, 2)),
+        (-1, -1),
+    ]:
+        np.testing.assert_allclose(smap[idx], expected[idx], rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("nvcoils, energy", [(4, None), (None, 0.95), (None, 0.999)])
+def test_sensmap_compression(nvcoils, energy, tmp_path):
+    """
+    Test SVD coil compression to a target number of coils or energy.
+    """
+    shape = (16, 8, 32, 32)
+    expected = sensmap(shape, cache=False)
+    smap = sensmap(shape, nvcoils=nvcoils, energy=energy, cache_dir=tmp_path)
+
+    # Validate number of virtual coils
+    assert smap.shape[1:] == shape[1:], "Spatial shape should be preserved."
+    if nvcoils is not None:
+        assert smap.shape[0] == nvcoils, f"Expected {nvcoils} virtual coils."
+    else:
+        ratio = np.linalg.norm(smap) ** 2 / np.linalg.norm(expected) ** 2
+        assert ratio >= energy, f"Retained energy {ratio} below target {energy}."
+
+    # Validate caching
+    cached = sensmap(shape, nvcoils=nvcoils, energy=energy, cache_dir=tmp_path)
+    np.testing.assert_array_equal(cached, smap)
+
+
+def test_sensmap_lowrank():
+    """
+    Test low-rank factorized sensitivity maps.
+    """
+    shape = (16, 8, 32, 32)
+    expected = sensmap(shape, cache=False)
+
+    # Full rank factorization is exact
+    smap = sensmap(shape, lowrank=True, cache=False)
+    assert smap.shape == shape, f"Expected shape {shape}, but got {smap.shape}."
+    assert smap.rank == shape[0], "Default factorization should be full rank."
+    np.testing.assert_allclose(np.asarray(smap), expected, atol=1e-5)
+    np.testing.assert_allclose(smap[2:4, ..., 3], expected[2:4, ..., 3], atol=1e-5)
+
+    # Truncated factorization
+    smap = sensmap(shape, nvcoils=6, lowrank=True, cache=False)
+    assert smap.basis.shape == (6,) + shape[1:], "Unexpected basis shape."
+    assert smap.weights.shape == (16, 6), "Unexpected weights shape."
+    assert smap[3].shape == shape[1:], "Unexpected channel shape."
+
+
+@pytest.mark.parametrize(
+    "idx",
+    [
+        (slice(None), [0, 2, 5], [0, 2, 5]),
+        ([1, 3], 4, [0, 7]),
+        (Ellipsis, [6, 1]),
+        (2, slice(1, 6, 2), [True] * 4 + [False] * 4),
+    ],
+)
+def test_sensmap_lowrank_indexing(idx):
+    """
+    Test that low-rank maps use the same outer indexing as lazy maps.
+    """
+    shape = (4, 8, 8)
+    lazy = sensmap(shape, lazy=True)
+    lowrank = sensmap(shape, lowrank=True, nvcoils=4, cache=False)
+
+    expected = lazy[idx]
+    actual = lowrank[idx]
+    assert actual.shape == expected.shape, "Indexing mismatch."
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+def test_sensmap_lazy_compression():
+    """
+    Test that lazy compressed maps are returned in low-rank form.
+    """
+    smap = sensmap((8, 16, 16), lazy=True, nvcoils=4, cache=False)
+    assert smap.rank == 4 and smap.shape == (8, 16, 16)
+
+    with pytest.raises(AssertionError):
+        sensmap((8, 16, 16), lazy=True, basis="polynomial", cache=False)
+
+
+@pytest.mark.parametrize("nvcoils", [None, 4])
+def test_sensmap_basis(nvcoils):
+    """
+    Test the basis representation of sensitivity maps.
+    """
+    shape = (8, 64, 64)
+    smap = sensmap(shape, basis="polynomial", degree=12, nvcoils=nvcoils, cache=False)
+    nc = nvcoils or shape[0]
+    assert smap.coeffs.shape == (nc, 13, 13), "Unexpected coefficients shape."
+
+    # Validate evaluation at different resolutions
+    # (virtual coils are only defined up to a phase, hence native size only)
+    for size in [64, 128] if nvcoils is None else [64]:
+        expected = sensmap((8, size, size), nvcoils=nvcoils, cache=False)
+        np.testing.assert_allclose(smap((size, size)), expected, atol=1e-3)
@@ -0,0 +1,88 @@
+"""Test rigid motion application."""
+
+import pytest
+import numpy as np
+
+from scipy.ndimage import affine_transform
+
+from mrtwin import rigid_motion, apply_motion
+from mrtwin._misc._apply_motion import _inverse_affine
+from mrtwin._misc._rigid_motion import _motion_params
+
+
+def _reference(image, motion, order):
+    ndim, angles, shifts = _motion_params(motion)
+    matrix, offset = _inverse_affine(image.shape, angles, shifts)
+    image = image.reshape((1,) * (3 - ndim) + image.shape).astype(np.float64)
+    out = [
+        affine_transform(
+            image, M, offset=o, order=order, mode="grid-constant", cval=0.0
+        )
+        for M, o in zip(matrix, offset)
+    ]
+    return np.stack(out).reshape(-1, *image.shape[3 - ndim :])
+
+
+@pytest.mark.parametrize("shape", [(24, 28), (12, 24, 28)])
+def test_apply_motion_linear(shape):
+    """
+    Test that linear interpolation matches scipy.ndimage.affine_transform.
+    """
+    image = np.random.default_rng(42).random(shape).astype(np.float32)
+    motion = rigid_motion(len(shape), 10, degree="severe", seed=42)
+
+    output = apply_motion(image, motion)
+    expected = _reference(image, motion, order=1)
+
+    assert output.shape == (10, *shape)
+    assert output.dtype == np.float32
+    np.testing.assert_allclose(output, expected, atol=1e-5)
+
+
+def test_apply_motion_nearest():
+    """
+    Test that nearest neighbour interpolation preserves labels and dtype.
+    """
+    image = np.random.default_rng(42).integers(0, 10, size=(12, 24, 28))
+    image = image.astype(np.uint8)
+    motion = rigid_motion(3, 10, degree="severe", seed=42)
+
+    output = apply_motion(image, motion, order=0)
+
+    assert output.dtype == np.uint8
+    assert set(np.unique(output)).issubset(set(np.unique(image)) | {0})
+
+
+def test_apply_motion_static():
+    """
+    Test that frames without motion are equal to the input image.
+    """
+    image = np.random.default_rng(42).random((24, 28)).astype(np.float32)
+    motion = [np.zeros(5), np.zeros(5), np.zeros(5)]
+
+    output = apply_motion(image, motion)
+
+    for frame in output:
+        np.testing.assert_array_equal(frame, image)
+
+
+def test_apply_motion_batch():
+    """
+    Test that batched output matches full output for multi-channel and complex images.
+    """
+    rng = np.random.default_rng(42)
+    image = rng.random((2, 12, 24, 28)) + 1j * rng.random((2, 12, 24, 28))
+    motion = rigid_motion(3, 10, degree="moderate", seed=42)
+
+    output = apply_motion(image, motion, resolution=(2.0, 1.0, 1.0))
+    batches = list(
+        apply_motion(image, motion, resolution=(2.0, 1.0, 1.0), batch_size=4)
+    )
+
+    assert output.dtype == np.complex64
+    assert [batch.shape[0] for batch in batches] == [4, 4, 2]
+    np.testing.assert_array_equal(np.concatenate(batches), output)
+
+    # real and imaginary part are moved independently
+    real = apply_motion(image.real[0], motion, resolution=(2.0, 1.0, 1.0))
+    np.testing.assert_allclose(output[:, 0].real, real, atol=1e-6)
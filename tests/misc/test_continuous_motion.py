@@ -0,0 +1,96 @@
+"""Test continuous-time rigid motion pattern generation."""
+
+import pytest
+import numpy as np
+
+from mrtwin import continuous_motion
+
+
+@pytest.mark.parametrize("ndim, nparams", [(2, 3), (3, 6)])
+def test_continuous_motion_shape(ndim, nparams):
+    """
+    Test output format for single and multiple subjects.
+    """
+    times = np.arange(1000) * 10e-3
+
+    params = continuous_motion(ndim, times)
+    assert len(params) == nparams
+    for param in params:
+        assert param.shape == (1000,)
+        assert param.dtype == np.float32
+
+    params = continuous_motion(ndim, times, nsubjects=4)
+    assert params.shape == (4, nparams, 1000)
+    assert not np.array_equal(params[0], params[1])
+
+
+def test_continuous_motion_seed():
+    """
+    Test that the random seed produces reproducible results.
+    """
+    times = np.arange(1000) * 10e-3
+
+    params1 = continuous_motion(3, times, nsubjects=2, seed=42)
+    params2 = continuous_motion(3, times, nsubjects=2, seed=np.random.default_rng(42))
+
+    np.testing.assert_array_equal(params1, params2)
+
+
+def test_continuous_motion_sampling():
+    """
+    Test that the motion pattern does not depend on the sampling density.
+    """
+    tr = np.linspace(0.0, 10.0, 11)
+    readout = np.linspace(0.0, 10.0, 1001)
+
+    params1 = continuous_motion(3, tr, nsubjects=2)
+    params2 = continuous_motion(3, readout, nsubjects=2)
+
+    np.testing.assert_allclose(params1, params2[..., ::100], atol=1e-5)
+
+
+def test_continuous_motion_drift():
+    """
+    Test drift stationary standard deviation.
+    """
+    times = np.arange(1000) * 0.1
+    params = continuous_motion(
+        3,
+        times,
+        nsubjects=200,
+        drift=(2.0, 1.0),
+        drift_time=1.0,
+        respiration=(0.0, 0.0),
+        cardiac=(0.0, 0.0),
+        jerk_rate=0.0,
+    )
+
+    np.testing.assert_allclose(params[:, :3].std(), 2.0, rtol=0.05)
+    np.testing.assert_allclose(params[:, 3:].std(), 1.0, rtol=0.05)
+
+
+def test_continuous_motion_physio():
+    """
+    Test amplitude and periodicity of respiratory motion.
+    """
+    times = np.arange(6000) * 0.01
+    params = continuous_motion(
+        3,
+        times,
+        nsubjects=10,
+        drift=(0.0, 0.0),
+        respiration=(1.0, 2.0),
+        respiration_rate=12.0,
+        cardiac=(0.0, 0.0),
+        jerk_rate=0.0,
+    )
+
+    # amplitude (rotation axis and translation direction are unit vectors)
+    assert np.linalg.norm(params[:, :3], axis=1).max() <= 1.0 + 1e-5
+    assert np.linalg.norm(params[:, 3:], axis=1).max() <= 2.0 + 1e-5
+
+    # dominant frequency within 10% of respiration rate
+    spectrum = np.abs(np.fft.rfft(params[:, 3], axis=-1))
+    freqs = np.fft.rfftfreq(times.size, 0.01)
+    peak = freqs[spectrum[:, 1:].argmax(axis=-1) + 1]
+    assert np.all(np.abs(peak - 0.2) <= 0.02 + 1 / 60.0)
@@ -0,0 +1,74 @@
+"""Test FFT backend selection."""
+
+import pytest
+import numpy as np
+
+from mrtwin import set_fft_backend
+from mrtwin._utils import fftc, ifftc, get_fft_backend
+from mrtwin._utils import _fft
+
+
+def _reference_fftc(x, ax):
+    return np.fft.fftshift(np.fft.fftn(np.fft.ifftshift(x, axes=ax), axes=ax), axes=ax)
+
+
+def _reference_ifftc(x, ax):
+    return np.fft.fftshift(np.fft.ifftn(np.fft.ifftshift(x, axes=ax), axes=ax), axes=ax)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "scipy"])
+@pytest.mark.parametrize("shape", [(16, 16), (15, 16), (4, 8, 10)])
+def test_centered_fft(backend, shape):
+    """
+    Test centered FFT against explicit shift implementation for each backend.
+    """
+    default = get_fft_backend()
+    set_fft_backend(backend)
+    try:
+        x = np.random.rand(*shape) + 1j * np.random.rand(*shape)
+        ax = (-2, -1)
+        np.testing.assert_allclose(fftc(x, ax), _reference_fftc(x, ax), atol=1e-8)
+        np.testing.assert_allclose(ifftc(x, ax), _reference_ifftc(x, ax), atol=1e-8)
+    finally:
+        set_fft_backend(*default)
+
+
+def test_invalid_backend():
+    """
+    Test that invalid backends are rejected.
+    """
+    with pytest.raises(ValueError):
+        set_fft_backend("cufft")
+
+
+def test_backend_environment(monkeypatch):
+    """
+    Test that environment variables are read at call time and validated.
+    """
+    monkeypatch.setitem(_fft._config, "backend", None)
+    monkeypatch.setitem(_fft._config, "workers", None)
+
+    # Default: scipy with a single worker
+    monkeypatch.delenv("MRTWIN_FFT_BACKEND", raising=False)
+    monkeypatch.delenv("MRTWIN_FFT_WORKERS", raising=False)
+    assert get_fft_backend() == ("scipy", 1)
+
+    monkeypatch.setenv("MRTWIN_FFT_BACKEND", "numpy")
+    monkeypatch.setenv("MRTWIN_FFT_WORKERS", "-1")
+    assert get_fft_backend() == ("numpy", -1)
+
+    # Invalid values are reported when used, not at import time
+    x = np.random.rand(8, 8)
+    monkeypatch.setenv("MRTWIN_FFT_WORKERS", "all")
+    with pytest.raises(ValueError, match="MRTWIN_FFT_WORKERS"):
+        fftc(x, (-2, -1))
+    monkeypatch.setenv("MRTWIN_FFT_WORKERS", "2")
+    monkeypatch.setenv("MRTWIN_FFT_BACKEND", "fftw")
+    with pytest.raises(ValueError, match="MRTWIN_FFT_BACKEND"):
+        fftc(x, (-2, -1))
+
+    # Explicit selection overrides environment variables
+    set_fft_backend("scipy", workers=2)
+    assert get_fft_backend() == ("scipy", 2)
+    with pytest.raises(ValueError, match="workers"):
+        set_fft_backend("scipy", workers=0)
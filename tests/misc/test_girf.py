@@ -3,7 +3,7 @@
 import pytest
 import numpy as np
 
-from mrtwin import generate_girf
+from mrtwin import generate_girf, apply_girf, stream_girf, predict_trajectory
 
 
 @pytest.mark.parametrize(
@@ -76,3 +76,98 @@ def test_generate_girf_single_axis_behavior():
     assert np.allclose(
         girf[1], girf[2]
     ), "GIRF for all axes should be identical when FWHM and delay are identical."
+
+
+def test_generate_girf_batch():
+    """
+    Test batched GIRF generation against individual settings.
+    """
+    dt, N = 4e-6, 25000
+    fwhm = np.asarray([[5.0e3, 5.0e3, 6.0e3], [7.0e3, 8.0e3, 9.0e3]])
+    delay = np.asarray([[1e-6, 1e-6, 2e-6], [0.5e-6, 0.2e-6, 0.3e-6]])
+
+    _, girf = generate_girf(dt, N, fwhm, delay)
+    assert girf.shape == (2, 3, N), f"Expected shape (2, 3, {N}), got {girf.shape}."
+    assert girf.dtype == np.complex64, "GIRF should be complex64."
+    for n in range(2):
+        np.testing.assert_allclose(girf[n], generate_girf(dt, N, fwhm[n], delay[n])[1])
+
+
+def _waveforms(ninterleaves=4, nt=400):
+    grad = np.zeros((ninterleaves, 3, nt), dtype=np.float32)
+    grad[..., 100:200] = np.hanning(100)
+    return grad
+
+
+def test_apply_girf_delay():
+    """
+    Test that an (ideal bandwidth) GIRF with integer delay shifts the waveforms.
+    """
+    dt = 4e-6
+    grad = _waveforms()
+    out = apply_girf(grad, dt, 1e9, 2 * dt)
+
+    assert out.shape == grad.shape, f"Expected shape {grad.shape}, got {out.shape}."
+    np.testing.assert_allclose(out[..., 2:], grad[..., :-2], atol=1e-5)
+
+
+def test_apply_girf_batch():
+    """
+    Test applying a batch of GIRF settings to a batch of waveforms.
+    """
+    dt = 4e-6
+    grad = _waveforms()
+    delay = np.asarray([[0.0] * 3, [dt] * 3, [2 * dt] * 3])
+    out = apply_girf(grad, dt, 5.0e3, delay)
+
+    assert out.shape == (3,) + grad.shape, f"Unexpected shape {out.shape}."
+    for n in range(3):
+        np.testing.assert_allclose(out[n], apply_girf(grad, dt, 5.0e3, delay[n]))
+
+
+def test_predict_trajectory():
+    """
+    Test predicted trajectory for an ideal gradient system.
+    """
+    dt, gamma = 4e-6, 42.58e6
+    grad = 1e-3 * _waveforms()
+    traj = predict_trajectory(grad, dt, 1e9, 0.0, gamma=gamma)
+    expected = gamma * dt * np.cumsum(grad, axis=-1)
+    np.testing.assert_allclose(traj, expected, rtol=1e-4, atol=1e-4)
+
+
+@pytest.mark.parametrize("block_size", [64, 333, 5000])
+def test_apply_girf_blockwise(block_size, tmp_path):
+    """
+    Test overlap-add filtering of memory-mapped waveforms against a single FFT.
+    """
+    dt = 4e-6
+    grad = np.zeros((2, 3, 5000), dtype=np.float32)
+    grad[..., 500:4500] = np.random.rand(2, 3, 4000)
+    expected = apply_girf(grad, dt, 5.0e3, 1.3e-6)
+
+    # memory-mapped input and output
+    np.save(tmp_path / "grad.npy", grad)
+    grad = np.load(tmp_path / "grad.npy", mmap_mode="r")
+    out = np.lib.format.open_memmap(tmp_path / "out.npy", "w+", np.float32, grad.shape)
+    out = apply_girf(grad, dt, 5.0e3, 1.3e-6, block_size=block_size, out=out)
+    np.testing.assert_allclose(out, expected, atol=1e-5)
+
+
+def test_stream_girf_chunks():
+    """
+    Test that streamed filtering preserves chunk sizes for irregular chunks.
+    """
+    dt = 4e-6
+    grad = np.zeros((3, 5000), dtype=np.float32)
+    grad[:, 500:4500] = np.random.rand(3, 4000)
+    delay = np.asarray([[1e-6] * 3, [2e-6] * 3])
+    expected = apply_girf(grad, dt, 5.0e3, delay)
+
+    sizes = [100, 3, 997, 2000, 1900]
+    edges = np.cumsum([0] + sizes)
+    chunks = (grad[:, start:stop] for start, stop in zip(edges[:-1], edges[1:]))
+    out = list(stream_girf(chunks, dt, 5.0e3, delay))
+
+    assert [chunk.shape for chunk in out] == [(2, 3, size) for size in sizes]
+    np.testing.assert_allclose(np.concatenate(out, axis=-1), expected, atol=1e-5)
@@ -0,0 +1,37 @@
+"""Test cached coordinate grids."""
+
+import pytest
+import numpy as np
+
+from mrtwin._utils import coordinate_grid, kspace_grid
+
+
+@pytest.mark.parametrize("shape", [(16,), (8, 12), (4, 6, 10)])
+def test_coordinate_grid(shape):
+    """
+    Test coordinate grids against meshgrid and check they are reused.
+    """
+    grid = coordinate_grid(shape, spacing=0.5)
+    expected = np.meshgrid(*[0.5 * np.arange(n) for n in shape], indexing="ij")
+    for coord, ref in zip(grid, expected):
+        np.testing.assert_allclose(np.broadcast_to(coord, shape), ref)
+        assert not coord.flags.writeable, "Cached grids should be read-only."
+
+    # Same object returned for equivalent keys
+    assert coordinate_grid(list(shape), [0.5] * len(shape)) is grid
+
+
+@pytest.mark.parametrize("real", [False, True])
+def test_kspace_grid(real):
+    """
+    Test k-space grids against explicit construction.
+    """
+    shape, pshape = (8, 12), (16, 18)
+    grid = kspace_grid(shape, pshape, spacing=(2.0, 1.0), real=real)
+    ky = np.fft.fftfreq(16, 2.0)
+    kx = np.fft.rfftfreq(18, 1.0) if real else np.fft.fftfreq(18, 1.0)
+    np.testing.assert_allclose(grid[0].ravel(), ky)
+    np.testing.assert_allclose(grid[1].ravel(), kx)
+
+    # Same object returned for equivalent keys
+    assert kspace_grid(shape, pshape, (2.0, 1.0), real) is grid
@@ -0,0 +1,48 @@
+"""Test lazy loading of mrtwin routines."""
+
+import subprocess
+import sys
+
+
+import pytest
+
+HEAVY_MODULES = ["numba", "scipy", "brainweb_dl", "requests", "nibabel", "osfclient"]
+
+
+def _loaded_modules(statement):
+    script = f"import sys\n{statement}\nprint(','.join(sorted(sys.modules)))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    return output.stdout.splitlines()[-1].split(",")
+
+
+@pytest.mark.parametrize(
+    "statement, allowed",
+    [
+        ("import mrtwin", []),
+        ("from mrtwin import b0field", []),
+        ("from mrtwin import continuous_motion", []),
+        ("from mrtwin import rigid_motion", ["numba", "scipy"]),
+    ],
+)
+def test_lazy_import(statement, allowed):
+    """
+    Test that heavy dependencies are imported only by the features that need them.
+    """
+    modules = _loaded_modules(statement)
+    for name in set(HEAVY_MODULES) - set(allowed):
+        assert name not in modules, f"{statement!r} imports {name}"
+
+
+def test_lazy_attributes():
+    """
+    Test lazy access to public routines.
+    """
+    import mrtwin
+
+    assert set(mrtwin.__all__) <= set(dir(mrtwin))
+    for name in mrtwin.__all__:
+        assert callable(getattr(mrtwin, name))
+    with pytest.raises(AttributeError):
+        mrtwin.not_a_routine
@@ -0,0 +1,76 @@
+"""Test k-space rigid motion."""
+
+import pytest
+import numpy as np
+
+from mrtwin import rigid_motion, apply_motion, kspace_motion
+
+
+def _dft(image, coords):
+    # non-uniform DFT of an image with 1 mm voxels centered at n // 2
+    grid = np.meshgrid(*[np.arange(n) - n // 2 for n in image.shape], indexing="ij")
+    grid = 1e-3 * np.stack([g.ravel() for g in grid])
+    return np.exp(-2j * np.pi * coords.T @ grid) @ image.ravel()
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_kspace_motion_consistency(ndim):
+    """
+    Test that k-space motion matches image space motion (exact 90 deg rotations).
+    """
+    rng = np.random.default_rng(42)
+    image = np.zeros((12,) * ndim)
+    image[(slice(3, 9),) * ndim] = rng.random((6,) * ndim)
+    if ndim == 2:
+        motion = [
+            np.asarray([0.0, 90.0]),
+            np.asarray([2.0, 0.0]),
+            np.asarray([-1.0, 1.0]),
+        ]
+    else:
+        motion = [
+            np.asarray([90.0, 0.0]),
+            np.asarray([0.0, 0.0]),
+            np.asarray([0.0, 90.0]),
+            np.asarray([1.0, 0.0]),
+            np.asarray([2.0, -1.0]),
+            np.asarray([0.0, 1.0]),
+        ]
+    coords = rng.uniform(-400.0, 400.0, size=(2, ndim, 32))
+
+    moved = apply_motion(image, motion)
+    rotated, phase = kspace_motion(coords, motion)
+
+    for n in range(2):
+        expected = _dft(moved[n], coords[n])
+        output = _dft(image, rotated[n].astype(np.float64)) * phase[n]
+        np.testing.assert_allclose(output, expected, atol=1e-4 * np.abs(expected).max())
+
+
+def test_kspace_motion_shapes():
+    """
+    Test output shapes, shared coordinates and data argument.
+    """
+    motion = rigid_motion(3, 10, degree="severe")
+    coords = np.random.default_rng(42).normal(size=(3, 64)) * 100.0
+
+    rotated, phase = kspace_motion(coords, motion)
+    assert rotated.shape == (10, 3, 64)
+    assert rotated.dtype == np.float32
+    assert phase.shape == (10, 64)
+    assert phase.dtype == np.complex64
+    np.testing.assert_allclose(np.abs(phase), 1.0, rtol=1e-6)
+
+    # rotation preserves k-space radius
+    np.testing.assert_allclose(
+        np.linalg.norm(rotated, axis=-2),
+        np.broadcast_to(np.linalg.norm(coords, axis=-2), (10, 64)),
+        rtol=1e-5,
+    )
+
+    # intermediate axes and data
+    coords = np.broadcast_to(coords, (10, 4, 3, 64))
+    data = np.ones((10, 4, 64), dtype=np.complex64)
+    _rotated, corrupted = kspace_motion(coords, motion, data=data)
+    assert _rotated.shape == (10, 4, 3, 64)
+    np.testing.assert_allclose(corrupted[:, 0], phase, rtol=1e-5)
@@ -147,3 +147,38 @@ def test_rigid_motion_dimensions(ndim, nframes):
     assert (
         len(translations) == ndim
     ), f"Expected {ndim} translations, but got {len(translations)}."
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_rigid_motion_batch(ndim):
+    """
+    Test batched generation of independent motion trajectories.
+    """
+    params = rigid_motion(ndim, 50, degree="severe", ntrajectories=8, seed=42)
+
+    nparams = 3 if ndim == 2 else 6
+    assert params.shape == (8, nparams, 50)
+    assert np.abs(params[:, : nparams // 2]).max() <= 16.0
+    assert np.abs(params[:, nparams // 2 :]).max() <= 16.0
+
+    # trajectories are independent
+    assert not np.array_equal(params[0], params[1])
+
+    # reproducible
+    np.testing.assert_array_equal(
+        params, rigid_motion(ndim, 50, degree="severe", ntrajectories=8, seed=42)
+    )
+
+
+def test_rigid_motion_generator():
+    """
+    Test that an explicit generator is used and global random state is untouched.
+    """
+    state = np.random.get_state()[1].copy()
+
+    params1 = rigid_motion(3, 50, seed=np.random.default_rng(42))
+    params2 = rigid_motion(3, 50, seed=42)
+
+    for p1, p2 in zip(params1, params2):
+        np.testing.assert_array_equal(p1, p2)
+    np.testing.assert_array_equal(np.random.get_state()[1], state)
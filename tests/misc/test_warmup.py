@@ -0,0 +1,59 @@
+"""Test compiled kernels warm-up."""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+
+import pytest
+
+
+def _run(*args, env=None):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    )
+
+
+def test_warmup():
+    """
+    Test that warm-up populates the cache used by worker processes.
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        output = _run(
+            "-m", "mrtwin", "warmup", "rigid_motion", "--cache-dir", cache_dir
+        )
+        assert output.returncode == 0, output.stderr
+        assert "rigid_motion" in output.stdout
+        assert os.listdir(cache_dir), "Kernels cache should not be empty."
+
+        # worker process loads kernels from cache
+        script = (
+            "from mrtwin import rigid_motion\n"
+            "from mrtwin._misc._rigid_motion import _generate_series\n"
+            "rigid_motion(3, 100)\n"
+            "print(sum(_generate_series.stats.cache_hits.values()))\n"
+            "print(sum(_generate_series.stats.cache_misses.values()))\n"
+        )
+        output = _run("-c", script, env={"NUMBA_CACHE_DIR": cache_dir})
+        assert output.returncode == 0, output.stderr
+        hits, misses = output.stdout.split()
+        assert int(hits) == 1
+        assert int(misses) == 0
+
+
+def test_warmup_invalid():
+    """
+    Test warm-up error for unknown routines.
+    """
+    from mrtwin import warmup
+
+    with pytest.raises(AssertionError):
+        warmup(["not_a_routine"])
+
+    output = _run("-m", "mrtwin", "warmup", "not_a_routine")
+    assert output.returncode != 0
+    assert "invalid routines" in output.stderr
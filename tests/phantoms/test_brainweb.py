@@ -7,10 +7,15 @@ import tempfile
 import pytest
 
 
+import numpy as np
 import numpy.testing as npt
 
 
+import brainweb_dl
+
+
 from mrtwin import brainweb_phantom
+from mrtwin._brainweb import _segmentation
 
 
 @pytest.mark.parametrize("ndim", [2, 3])
@@ -66,3 +71,33 @@ def test_brainweb_phantom_default():
 
     # Validate the default shape for 2D phantom (since no shape was provided)
     assert phantom.shape[-2:] == (200, 200)
+
+
+def test_brainweb_fuzzy_download(tmp_path, monkeypatch):
+    """
+    Test that fuzzy segmentation download does not patch brainweb-dl and is cached.
+    """
+    shape = (4, 5, 6)
+    original = brainweb_dl._brainweb._request_get_brainweb
+    commands = []
+
+    def _request_get_brainweb(download_command, path, force, dtype, shape):
+        assert brainweb_dl._brainweb._request_get_brainweb is original
+        commands.append(download_command)
+        return np.full(shape, 4095 * len(commands) // 16, dtype=dtype)
+
+    monkeypatch.setattr(_segmentation, "BIG_RES_SHAPE", shape)
+    monkeypatch.setattr(_segmentation, "_request_get_brainweb", _request_get_brainweb)
+
+    # Download each tissue class and store the 4D volume
+    data = _segmentation._get_brainweb20_fuzzy(4, tmp_path, False)
+    assert data.shape == shape + (len(commands),)
+    assert commands[0] == "subject04_bck", f"Unexpected command {commands[0]}."
+    assert (tmp_path / "brainweb_s04_fuzzy.nii.gz").exists()
+
+    # Reload from cache without downloading
+    ndownloads = len(commands)
+    cached = _segmentation._get_brainweb20_fuzzy(4, tmp_path, False)
+    assert len(commands) == ndownloads, "Cached segmentation should not be downloaded."
+    npt.assert_allclose(cached, data)
+    npt.assert_allclose(data[..., 0], (4095 // 16) / 4095)
@@ -0,0 +1,173 @@
+"""Test memory-mapped database phantoms on local cache files."""
+
+import os
+import tempfile
+
+
+import pytest
+
+
+import numpy as np
+import numpy.testing as npt
+
+
+from mrtwin import brainweb_phantom
+from mrtwin import osf_phantom
+
+from mrtwin import _build
+from mrtwin import _classes
+from mrtwin._brainweb._brainweb import CrispBrainwebPhantom
+from mrtwin._brainweb._brainweb import FuzzyBrainwebPhantom
+from mrtwin._brainweb._brainweb import NumericBrainwebPhantom
+from mrtwin._osf._osf import NumericOSFPhantom
+
+SHAPE = 8
+SUBJECT = 1
+
+
+@pytest.fixture
+def cache_dir():
+    """
+    Temporary cache directory.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+def test_osf_phantom_mmap(cache_dir, ndim):
+    """
+    Test that mmap=True OSF phantom matches the in-memory one.
+    """
+    rng = np.random.default_rng(42)
+    maps = rng.uniform(1.0, 100.0, size=(5,) + ndim * (SHAPE,)).astype(np.float32)
+    _write_cache(NumericOSFPhantom, cache_dir, ndim, maps)
+
+    phantom = osf_phantom(
+        ndim, SUBJECT, shape=SHAPE, B0=1.5, cache_dir=cache_dir, mmap=True
+    )
+    expected = osf_phantom(ndim, SUBJECT, shape=SHAPE, B0=1.5, cache_dir=cache_dir)
+
+    assert isinstance(phantom.maps, np.memmap)
+    assert not isinstance(expected.maps, np.memmap)
+    assert isinstance(phantom.M0, np.memmap)
+    assert list(phantom.properties) == list(expected.properties)
+    for key in expected.properties:
+        npt.assert_allclose(phantom.properties[key], expected.properties[key])
+        npt.assert_allclose(getattr(phantom, key), getattr(expected, key))
+
+    # slice-by-slice access
+    for idx, slice in enumerate(phantom.iter_slices()):
+        for key in expected.properties:
+            npt.assert_allclose(slice[key], expected.properties[key][idx])
+
+
+def test_osf_phantom_mmap_on_access(cache_dir, monkeypatch):
+    """
+    Test that mmap=True OSF phantom only converts the requested property.
+    """
+    maps = np.ones((5, SHAPE, SHAPE), dtype=np.float32)
+    _write_cache(NumericOSFPhantom, cache_dir, 2, maps)
+
+    phantom = osf_phantom(
+        2, SUBJECT, shape=SHAPE, B0=1.5, cache_dir=cache_dir, mmap=True
+    )
+
+    # count T2* conversions
+    calls = []
+    extrapolate_t2star = _classes.extrapolate_t2star
+
+    def _extrapolate_t2star(*args):
+        calls.append(args)
+        return extrapolate_t2star(*args)
+
+    monkeypatch.setattr(_classes, "extrapolate_t2star", _extrapolate_t2star)
+
+    phantom.T1
+    phantom.T2
+    phantom.M0
+    assert len(calls) == 0
+    phantom.T2s
+    assert len(calls) == 1
+
+    with pytest.raises(KeyError):
+        phantom.properties["T3"]
+
+
+@pytest.mark.parametrize("ndim", [2, 3])
+@pytest.mark.parametrize("segtype", ["crisp", "fuzzy", False])
+def test_brainweb_phantom_mmap(cache_dir, ndim, segtype, monkeypatch):
+    """
+    Test that mmap=True BrainWeb phantom matches the in-memory one.
+    """
+    nclasses = len(_classes.tissue_map("single-pool"))
+    rng = np.random.default_rng(42)
+    fuzzy = rng.uniform(size=(nclasses,) + ndim * (SHAPE,)).astype(np.float32)
+    if segtype == "fuzzy":
+        _write_cache(FuzzyBrainwebPhantom, cache_dir, ndim, fuzzy)
+    elif segtype == "crisp":
+        _write_cache(CrispBrainwebPhantom, cache_dir, ndim, np.argmax(fuzzy, axis=0))
+    else:
+        _write_cache(NumericBrainwebPhantom, cache_dir, ndim, np.argmax(fuzzy, axis=0))
+
+    params = {
+        "ndim": ndim,
+        "subject": SUBJECT,
+        "shape": SHAPE,
+        "segtype": segtype,
+        "cache_dir": cache_dir,
+    }
+    expected = brainweb_phantom(**params)
+    if segtype:
+        expected = expected.as_numeric()
+
+    # record shape of converted segmentations
+    shapes = []
+    crisp_to_numeric = _build._crisp_to_numeric
+
+    def _crisp_to_numeric(segmentation, *args):
+        shapes.append(segmentation.shape)
+        return crisp_to_numeric(segmentation, *args)
+
+    with monkeypatch.context() as m:
+        m.setattr(_build, "_crisp_to_numeric", _crisp_to_numeric)
+        phantom = brainweb_phantom(mmap=True, **params)
+        slices = list(phantom.iter_slices())
+
+    # segmentation is kept memory-mapped and converted slice-by-slice
+    assert isinstance(phantom.segmentation, np.memmap)
+    assert phantom.shape[-ndim:] == ndim * (SHAPE,)
+    assert shapes == SHAPE * [(ndim - 1) * (SHAPE,)]
+    for idx, slice in enumerate(slices):
+        for key in expected.properties:
+            npt.assert_allclose(slice[key], expected.properties[key][idx])
+
+    # tissue property maps on access
+    if segtype is False:
+        assert list(phantom.properties) == list(expected.properties)
+        for key in expected.properties:
+            npt.assert_allclose(phantom.properties[key], expected.properties[key])
+        npt.assert_allclose(phantom.T1, expected.T1)
+
+
+def test_osf_phantom_mmap_no_cache(cache_dir, monkeypatch):
+    """
+    Test that mmap=True without caching warns and loads maps in memory.
+    """
+    maps = np.ones((5, SHAPE, SHAPE), dtype=np.float32)
+    monkeypatch.setattr(
+        NumericOSFPhantom, "get_maps", lambda self, fname, *args: (maps, fname)
+    )
+
+    with pytest.warns(UserWarning, match="mmap=True requires cache=True"):
+        phantom = osf_phantom(2, SUBJECT, shape=SHAPE, cache=False, mmap=True)
+    assert not isinstance(phantom.maps, np.memmap)
+
+
+# %% local utils
+def _write_cache(cls, cache_dir, ndim, array):
+    builder = cls.__new__(cls)
+    builder._ndim = ndim
+    shape, output_res = builder._default_prescription(ndim, SHAPE, None)
+    fname = builder.get_filename(ndim, SUBJECT, shape, output_res)
+    np.save(os.path.join(cache_dir, fname), array)
@@ -7,16 +7,17 @@ import tempfile
 import pytest
 
 
+import numpy as np
 import numpy.testing as npt
 
 
-from mrtwin import shepplogan_phantom
+from mrtwin import shepplogan_phantom, shepplogan_kspace
 
 
 @pytest.mark.parametrize("ndim", [2, 3])
 @pytest.mark.parametrize("shape", [128, (128, 128), (128, 128, 128)])
 @pytest.mark.parametrize("model", ["single-pool", "mw-model", "mt-model", "mwmt-model"])
-@pytest.mark.parametrize("segtype", ["crisp", False])
+@pytest.mark.parametrize("segtype", ["fuzzy", "crisp", False])
 def test_shepplogan_phantom(ndim, shape, model, segtype):
     """
     Test the shepplogan_phantom function with various parameter combinations.
@@ -36,3 +37,213 @@ def test_shepplogan_phantom(ndim, shape, model, segtype):
         expected_shape = tuple([shape] * ndim) if isinstance(shape, int) else shape
         actual_shape = phantom.shape[-ndim:] if segtype else phantom.T1.shape[-ndim:]
         npt.assert_allclose(actual_shape, expected_shape)
+
+
+@pytest.mark.parametrize("model", ["single-pool", "mw-model"])
+@pytest.mark.parametrize("segtype", ["crisp", False])
+@pytest.mark.parametrize("axis", [0, -1])
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_shepplogan_iter_slices(model, segtype, axis, prefetch):
+    """
+    Test slice-by-slice iteration matches the dense numeric phantom.
+    """
+    shape = (16, 32, 24)
+    phantom = shepplogan_phantom(ndim=3, shape=shape, model=model, segtype=segtype)
+    reference = shepplogan_phantom(ndim=3, shape=shape, model=model, segtype=False)
+
+    slices = list(phantom.iter_slices(axis=axis, prefetch=prefetch))
+
+    # Validate number of slices
+    assert len(slices) == shape[axis]
+
+    # Validate content
+    for param, value in reference._properties.items():
+        npt.assert_allclose(
+            np.stack([slice[param] for slice in slices], axis=axis), value
+        )
+
+
+@pytest.mark.parametrize("ndim, shape", [(2, (64, 48)), (3, (24, 32, 28))])
+def test_shepplogan_segmentation(ndim, shape):
+    """
+    Test native rasterizer against Phantominator.
+    """
+    mr_shepp_logan = pytest.importorskip("phantominator.mr_shepp_logan")
+    from mrtwin._shepplogan._segmentation import (
+        get_shepp_logan,
+        mr_ellipsoid_parameters,
+    )
+
+    segmentation = get_shepp_logan(ndim, shape)
+
+    # reference
+    E = mr_ellipsoid_parameters()
+    if ndim == 2:
+        _, expected, _ = mr_shepp_logan.mr_shepp_logan([*shape, 5], E=E, zlims=(0, 0.5))
+        expected = expected[..., 0]
+    else:
+        _, expected, _ = mr_shepp_logan.mr_shepp_logan(
+            [shape[1], shape[2], shape[0]], E=E
+        )
+        expected = expected.transpose(-1, 0, 1)
+
+    assert segmentation.dtype == np.uint8
+    npt.assert_array_equal(segmentation, expected.astype(int))
+
+
+@pytest.mark.parametrize("ndim, shape", [(2, (64, 48)), (3, (24, 32, 28))])
+def test_shepplogan_fuzzy(ndim, shape):
+    """
+    Test partial volume segmentation consistency with crisp segmentation.
+    """
+    fuzzy = shepplogan_phantom(ndim=ndim, shape=shape, segtype="fuzzy")
+    crisp = shepplogan_phantom(ndim=ndim, shape=shape, segtype="crisp")
+
+    assert fuzzy.shape == (len(fuzzy._label), *shape)
+    npt.assert_allclose(fuzzy.segmentation.sum(axis=0), 1.0, atol=1e-5)
+
+    # pure voxels match crisp segmentation
+    pure = fuzzy.segmentation.max(axis=0) == 1.0
+    npt.assert_array_equal(
+        fuzzy.as_crisp().segmentation[pure], crisp.segmentation[pure]
+    )
+
+
+@pytest.mark.parametrize("model", ["single-pool", "mw-model", "mt-model", "mwmt-model"])
+def test_shepplogan_numeric_segmentation(model):
+    """
+    Test that numeric phantoms keep the crisp segmentation.
+    """
+    shape = (64, 48)
+    crisp = shepplogan_phantom(ndim=2, shape=shape, model=model, segtype="crisp")
+    numeric = shepplogan_phantom(ndim=2, shape=shape, model=model, segtype=False)
+
+    assert numeric.shape == shape, f"Expected shape {shape}, got {numeric.shape}."
+    assert numeric.segmentation is not None, "Segmentation should be kept."
+    npt.assert_array_equal(numeric.segmentation, crisp.segmentation)
+    assert numeric.T1.shape[-2:] == shape, "Tissue maps should be dense."
+
+
+def test_shepplogan_fuzzy_area():
+    """
+    Test that partial volume segmentation reduces edge aliasing.
+    """
+    n = 64
+    fuzzy = shepplogan_phantom(ndim=2, shape=n, segtype="fuzzy")
+    crisp = shepplogan_phantom(ndim=2, shape=n, segtype="crisp")
+
+    # area of outermost ellipse (in voxels)
+    expected = np.pi * 0.72 * 0.95 / (2 / (n - 1)) ** 2
+    fuzzy_area = (1 - fuzzy.segmentation[0]).sum()
+    crisp_area = (crisp.segmentation > 0).sum()
+
+    assert abs(fuzzy_area - expected) < 0.2 * abs(crisp_area - expected)
+
+
+@pytest.mark.parametrize("ndim, n", [(2, 128), (3, 32)])
+def test_shepplogan_kspace(ndim, n):
+    """
+    Test analytic k-space against DFT of partial volume phantom.
+    """
+    from mrtwin._shepplogan._segmentation import FOV
+
+    phantom = shepplogan_phantom(ndim=ndim, shape=n, segtype="fuzzy")
+    M0 = phantom.properties["M0"]
+    image = np.tensordot(M0 - M0[0], phantom.segmentation, axes=(0, 0))
+
+    # low resolution k-space samples (including k = 0)
+    rng = np.random.default_rng(42)
+    coords = rng.uniform(-15.0, 15.0, size=(ndim, 10))  # [1/m]
+    coords[:, 0] = 0.0
+
+    # separable DFT on phantom grid
+    x = 1e-3 * np.linspace(-0.5 * FOV, 0.5 * FOV, n)  # [m]
+    expected = []
+    for k in coords.T:
+        value = image
+        for ki in k[::-1]:
+            value = value @ np.exp(-2j * np.pi * ki * x)
+        expected.append(value)
+    expected = np.asarray(expected)
+
+    kspace = shepplogan_kspace(coords, output_res=FOV / (n - 1), block_size=4)
+    assert kspace["M0"].shape == (10,)
+    assert kspace["M0"].dtype == np.complex64
+    npt.assert_allclose(kspace["M0"], expected, rtol=0.0, atol=2e-3 * abs(expected[0]))
+
+
+@pytest.mark.parametrize("model", ["single-pool", "mw-model", "mt-model", "mwmt-model"])
+def test_shepplogan_kspace_shape(model):
+    """
+    Test analytic k-space output shape for multi-pool models.
+    """
+    phantom = shepplogan_phantom(ndim=2, shape=16, model=model, segtype="fuzzy")
+    coords = np.random.default_rng(42).uniform(-100.0, 100.0, size=(4, 3, 5))
+
+    kspace = shepplogan_kspace(coords, model=model)
+    blocked = shepplogan_kspace(coords, model=model, block_size=3)
+
+    assert kspace.keys() == phantom.properties.keys()
+    for param, value in phantom.properties.items():
+        assert kspace[param].shape == (*value.shape[:-1], 4, 5)
+        npt.assert_allclose(blocked[param], kspace[param], rtol=1e-6)
+
+
+def test_shepplogan_prescription():
+    """
+    Test phantom evaluation on prescribed anisotropic resolution.
+    """
+    reference = shepplogan_phantom(ndim=3, shape=(32, 64, 48), output_res=2.0)
+    phantom = shepplogan_phantom(ndim=3, shape=(16, 64, 24), output_res=(4.0, 2.0, 4.0))
+
+    # anisotropic voxels centers match subsampled isotropic phantom
+    assert phantom.shape == (16, 64, 24)
+    npt.assert_array_equal(phantom.segmentation, reference.segmentation[::2, :, ::2])
+
+
+@pytest.mark.parametrize("segtype", ["crisp", "fuzzy"])
+def test_shepplogan_offset(segtype):
+    """
+    Test phantom evaluation on shifted FOV.
+    """
+    reference = shepplogan_phantom(
+        ndim=3, shape=(32, 64, 48), output_res=2.0, segtype=segtype
+    )
+    phantom = shepplogan_phantom(
+        ndim=3,
+        shape=(32, 64, 48),
+        output_res=2.0,
+        offset=(4.0, -6.0, 0.0),
+        segtype=segtype,
+    )
+
+    # offset shifts FOV by an integer number of voxels
+    npt.assert_allclose(
+        phantom.segmentation[..., :-2, 3:, :],
+        reference.segmentation[..., 2:, :-3, :],
+        atol=1e-6,
+    )
+
+
+def test_shepplogan_prescription_cache():
+    """
+    Test that prescribed resolution and offset are part of the cache filename.
+    """
+    with tempfile.TemporaryDirectory() as cache_dir:
+        shepplogan_phantom(ndim=2, shape=32, cache=True, cache_dir=cache_dir)
+        shepplogan_phantom(
+            ndim=2, shape=32, output_res=4.0, cache=True, cache_dir=cache_dir
+        )
+        shepplogan_phantom(
+            ndim=2,
+            shape=32,
+            output_res=4.0,
+            offset=(8.0, 0.0),
+            cache=True,
+            cache_dir=cache_dir,
+        )
+        assert sorted(os.listdir(cache_dir)) == [
+            "crispshepploganphantom_32x32mtx.npy",
+            "crispshepploganphantom_4x4res_32x32mtx.npy",
+            "crispshepploganphantom_4x4res_8x0offset_32x32mtx.npy",
+        ]